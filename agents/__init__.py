@@ -17,13 +17,35 @@ Concrete Agents:
 
 Factory:
 - AgentFactory: Factory class for creating agents
+
+Agents are imported lazily on first attribute access, so ``import agents``
+does not load LangGraph, LLM clients or the job scraper. Agents create their
+LLM client on first use.
 """
 
-from agents.base_agents import BaseAgent, BaseAgentState, AgentFactory
-from agents.database_agent import DatabaseAgent
-from agents.job_analysis_agent import JobAnalysisAgent
-from agents.resume_agent import ResumeAgent
-from agents.ranking_agent import RankingAgent
+import importlib
+
+# Map of public names to the modules that define them
+_LAZY_ATTRIBUTES = {
+    "BaseAgent": "agents.base_agents",
+    "BaseAgentState": "agents.base_agents",
+    "AgentFactory": "agents.factory",
+    "DatabaseAgent": "agents.database_agent",
+    "JobAnalysisAgent": "agents.job_analysis_agent",
+    "ResumeAgent": "agents.resume_agent",
+    "RankingAgent": "agents.ranking_agent",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
 
 __all__ = [
     # Base classes
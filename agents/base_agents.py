@@ -2,14 +2,20 @@ import os
 import json
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Callable, List, TypedDict, Annotated, Sequence
+from typing import Dict, Any, Callable, List, TypedDict, Annotated, Sequence, TYPE_CHECKING
 import operator
 from dotenv import load_dotenv
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, AIMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langgraph.graph import StateGraph, END
+from langgraph.constants import END
+
+# Re-exported for backward compatibility; the factory lives in its own light module
+from agents.factory import AgentFactory
+
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langgraph.graph import StateGraph
 
 # Load environment variables
 load_dotenv()
@@ -25,12 +31,21 @@ class BaseAgent(ABC):
     def __init__(self, model_name: str = "gemini-2.0-flash-lite", temperature: float = 0.7):
         self.model_name = model_name
         self.temperature = temperature
-        self.llm = self._create_llm()
+        self._llm = None
         self.graph = None
         self._build_graph()
     
-    def _create_llm(self) -> ChatGoogleGenerativeAI:
+    @property
+    def llm(self) -> "ChatGoogleGenerativeAI":
+        """The LLM client, created on first use."""
+        if self._llm is None:
+            self._llm = self._create_llm()
+        return self._llm
+    
+    def _create_llm(self) -> "ChatGoogleGenerativeAI":
         """Create and configure the LLM."""
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("GOOGLE_API_KEY environment variable is required")
@@ -41,8 +56,10 @@ class BaseAgent(ABC):
             google_api_key=api_key
         )
     
-    def _create_prompt_template(self, system_message: str, human_message: str) -> ChatPromptTemplate:
+    def _create_prompt_template(self, system_message: str, human_message: str) -> "ChatPromptTemplate":
         """Create a chat prompt template."""
+        from langchain_core.prompts import ChatPromptTemplate
+        
         return ChatPromptTemplate.from_messages([
             ("system", system_message),
             ("human", human_message)
@@ -103,6 +120,8 @@ class BaseAgent(ABC):
     
     def _build_graph(self):
         """Build the LangGraph workflow."""
+        from langgraph.graph import StateGraph
+        
         # Create the graph with the appropriate state class
         state_class = self.get_state_class()
         workflow = StateGraph(state_class)
@@ -205,7 +224,7 @@ class BaseAgent(ABC):
         
         return viz
     
-    def get_graph(self) -> StateGraph:
+    def get_graph(self) -> "StateGraph":
         if not self.graph:
             raise ValueError("Graph not built. Call _build_graph() first.")
         
@@ -240,32 +259,3 @@ class BaseAgent(ABC):
             condition_value = state.get(condition_key, False)
             return true_path if condition_value else false_path
         return condition_func
-
-class AgentFactory:
-    """Factory class for creating different types of agents."""
-    
-    @staticmethod
-    def create_agent(agent_type: str, **kwargs) -> BaseAgent:
-        """Create an agent of the specified type."""
-        # Import here to avoid circular imports
-        from agents.resume_agent import ResumeAgent
-        from agents.ranking_agent import RankingAgent
-        from agents.job_analysis_agent import JobAnalysisAgent
-        
-        agent_classes = {
-            "resume": ResumeAgent,
-            "ranking": RankingAgent,
-            "job_analysis": JobAnalysisAgent,
-        }
-        
-        if agent_type not in agent_classes:
-            available_types = ", ".join(agent_classes.keys())
-            raise ValueError(f"Unknown agent type: {agent_type}. Available types: {available_types}")
-        
-        agent_class = agent_classes[agent_type]
-        return agent_class(**kwargs)
-    
-    @staticmethod
-    def list_available_agents() -> List[str]:
-        """List all available agent types."""
-        return ["resume", "ranking", "job_analysis"]
@@ -0,0 +1,113 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Bullet points outside these lengths are either too thin or waste resume space
+MIN_BULLET_LENGTH = 40
+MAX_BULLET_LENGTH = 250
+
+# Two bullet points sharing more than this share of their words count as duplicates
+DUPLICATE_SIMILARITY = 0.6
+
+# Phrases introducing the result (Z) part of an XYZ bullet point
+RESULT_MARKERS = (
+    "which", "resulting in", "leading to", "led to", "achieving", "enabling",
+    "reducing", "improving", "increasing", "cutting", "saving", "so that",
+)
+
+# Words that start a sentence but are not action verbs
+NON_ACTION_STARTS = {"i", "we", "the", "a", "an", "this", "my", "our", "was", "were", "responsible", "worked"}
+
+WEIGHTS = {
+    "count": 0.25,
+    "structure": 0.25,
+    "length": 0.2,
+    "keywords": 0.2,
+    "uniqueness": 0.1,
+}
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9+#.]+", text.lower())
+
+def xyz_structure_score(bullet: str) -> float:
+    """Score how closely a bullet point follows "Accomplished X by doing Y, which led to Z"."""
+    words = _words(bullet)
+    if not words:
+        return 0.0
+    lowered = bullet.lower()
+    score = 0.0
+    if words[0] not in NON_ACTION_STARTS and bullet[0].isupper():
+        score += 0.3
+    if re.search(r"\b(by|using|with|through|via)\b", lowered):
+        score += 0.3
+    if any(re.search(rf"\b{marker}\b", lowered) for marker in RESULT_MARKERS):
+        score += 0.2
+    if re.search(r"\d", bullet):
+        score += 0.2
+    return score
+
+def length_score(bullet: str) -> float:
+    """Return 1.0 for bullet points within the length limits, less the further outside they are."""
+    length = len(bullet)
+    if MIN_BULLET_LENGTH <= length <= MAX_BULLET_LENGTH:
+        return 1.0
+    if length < MIN_BULLET_LENGTH:
+        return length / MIN_BULLET_LENGTH
+    return max(0.0, 1.0 - (length - MAX_BULLET_LENGTH) / MAX_BULLET_LENGTH)
+
+def similarity(first: str, second: str) -> float:
+    """Return the Jaccard similarity of the words of two bullet points."""
+    first_words, second_words = set(_words(first)), set(_words(second))
+    if not first_words or not second_words:
+        return 0.0
+    return len(first_words & second_words) / len(first_words | second_words)
+
+def count_duplicates(bullets: Sequence[str]) -> int:
+    """Count bullet points that repeat an earlier one in the same set."""
+    duplicates = 0
+    for index, bullet in enumerate(bullets):
+        if any(similarity(bullet, earlier) > DUPLICATE_SIMILARITY for earlier in bullets[:index]):
+            duplicates += 1
+    return duplicates
+
+def keyword_coverage(bullets: Sequence[str], keywords: Sequence[str]) -> float:
+    """Return the share of job keywords mentioned anywhere in the bullet points."""
+    if not keywords:
+        return 1.0
+    text = " ".join(bullets).lower()
+    found = sum(
+        1 for keyword in keywords
+        if re.search(rf"(?<![a-z0-9]){re.escape(keyword.lower())}(?![a-z0-9])", text)
+    )
+    # Covering a few skills is enough; a single item never uses every skill in a posting
+    return min(1.0, found / min(len(keywords), 3))
+
+def score_bullet_set(bullets: Sequence[str], num_bullets: int, keywords: Optional[Sequence[str]] = None) -> Tuple[float, Dict[str, Any]]:
+    """Score one candidate set of bullet points between 0 and 1 using deterministic checks."""
+    if not bullets:
+        return 0.0, {"count": 0}
+
+    details = {
+        "count": min(len(bullets), num_bullets) / num_bullets if num_bullets else 1.0,
+        "structure": sum(xyz_structure_score(bullet) for bullet in bullets) / len(bullets),
+        "length": sum(length_score(bullet) for bullet in bullets) / len(bullets),
+        "keywords": keyword_coverage(bullets, keywords or []),
+        "uniqueness": 1.0 - count_duplicates(bullets) / len(bullets),
+    }
+    score = sum(WEIGHTS[name] * value for name, value in details.items())
+    return round(score, 4), details
+
+def select_best_bullets(candidates: Sequence[Sequence[str]], num_bullets: int,
+                        keywords: Optional[Sequence[str]] = None) -> Tuple[List[str], List[float]]:
+    """Return the highest scoring candidate set and the scores of all candidates.
+
+    Duplicate bullet points are dropped from the chosen set. Ties keep the
+    earliest candidate so the result is deterministic.
+    """
+    scores = [score_bullet_set(candidate, num_bullets, keywords)[0] for candidate in candidates]
+    if not scores:
+        return [], []
+
+    best = list(candidates[scores.index(max(scores))])
+    unique = [bullet for index, bullet in enumerate(best)
+              if not any(similarity(bullet, earlier) > DUPLICATE_SIMILARITY for earlier in best[:index])]
+    return unique, scores
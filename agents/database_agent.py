@@ -1,6 +1,7 @@
 from typing import Any
 from agents.base_agents import BaseAgent
 from services.experience import ExperienceService
+from services.project import ProjectService
 from services.user import UserService
 
 class DatabaseAgent(BaseAgent):
@@ -9,6 +10,7 @@ class DatabaseAgent(BaseAgent):
     def __init__(self, model_name: str = "gemini-2.0-flash-lite", temperature: float = 0.7):
         super().__init__(model_name, temperature)
         self._experience_service = None
+        self._project_service = None
         self._user_service = None
     
     def _get_experience_service(self) -> ExperienceService:
@@ -17,6 +19,12 @@ class DatabaseAgent(BaseAgent):
             self._experience_service = ExperienceService()
         return self._experience_service
     
+    def _get_project_service(self) -> ProjectService:
+        """Get or create ProjectService instance."""
+        if self._project_service is None:
+            self._project_service = ProjectService()
+        return self._project_service
+    
     def _get_user_service(self) -> UserService:
         """Get or create UserService instance."""
         if self._user_service is None:
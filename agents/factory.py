@@ -0,0 +1,41 @@
+import importlib
+from typing import Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agents.base_agents import BaseAgent
+
+class AgentFactory:
+    """Factory class for creating different types of agents."""
+    
+    # Agents are registered by import path and only imported when first created
+    _registry: Dict[str, str] = {
+        "resume": "agents.resume_agent:ResumeAgent",
+        "ranking": "agents.ranking_agent:RankingAgent",
+        "job_analysis": "agents.job_analysis_agent:JobAnalysisAgent",
+    }
+    
+    @classmethod
+    def register_agent(cls, agent_type: str, import_path: str):
+        """Register an agent class by its "module:ClassName" import path."""
+        cls._registry[agent_type] = import_path
+    
+    @classmethod
+    def get_agent_class(cls, agent_type: str) -> type:
+        """Import and return the agent class registered for the given type."""
+        if agent_type not in cls._registry:
+            available_types = ", ".join(cls._registry.keys())
+            raise ValueError(f"Unknown agent type: {agent_type}. Available types: {available_types}")
+        
+        module_name, class_name = cls._registry[agent_type].split(":")
+        return getattr(importlib.import_module(module_name), class_name)
+    
+    @classmethod
+    def create_agent(cls, agent_type: str, **kwargs) -> "BaseAgent":
+        """Create an agent of the specified type."""
+        agent_class = cls.get_agent_class(agent_type)
+        return agent_class(**kwargs)
+    
+    @classmethod
+    def list_available_agents(cls) -> List[str]:
+        """List all available agent types."""
+        return list(cls._registry.keys())
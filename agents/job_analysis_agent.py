@@ -1,12 +1,14 @@
 import json
-from typing import Dict, Any, List, Optional, TypedDict, Annotated, Sequence, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterator, List, Optional, TypedDict, Annotated, Sequence, Callable
 import operator
 from langchain_core.messages import HumanMessage, AIMessage
 
 from agents.base_agents import BaseAgent, BaseAgentState
-from experiments.job_scraper import extract_job_info, JobInfo
+from experiments.job_scraper import extract_job_info, extract_job_info_from_content, fetch_job_page_content, JobInfo
 from model.schema import JobPosting, JobPostingDB
-from services.job_posting import JobPostingService
+from services.job_posting import JobPostingService, canonicalize_job_url, compute_content_fingerprint
+import config
 
 class JobAnalysisState(BaseAgentState):
     """State for the Job Analysis Agent."""
@@ -16,12 +18,21 @@ class JobAnalysisState(BaseAgentState):
     job_technical_skills: List[str]
     job_exists_in_db: bool
     existing_job_posting: Optional[JobPostingDB]
+    content_metrics: Dict[str, Any]  # Token savings from section selection
+    content_fingerprint: Optional[str]  # Simhash of the selected page content
+    duplicate_of: Optional[int]  # Id of a near-identical stored posting whose analysis was reused
+    skills_extracted: bool  # True when technical skills came with the job information
+    job_posting: Optional[JobPosting]  # Record to save, built during combined extraction
     error: str
 
 class JobAnalysisAgent(BaseAgent):
     """Agent for analyzing job postings and extracting structured job information."""
     
-    def __init__(self, model_name: str = "gemini-2.0-flash-lite", temperature: float = 0.7):
+    def __init__(self, model_name: str = "gemini-2.0-flash-lite", temperature: float = 0.7, token_budget: Optional[int] = None,
+                 combined_extraction: bool = True):
+        self.token_budget = token_budget or config.JOB_CONTENT_TOKEN_BUDGET
+        # Extract technical skills in the same LLM call as the job information
+        self.combined_extraction = combined_extraction
         super().__init__(model_name, temperature)
     
     def get_state_class(self) -> type:
@@ -62,39 +73,52 @@ class JobAnalysisAgent(BaseAgent):
         job_posting_service = JobPostingService()
         return job_posting_service.get_job_posting_by_url(job_posting_url)
     
-    def _save_job_to_db(self, job_posting: JobPostingDB):
-        """Save a job posting to the database."""
+    def _save_job_to_db(self, job_posting: JobPosting) -> JobPostingDB:
+        """Save a job posting to the database, content fingerprint included."""
         job_posting_service = JobPostingService()
-        job_posting_service.create_job_posting(
-            JobPosting(
-                job_posting_url=job_posting.job_posting_url,
-                company_name=job_posting.company_name,
-                job_title=job_posting.job_title,
-                job_location=job_posting.job_location,
-                job_type=job_posting.job_type,
-                job_description=job_posting.job_description,
-                job_qualifications=job_posting.job_qualifications,
-                job_technical_skills=job_posting.job_technical_skills
-            )
-        )
-        return job_posting
+        return job_posting_service.create_job_posting(job_posting)
     
     def _create_save_job_to_db_node(self):
         """Create node to save a job posting to the database."""
         def save_job_to_db(state: JobAnalysisState) -> JobAnalysisState:
-            return self._save_job_to_db(
-                JobPosting(
-                    job_posting_url=state["job_posting_url"],
-                    company_name=state["job_info"].company_name,
-                    job_title=state["job_info"].job_title,
-                    job_location=state["job_info"].location,
-                    job_type=state["job_info"].job_type,
-                    job_description=state["job_info"].description,
-                    job_qualifications=state["job_info"].qualifications,
-                    job_technical_skills=state["job_technical_skills"]
-                )
+            if state.get("error"):
+                return state  # Pass through error state
+            
+            job_posting = state.get("job_posting") or self._build_job_posting(
+                state["job_posting_url"],
+                state["job_info"],
+                state["job_technical_skills"],
+                state.get("content_fingerprint")
             )
+            self._save_job_to_db(job_posting)
+            return {}
         return save_job_to_db
+    
+    def _build_job_posting(self, job_posting_url: str, job_info: JobInfo, job_technical_skills: List[str],
+                           content_fingerprint: Optional[str] = None) -> JobPosting:
+        """Build a JobPosting record from extracted job information."""
+        return JobPosting(
+            job_posting_url=job_posting_url,
+            company_name=job_info.company_name,
+            job_title=job_info.job_title,
+            job_location=job_info.location,
+            job_type=job_info.job_type,
+            job_description=job_info.description,
+            job_qualifications=job_info.qualifications,
+            job_technical_skills=job_technical_skills,
+            content_fingerprint=content_fingerprint
+        )
+    
+    def _job_posting_to_job_info(self, job_posting: JobPostingDB) -> JobInfo:
+        """Convert a stored job posting back to a JobInfo object."""
+        return JobInfo(
+            company_name=job_posting.company_name,
+            job_title=job_posting.job_title,
+            location=job_posting.job_location,
+            job_type=job_posting.job_type,
+            description=job_posting.job_description,
+            qualifications=job_posting.job_qualifications if job_posting.job_qualifications else []
+        )
 
     
     def _create_job_exists_check_node(self):
@@ -123,14 +147,7 @@ class JobAnalysisAgent(BaseAgent):
             
             if existing_job:
                 # Convert existing job posting to JobInfo object
-                job_info = JobInfo(
-                    company_name=existing_job.company_name,
-                    job_title=existing_job.job_title,
-                    location=existing_job.job_location,
-                    job_type=existing_job.job_type,
-                    description=existing_job.job_description,
-                    qualifications=existing_job.job_qualifications if existing_job.job_qualifications else []
-                )
+                job_info = self._job_posting_to_job_info(existing_job)
                 
                 return {
                     "job_info": job_info,
@@ -151,9 +168,27 @@ class JobAnalysisAgent(BaseAgent):
                 if job_info_dict.get("error"):
                     return {"error": job_info_dict["error"]}
                 
+                content_metrics = job_info_dict.pop("content_metrics", {})
+                content_fingerprint = job_info_dict.pop("content_fingerprint", None)
+                duplicate_of = job_info_dict.pop("duplicate_of", None)
+                job_technical_skills = job_info_dict.pop("job_technical_skills", [])
+                skills_extracted = job_info_dict.pop("skills_extracted", False)
+                
                 # Convert dict to JobInfo object
                 job_info = JobInfo(**job_info_dict)
-                return {"job_info": job_info}
+                result = {
+                    "job_info": job_info,
+                    "job_technical_skills": job_technical_skills,
+                    "content_metrics": content_metrics,
+                    "content_fingerprint": content_fingerprint,
+                    "duplicate_of": duplicate_of,
+                    "skills_extracted": skills_extracted
+                }
+                if skills_extracted:
+                    result["job_posting"] = self._build_job_posting(
+                        job_url, job_info, job_technical_skills, content_fingerprint
+                    )
+                return result
             except Exception as e:
                 return {"error": f"Failed to extract job information: {str(e)}"}
         return job_extraction
@@ -164,6 +199,9 @@ class JobAnalysisAgent(BaseAgent):
             if state.get("error"):
                 return state  # Pass through error state
             
+            if state.get("skills_extracted"):
+                return {}
+            
             # If skills were already loaded from database, skip extraction
             if state.get("job_technical_skills") and len(state["job_technical_skills"]) > 0:
                 print("Using existing technical skills from database")
@@ -182,9 +220,39 @@ class JobAnalysisAgent(BaseAgent):
         return extract_technical_skills
     
     def _extract_job_information(self, job_url: str) -> Dict[str, Any]:
-        """Extract job information from a job posting URL."""
+        """Extract job information from a job posting URL.
+        
+        If the page content is near-identical to a stored posting (same job under
+        another URL), the stored analysis is reused instead of calling the LLM.
+        """
         try:
-            return extract_job_info(job_url)
+            content, content_metrics = fetch_job_page_content(job_url, token_budget=self.token_budget)
+            content_fingerprint = compute_content_fingerprint(content)
+            
+            duplicate = JobPostingService().find_near_duplicate(content_fingerprint)
+            if duplicate:
+                print(f"Reusing analysis of near-identical job posting {duplicate.id}")
+                return {
+                    **self._job_posting_to_job_info(duplicate).model_dump(),
+                    "job_technical_skills": duplicate.job_technical_skills if duplicate.job_technical_skills else [],
+                    "content_metrics": content_metrics,
+                    "content_fingerprint": content_fingerprint,
+                    "duplicate_of": duplicate.id,
+                    "skills_extracted": True
+                }
+            
+            job_info = extract_job_info_from_content(content, include_technical_skills=self.combined_extraction)
+            if not job_info:
+                return {"error": "Failed to extract job information"}
+            
+            result = {**job_info, "content_metrics": content_metrics, "content_fingerprint": content_fingerprint}
+            if self.combined_extraction:
+                technical_skills = result.pop("technical_skills", None) or []
+                result["job_technical_skills"] = [
+                    skill.strip() for skill in technical_skills if isinstance(skill, str) and skill.strip()
+                ]
+                result["skills_extracted"] = True
+            return result
         except Exception as e:
             print(f"Error extracting job info: {e}")
             # Return early exit structure that matches extract_job_info behavior
@@ -278,12 +346,119 @@ Qualifications: {qualifications}"""
             "job_technical_skills": [],
             "job_exists_in_db": False,
             "existing_job_posting": None,
+            "content_metrics": {},
+            "content_fingerprint": None,
+            "duplicate_of": None,
+            "skills_extracted": False,
+            "job_posting": None,
             "error": ""
         }
         
         result = self.run(initial_state)
         return result
     
+    def _analyze_new_job(self, job_posting_url: str) -> Dict[str, Any]:
+        """Scrape a job posting and extract its information and technical skills without saving it."""
+        result = {
+            "job_posting_url": job_posting_url,
+            "job_info": None,
+            "job_technical_skills": [],
+            "job_exists_in_db": False,
+            "content_metrics": {},
+            "content_fingerprint": None,
+            "duplicate_of": None,
+            "error": ""
+        }
+        
+        job_info_dict = self._extract_job_information(job_posting_url)
+        if not job_info_dict:
+            return {**result, "error": "Failed to extract job information"}
+        if job_info_dict.get("error"):
+            return {**result, "error": job_info_dict["error"]}
+        
+        try:
+            result["content_metrics"] = job_info_dict.pop("content_metrics", {})
+            result["content_fingerprint"] = job_info_dict.pop("content_fingerprint", None)
+            result["duplicate_of"] = job_info_dict.pop("duplicate_of", None)
+            job_technical_skills = job_info_dict.pop("job_technical_skills", [])
+            skills_extracted = job_info_dict.pop("skills_extracted", False)
+            result["job_info"] = JobInfo(**job_info_dict)
+            if skills_extracted:
+                result["job_technical_skills"] = job_technical_skills
+            else:
+                result["job_technical_skills"] = self._extract_technical_skills(job_info_dict)
+        except Exception as e:
+            result["error"] = f"Failed to extract job information: {str(e)}"
+        return result
+    
+    def analyze_jobs(self, job_posting_urls: List[str], max_concurrency: int = 4, batch_size: int = 10) -> Iterator[Dict[str, Any]]:
+        """Analyze many job postings, yielding one result per unique URL as soon as it is ready.
+        
+        URLs already stored are loaded with a single query. The remaining postings are
+        scraped and analyzed by at most ``max_concurrency`` workers, and new postings are
+        saved to the database in batches of ``batch_size``.
+        """
+        # Deduplicate on the canonical URL while keeping the input order
+        unique_urls = {}
+        for url in job_posting_urls:
+            if url and url.strip():
+                unique_urls.setdefault(canonicalize_job_url(url), url.strip())
+        if not unique_urls:
+            return
+        
+        job_posting_service = JobPostingService()
+        existing_jobs = {}
+        for job_posting in job_posting_service.get_job_postings_by_urls(list(unique_urls.values())):
+            existing_jobs[job_posting.canonical_url or canonicalize_job_url(job_posting.job_posting_url)] = job_posting
+        
+        for canonical_url, url in unique_urls.items():
+            existing_job = existing_jobs.get(canonical_url)
+            if existing_job:
+                yield {
+                    "job_posting_url": url,
+                    "job_info": self._job_posting_to_job_info(existing_job),
+                    "job_technical_skills": existing_job.job_technical_skills if existing_job.job_technical_skills else [],
+                    "job_exists_in_db": True,
+                    "content_metrics": {},
+                    "content_fingerprint": existing_job.content_fingerprint,
+                    "duplicate_of": None,
+                    "error": ""
+                }
+        
+        new_urls = [url for canonical_url, url in unique_urls.items() if canonical_url not in existing_jobs]
+        if not new_urls:
+            return
+        
+        pending_postings = []
+        executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+        try:
+            futures = {executor.submit(self._analyze_new_job, url): url for url in new_urls}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"job_posting_url": futures[future], "error": f"Job analysis failed: {str(e)}"}
+                
+                if not result.get("error"):
+                    pending_postings.append(
+                        self._build_job_posting(
+                            result["job_posting_url"],
+                            result["job_info"],
+                            result["job_technical_skills"],
+                            result["content_fingerprint"]
+                        )
+                    )
+                    if len(pending_postings) >= batch_size:
+                        job_posting_service.create_job_postings(pending_postings)
+                        pending_postings = []
+                
+                yield result
+        finally:
+            # Runs even if the caller stops consuming results early
+            executor.shutdown(wait=True, cancel_futures=True)
+            if pending_postings:
+                job_posting_service.create_job_postings(pending_postings)
+    
     def get_job_analysis_summary(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Extract a summary of the job analysis results."""
         if result.get("error"):
@@ -306,6 +481,7 @@ Qualifications: {qualifications}"""
             "job_type": job_info_dict.get("job_type", "Unknown"),
             "technical_skills_extracted": result.get("job_technical_skills", []),
             "total_qualifications": len(job_info_dict.get("qualifications", [])),
+            "content_metrics": result.get("content_metrics", {}),
             "job_info_object": result.get("job_info")  # Return the JobInfo object for use by other agents
         }
         
@@ -0,0 +1,125 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from experiments.job_scraper import JobInfo
+
+# Ranking stages in the order their results are streamed: (item type, RankingAgent method)
+RANKING_STAGES = [
+    ("experience", "rank_experiences"),
+    ("project", "rank_projects"),
+]
+
+def stream_rankings(ranking_agent, job_info: JobInfo, user_id: int,
+                    job_technical_skills: Optional[List[str]] = None,
+                    profile: Optional[Any] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Rank experiences, then projects, in a background thread.
+
+    Yields ``(item_type, ranking_result)`` as soon as each stage finishes, so the
+    caller can start generating bullet points for the top experiences while the
+    projects are still being ranked. Stage errors are reported in the result's
+    ``error`` field instead of stopping the stream. A ``profile`` snapshot is
+    passed to every stage so the user's items are only loaded once.
+    """
+    results: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue()
+
+    def run_stages():
+        skills = job_technical_skills
+        try:
+            for item_type, method_name in RANKING_STAGES:
+                options = {"job_technical_skills": skills}
+                if profile is not None:
+                    options["profile"] = profile
+                try:
+                    result = getattr(ranking_agent, method_name)(job_info, user_id, **options)
+                except Exception as e:
+                    result = {"error": f"Failed to rank {item_type}s: {str(e)}"}
+                # Skills extracted by the first stage are reused by the next one
+                skills = skills or result.get("job_technical_skills")
+                results.put((item_type, result))
+        finally:
+            results.put(None)
+
+    thread = threading.Thread(target=run_stages, name="ranking-stream", daemon=True)
+    thread.start()
+    while True:
+        entry = results.get()
+        if entry is None:
+            break
+        yield entry
+    thread.join()
+
+def generate_ranked_bullets(ranking_agent, resume_agent, job_info: JobInfo, user_id: int,
+                            selection_limits: Dict[str, int],
+                            job_technical_skills: Optional[List[str]] = None,
+                            profile: Optional[Any] = None,
+                            item_map: Optional[Dict[str, Any]] = None,
+                            fresh_variant: bool = False,
+                            batch: bool = True,
+                            max_concurrency: int = 4,
+                            on_ranked: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                            on_item_complete: Optional[Callable[[int, Dict[str, Any], Dict[str, Any]], None]] = None
+                            ) -> Tuple[Dict[str, List[Tuple[int, str]]], Dict[str, List[Dict[str, Any]]]]:
+    """Rank the user's items and generate bullet points for the top ``selection_limits`` of each type.
+
+    With ``batch`` the selected items of every stage are collected and sent in one
+    batch request once ranking finishes. Otherwise each stage's items are generated
+    concurrently, one request per item, as soon as that stage is ranked, so
+    experiences are written while projects are still being ranked. ``on_ranked`` is
+    called with each stage's ranking result, errors included, and
+    ``on_item_complete(index, item, result)`` as each item's bullet points are ready,
+    in both modes.
+
+    Returns the ranked ``(item_id, reason)`` lists and the bullet point results in
+    ranking order, both keyed by item type.
+    """
+    ranked_items: Dict[str, List[Tuple[int, str]]] = {item_type: [] for item_type, _ in RANKING_STAGES}
+    bullet_results: Dict[str, List[Dict[str, Any]]] = {item_type: [] for item_type, _ in RANKING_STAGES}
+    selections: Dict[str, List[Dict[str, Any]]] = {}
+    futures = {}
+    skills = job_technical_skills
+
+    with ThreadPoolExecutor(max_workers=len(RANKING_STAGES)) as executor:
+        for item_type, result in stream_rankings(ranking_agent, job_info, user_id, job_technical_skills, profile=profile):
+            if on_ranked:
+                on_ranked(item_type, result)
+            if result.get("error"):
+                continue
+            ranked_items[item_type] = result.get(f"ranked_{item_type}s", [])
+            skills = skills or result.get("job_technical_skills")
+            items = [
+                {"id": item_id, "type": item_type, "ranking_reason": reason}
+                for item_id, reason in ranked_items[item_type][:selection_limits.get(item_type, 0)]
+            ]
+            if not items:
+                continue
+            if batch:
+                selections[item_type] = items
+            else:
+                futures[item_type] = executor.submit(
+                    resume_agent.generate_bullet_points_concurrently,
+                    items,
+                    job_info=job_info,
+                    max_concurrency=max_concurrency,
+                    fresh_variant=fresh_variant,
+                    job_technical_skills=skills,
+                    item_map=item_map,
+                    on_item_complete=on_item_complete
+                )
+
+    for item_type, future in futures.items():
+        bullet_results[item_type] = future.result()
+    if selections:
+        # One request covers every selected experience and project, sharing the job context
+        batch_results = resume_agent.generate_bullet_points_batch(
+            [item for items in selections.values() for item in items],
+            job_info=job_info,
+            fresh_variant=fresh_variant,
+            job_technical_skills=skills,
+            item_map=item_map,
+            on_item_complete=on_item_complete
+        )
+        for item_type, items in selections.items():
+            bullet_results[item_type] = [batch_results[f"{item_type}_{item['id']}"] for item in items]
+    return ranked_items, bullet_results
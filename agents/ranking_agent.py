@@ -1,5 +1,5 @@
 import json
-from typing import TypedDict, Annotated, Sequence, Dict, Any, Callable, List, Tuple
+from typing import TypedDict, Annotated, Sequence, Dict, Any, Callable, List, Optional, Tuple
 import operator
 from langchain_core.messages import HumanMessage, AIMessage
 
@@ -12,7 +12,10 @@ class RankingAgentState(BaseAgentState):
     messages: Annotated[Sequence[HumanMessage | AIMessage], operator.add]
     job_info: JobInfo
     job_technical_skills: List[str]
+    job_posting_id: Optional[int]  # Stored JobPostingDB to read technical skills from
+    has_job_skills: bool  # True when skills were supplied or stored, so extraction is skipped
     user_id: int
+    profile: Optional[Any]  # UserService.get_user_profile snapshot; queried when not given
     experience_list: List[Any]  # List of ExperienceDB objects
     project_list: List[Any]  # List of ProjectDB objects
     experience_skills_analysis: Dict[str, Any]
@@ -34,6 +37,7 @@ class RankingAgent(DatabaseAgent):
     def create_nodes(self) -> Dict[str, Callable]:
         """Create all nodes for the ranking agent."""
         return {
+            "load_job_skills": self._create_job_skills_loading_node(),
             "extract_skills": self._create_technical_skills_extraction_node(),
             "query_data": self._create_data_query_node(),
             "analyze_skills": self._create_skills_analysis_node(),
@@ -43,6 +47,10 @@ class RankingAgent(DatabaseAgent):
     def define_edges(self) -> List[tuple]:
         """Define the edges between nodes."""
         return [
+            # Skip the LLM skills extraction when skills were supplied or stored
+            ("load_job_skills",
+             self._create_binary_condition_func("has_job_skills", "query_data", "extract_skills"),
+             {"query_data": "query_data", "extract_skills": "extract_skills"}),
             ("extract_skills", "query_data"),
             ("query_data", "analyze_skills"),
             ("analyze_skills", "rank_items")
@@ -50,7 +58,7 @@ class RankingAgent(DatabaseAgent):
     
     def get_entry_point(self) -> str:
         """Return the entry point node name."""
-        return "extract_skills"
+        return "load_job_skills"
     
     def query_all_user_experiences(self, user_id: int) -> List[Any]:
         """Query all experiences for a specific user from the database."""
@@ -74,6 +82,27 @@ class RankingAgent(DatabaseAgent):
             print(f"Error querying user projects: {e}")
             return []
     
+    def _create_job_skills_loading_node(self):
+        """Create node to reuse job technical skills that were supplied or stored with the job posting."""
+        def load_job_skills(state: RankingAgentState) -> RankingAgentState:
+            if state.get("job_technical_skills"):
+                return {"has_job_skills": True}
+            
+            job_posting_id = state.get("job_posting_id")
+            if job_posting_id is not None:
+                try:
+                    from services.job_posting import JobPostingService
+                    job_posting = JobPostingService().get_job_posting(job_posting_id)
+                    if job_posting and job_posting.job_technical_skills:
+                        print("Using existing technical skills from database")
+                        return {"job_technical_skills": job_posting.job_technical_skills, "has_job_skills": True}
+                except Exception as e:
+                    print(f"Error loading job technical skills: {e}")
+            
+            return {"has_job_skills": False}
+        
+        return load_job_skills
+    
     def _create_technical_skills_extraction_node(self):
         """Create node to extract technical skills from job posting."""
         def extract_technical_skills(state: RankingAgentState) -> RankingAgentState:
@@ -175,15 +204,22 @@ Qualifications: {qualifications}"""
             try:
                 user_id = state["user_id"]
                 ranking_type = state.get("ranking_type", "experiences")
+                profile = state.get("profile")
                 
                 result = {}
                 
                 if ranking_type in ["experiences", "both"]:
-                    experiences = self.query_all_user_experiences(user_id)
+                    if profile is not None:
+                        experiences = list(profile.experiences)
+                    else:
+                        experiences = self.query_all_user_experiences(user_id)
                     result["experience_list"] = experiences
                 
                 if ranking_type in ["projects", "both"]:
-                    projects = self.query_all_user_projects(user_id)
+                    if profile is not None:
+                        projects = list(profile.projects)
+                    else:
+                        projects = self.query_all_user_projects(user_id)
                     result["project_list"] = projects
                 
                 return result
@@ -735,63 +771,61 @@ Focus on technical execution, problem-solving approach, and relevance to the tar
             
             return fallback_ranking
     
-    def rank_experiences(self, job_info: JobInfo, user_id: int) -> Dict[str, Any]:
-        """Main method to rank user experiences based on a job posting."""
-        initial_state = {
+    def _create_initial_state(self, job_info: JobInfo, user_id: int, ranking_type: str,
+                              job_technical_skills: Optional[List[str]] = None,
+                              job_posting_id: Optional[int] = None, profile: Optional[Any] = None) -> Dict[str, Any]:
+        """Create the initial graph state for a ranking run."""
+        return {
             "messages": [],
             "job_info": job_info,
-            "job_technical_skills": [],
+            "job_technical_skills": job_technical_skills or [],
+            "job_posting_id": job_posting_id,
+            "has_job_skills": False,
             "user_id": user_id,
+            "profile": profile,
             "experience_list": [],
             "project_list": [],
             "experience_skills_analysis": {},
             "project_skills_analysis": {},
             "ranked_experiences": [],
             "ranked_projects": [],
-            "ranking_type": "experiences",
+            "ranking_type": ranking_type,
             "error": ""
         }
-        
+    
+    def rank_experiences(self, job_info: JobInfo, user_id: int, job_technical_skills: Optional[List[str]] = None,
+                         job_posting_id: Optional[int] = None, profile: Optional[Any] = None) -> Dict[str, Any]:
+        """Main method to rank user experiences based on a job posting.
+        
+        Pass ``job_technical_skills`` or the ``job_posting_id`` of a stored posting to
+        reuse skills extracted by JobAnalysisAgent instead of extracting them again.
+        Pass a ``profile`` from UserService.get_user_profile to rank without querying.
+        """
+        initial_state = self._create_initial_state(job_info, user_id, "experiences", job_technical_skills, job_posting_id, profile)
         result = self.run(initial_state)
         return result
     
-    def rank_projects(self, job_info: JobInfo, user_id: int) -> Dict[str, Any]:
-        """Main method to rank user projects based on a job posting."""
-        initial_state = {
-            "messages": [],
-            "job_info": job_info,
-            "job_technical_skills": [],
-            "user_id": user_id,
-            "experience_list": [],
-            "project_list": [],
-            "experience_skills_analysis": {},
-            "project_skills_analysis": {},
-            "ranked_experiences": [],
-            "ranked_projects": [],
-            "ranking_type": "projects",
-            "error": ""
-        }
-        
+    def rank_projects(self, job_info: JobInfo, user_id: int, job_technical_skills: Optional[List[str]] = None,
+                      job_posting_id: Optional[int] = None, profile: Optional[Any] = None) -> Dict[str, Any]:
+        """Main method to rank user projects based on a job posting.
+        
+        Pass ``job_technical_skills`` or the ``job_posting_id`` of a stored posting to
+        reuse skills extracted by JobAnalysisAgent instead of extracting them again.
+        Pass a ``profile`` from UserService.get_user_profile to rank without querying.
+        """
+        initial_state = self._create_initial_state(job_info, user_id, "projects", job_technical_skills, job_posting_id, profile)
         result = self.run(initial_state)
         return result
     
-    def rank_both(self, job_info: JobInfo, user_id: int) -> Dict[str, Any]:
-        """Main method to rank both user experiences and projects based on a job posting."""
-        initial_state = {
-            "messages": [],
-            "job_info": job_info,
-            "job_technical_skills": [],
-            "user_id": user_id,
-            "experience_list": [],
-            "project_list": [],
-            "experience_skills_analysis": {},
-            "project_skills_analysis": {},
-            "ranked_experiences": [],
-            "ranked_projects": [],
-            "ranking_type": "both",
-            "error": ""
-        }
-        
+    def rank_both(self, job_info: JobInfo, user_id: int, job_technical_skills: Optional[List[str]] = None,
+                  job_posting_id: Optional[int] = None, profile: Optional[Any] = None) -> Dict[str, Any]:
+        """Main method to rank both user experiences and projects based on a job posting.
+        
+        Pass ``job_technical_skills`` or the ``job_posting_id`` of a stored posting to
+        reuse skills extracted by JobAnalysisAgent instead of extracting them again.
+        Pass a ``profile`` from UserService.get_user_profile to rank without querying.
+        """
+        initial_state = self._create_initial_state(job_info, user_id, "both", job_technical_skills, job_posting_id, profile)
         result = self.run(initial_state)
         return result
     
@@ -858,8 +892,8 @@ Focus on technical execution, problem-solving approach, and relevance to the tar
             if not job_info:
                 return {"error": "Failed to extract job information"}
             
-            # Use the new method with JobInfo
-            return self.rank_experiences(job_info, user_id)
+            # Use the new method with JobInfo, reusing the skills extracted by the job analysis
+            return self.rank_experiences(job_info, user_id, job_technical_skills=analysis_result.get("job_technical_skills"))
             
         except Exception as e:
             return {"error": f"Failed to process job URL: {str(e)}"}
@@ -881,8 +915,8 @@ Focus on technical execution, problem-solving approach, and relevance to the tar
             if not job_info:
                 return {"error": "Failed to extract job information"}
             
-            # Use the new method with JobInfo
-            return self.rank_projects(job_info, user_id)
+            # Use the new method with JobInfo, reusing the skills extracted by the job analysis
+            return self.rank_projects(job_info, user_id, job_technical_skills=analysis_result.get("job_technical_skills"))
             
         except Exception as e:
             return {"error": f"Failed to process job URL: {str(e)}"}
@@ -904,8 +938,8 @@ Focus on technical execution, problem-solving approach, and relevance to the tar
             if not job_info:
                 return {"error": "Failed to extract job information"}
             
-            # Use the new method with JobInfo
-            return self.rank_both(job_info, user_id)
+            # Use the new method with JobInfo, reusing the skills extracted by the job analysis
+            return self.rank_both(job_info, user_id, job_technical_skills=analysis_result.get("job_technical_skills"))
             
         except Exception as e:
             return {"error": f"Failed to process job URL: {str(e)}"} 
\ No newline at end of file
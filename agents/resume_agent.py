@@ -1,12 +1,29 @@
+import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TypedDict, Annotated, Sequence, Dict, Any, Callable, List, Optional
 import operator
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.output_parsers import StrOutputParser
 
+from langgraph.constants import END
+
 from agents.base_agents import BaseAgentState
+from agents.bullet_scoring import select_best_bullets
 from agents.database_agent import DatabaseAgent
 from experiments.job_scraper import JobInfo
+from services.bullet_cache import BulletCacheService, make_bullet_cache_key
+from services.item_map import item_key, load_item_map
+import config
+
+# Number of bullet points generated per item type unless an item asks for a different count
+DEFAULT_BULLET_COUNTS = {"experience": 3, "project": 2}
+
+# Part of every bullet cache key; bump it whenever a bullet point prompt changes
+BULLET_PROMPT_VERSION = "2"
+
+# Separates alternative candidate sets in single-item responses
+CANDIDATE_SEPARATOR = "---"
 
 class ResumeAgentState(BaseAgentState):
     """State for the Resume Agent."""
@@ -17,11 +34,22 @@ class ResumeAgentState(BaseAgentState):
     ranking_reason: Optional[str]  # Reason from ranking agent
     job_info: Optional[JobInfo]  # Job information for context
     bullet_points: List[str]
+    fresh_variant: bool  # Generate a new variant even if bullet points are cached
+    job_technical_skills: Optional[List[str]]  # Keywords used to score candidate bullet points
+    item_map: Optional[Dict[str, Any]]  # Experiences/projects already loaded for this request
+    candidate_scores: List[float]
+    cache_key: str
+    from_cache: bool
 
 class ResumeAgent(DatabaseAgent):
     """Agent for generating resume bullet points from experience or project data."""
     
-    def __init__(self, model_name: str = "gemini-2.0-flash-lite", temperature: float = 1.0):
+    def __init__(self, model_name: str = "gemini-2.0-flash-lite", temperature: float = 1.0, use_cache: bool = True,
+                 candidate_count: Optional[int] = None):
+        # Number of alternative bullet point sets requested per item; the best one is kept
+        self.candidate_count = max(1, candidate_count or config.BULLET_CANDIDATE_COUNT)
+        # Reuse bullet points generated earlier for the same item, job and ranking reason
+        self.use_cache = use_cache
         super().__init__(model_name, temperature)
     
     def get_state_class(self) -> type:
@@ -32,24 +60,31 @@ class ResumeAgent(DatabaseAgent):
         """Create all nodes for the resume agent."""
         return {
             "query_data": self._create_data_query_node(),
-            "generate_bullet_points": self._create_bullet_point_generator()
+            "load_cached_bullets": self._create_cache_loading_node(),
+            "generate_bullet_points": self._create_bullet_point_generator(),
+            "cache_bullet_points": self._create_cache_saving_node()
         }
     
     def define_edges(self) -> List[tuple]:
         """Define the edges between nodes."""
         return [
-            ("query_data", "generate_bullet_points")
+            ("query_data", "load_cached_bullets"),
+            ("load_cached_bullets",
+             self._create_binary_condition_func("from_cache", END, "generate_bullet_points"),
+             {END: END, "generate_bullet_points": "generate_bullet_points"}),
+            ("generate_bullet_points", "cache_bullet_points")
         ]
     
     def get_entry_point(self) -> str:
         """Return the entry point node name."""
         return "query_data"
     
-    def query_experience_from_db(self, experience_id: int) -> str:
-        """Query experience details from the database using ExperienceService."""
+    def query_experience_from_db(self, experience_id: int, item_map: Optional[Dict[str, Any]] = None) -> str:
+        """Format experience details, taken from the item map or queried using ExperienceService."""
         try:
-            experience_service = self._get_experience_service()
-            experience = experience_service.get_experience(experience_id)
+            experience = (item_map or {}).get(item_key("experience", experience_id))
+            if experience is None:
+                experience = self._get_experience_service().get_experience(experience_id)
             
             if experience:
                 # Format the experience data into a comprehensive description
@@ -66,13 +101,12 @@ class ResumeAgent(DatabaseAgent):
         except Exception as e:
             return f"Error querying experience: {str(e)}"
     
-    def query_project_from_db(self, project_id: int) -> str:
-        """Query project details from the database using ProjectService."""
+    def query_project_from_db(self, project_id: int, item_map: Optional[Dict[str, Any]] = None) -> str:
+        """Format project details, taken from the item map or queried using ProjectService."""
         try:
-            # Import here to avoid circular imports
-            from services.project import ProjectService
-            project_service = ProjectService()
-            project = project_service.get_project(project_id)
+            project = (item_map or {}).get(item_key("project", project_id))
+            if project is None:
+                project = self._get_project_service().get_project(project_id)
             
             if project:
                 # Format the project data into a comprehensive description
@@ -93,18 +127,76 @@ class ResumeAgent(DatabaseAgent):
         def data_query(state: ResumeAgentState) -> ResumeAgentState:
             item_id = state.get("item_id", 1)
             item_type = state.get("item_type", "experience")
+            item_map = state.get("item_map")
             
             if item_type == "experience":
-                item_data = self.query_experience_from_db(item_id)
+                item_data = self.query_experience_from_db(item_id, item_map)
             elif item_type == "project":
-                item_data = self.query_project_from_db(item_id)
+                item_data = self.query_project_from_db(item_id, item_map)
             else:
                 item_data = f"Unknown item type: {item_type}"
             
             return {"item_data": item_data}
         return data_query
     
-    def _parse_bullet_points(self, text: str) -> List[str]:
+    def _get_cache_key(self, item_data: str, job_info: Optional[JobInfo], ranking_reason: Optional[str],
+                       num_bullets: int, mode: str = "single") -> str:
+        """Return the bullet cache key for an item tailored to a job, generated ``num_bullets`` at a time by ``mode``."""
+        return make_bullet_cache_key(
+            item_data, self._format_job_context(job_info), ranking_reason, BULLET_PROMPT_VERSION,
+            num_bullets=num_bullets, candidate_count=self.candidate_count, mode=mode
+        )
+    
+    def _create_cache_loading_node(self):
+        """Create the node that returns cached bullet points when available."""
+        def load_cached_bullets(state: ResumeAgentState) -> ResumeAgentState:
+            cache_key = self._get_cache_key(
+                state["item_data"], state.get("job_info"), state.get("ranking_reason"),
+                DEFAULT_BULLET_COUNTS.get(state.get("item_type", "experience"), 3)
+            )
+            if not self.use_cache or state.get("fresh_variant"):
+                return {"cache_key": cache_key, "from_cache": False}
+            
+            try:
+                cached = BulletCacheService().get_bullets(cache_key)
+            except Exception as e:
+                print(f"Error reading bullet cache: {e}")
+                cached = None
+            
+            if cached and cached.bullet_points:
+                return {"cache_key": cache_key, "from_cache": True, "bullet_points": list(cached.bullet_points)}
+            return {"cache_key": cache_key, "from_cache": False}
+        return load_cached_bullets
+    
+    def _create_cache_saving_node(self):
+        """Create the node that stores generated bullet points in the next free variant slot."""
+        def cache_bullet_points(state: ResumeAgentState) -> ResumeAgentState:
+            if self.use_cache and state.get("bullet_points"):
+                self._save_to_cache(state["cache_key"], state["bullet_points"], state.get("item_type", "experience"))
+            return {}
+        return cache_bullet_points
+    
+    def _save_to_cache(self, cache_key: str, bullet_points: List[str], item_type: str):
+        """Store bullet points as a new variant of a cache key."""
+        try:
+            BulletCacheService().add_variant(cache_key, bullet_points, item_type)
+        except Exception as e:
+            print(f"Error saving to bullet cache: {e}")
+    
+    def _format_job_context(self, job_info: Optional[JobInfo]) -> str:
+        """Format the job posting details shared by every bullet point prompt."""
+        if not job_info:
+            return ""
+        job_context = f"\n\nJob Context:\n"
+        job_context += f"Position: {job_info.job_title} at {job_info.company_name}\n"
+        job_context += f"Location: {job_info.location}\n"
+        job_context += f"Job Type: {job_info.job_type}\n"
+        job_context += f"Description: {job_info.description[:500]}...\n"  # Truncate to avoid token limits
+        job_context += f"Key Qualifications: {'; '.join(job_info.qualifications[:5])}\n"  # First 5 qualifications
+        job_context += "Tailor the bullet points to highlight relevant skills and experiences that match this job posting and the ranking context."
+        return job_context
+    
+    def _parse_bullet_points(self, text: str, max_points: int = 3) -> List[str]:
         """Parse bullet points from the LLM output, handling various formats."""
         # Remove any introductory text
         lines = text.split('\n')
@@ -124,8 +216,8 @@ class ResumeAgent(DatabaseAgent):
                 cleaned_line = re.sub(r'\*\*(.*?)\*\*', r'\1', cleaned_line)
                 bullet_points.append(cleaned_line)
         
-        # Return exactly 3 bullet points
-        return bullet_points[:3] if len(bullet_points) >= 3 else bullet_points
+        # Return at most max_points bullet points
+        return bullet_points[:max_points]
     
     def _create_bullet_point_generator(self):
         """Create the bullet point generation node."""
@@ -153,15 +245,7 @@ class ResumeAgent(DatabaseAgent):
                 """
 
             # Add job context if provided
-            job_context = ""
-            if job_info:
-                job_context = f"\n\nJob Context:\n"
-                job_context += f"Position: {job_info.job_title} at {job_info.company_name}\n"
-                job_context += f"Location: {job_info.location}\n"
-                job_context += f"Job Type: {job_info.job_type}\n"
-                job_context += f"Description: {job_info.description[:500]}...\n"  # Truncate to avoid token limits
-                job_context += f"Key Qualifications: {'; '.join(job_info.qualifications[:5])}\n"  # First 5 qualifications
-                job_context += "Tailor the bullet points to highlight relevant skills and experiences that match this job posting and the ranking context."
+            job_context = self._format_job_context(job_info)
             
             prompt_input = {
                 "item_data": item_data,
@@ -170,9 +254,19 @@ class ResumeAgent(DatabaseAgent):
                 "job_context": job_context
             }
             
+            prompt_input["candidate_instructions"] = self._format_candidate_instructions(item_type)
+            
             chain = context_prompt | self.llm | StrOutputParser()
             bullet_points_text = chain.invoke(prompt_input)
-            bullet_points_list = self._parse_bullet_points(bullet_points_text)
+            candidates = [
+                self._parse_bullet_points(candidate_text)
+                for candidate_text in re.split(rf"^\s*{CANDIDATE_SEPARATOR}\s*$", bullet_points_text, flags=re.MULTILINE)
+            ]
+            bullet_points_list, candidate_scores = select_best_bullets(
+                [candidate for candidate in candidates if candidate],
+                DEFAULT_BULLET_COUNTS.get(item_type, 3),
+                self._get_job_keywords(job_info, state.get("job_technical_skills"))
+            )
             
             # # Ensure we have exactly 3 bullet points
             # if len(bullet_points_list) < 3:
@@ -182,7 +276,7 @@ class ResumeAgent(DatabaseAgent):
             #             bullet_points_list.append(f"Developed innovative solution by applying technical expertise, which demonstrated problem-solving capabilities")
             #         else:
             #             bullet_points_list.append(f"Contributed to team success by applying technical skills, which enhanced project outcomes")
-            return {"bullet_points": bullet_points_list[:3]}
+            return {"bullet_points": bullet_points_list[:3], "candidate_scores": candidate_scores}
         
         return generate_bullet_points
     
@@ -212,7 +306,7 @@ Example format:
 Led a team of 5 developers by implementing microservices architecture, which resulted in 40% improved system performance
 Managed full software development lifecycle by establishing CI/CD pipelines, which led to 50% faster deployment cycles
 Optimized database queries by implementing caching strategies, which achieved 60% reduction in response time""",
-            human_message="Generate 3 bullet points for this {item_type}: {item_data}{ranking_context}{job_context}"
+            human_message="Generate 3 bullet points for this {item_type}: {item_data}{ranking_context}{job_context}{candidate_instructions}"
         )
     
     def _create_project_bullet_prompt(self):
@@ -242,10 +336,272 @@ Example format:
 Developed machine learning model by implementing neural networks in TensorFlow, which achieved 95% accuracy in classification tasks
 Built full-stack web application by integrating React frontend with Node.js backend, which demonstrated end-to-end development skills
 Designed scalable database architecture by implementing MongoDB with Redis caching, which supported 10,000+ concurrent users""",
-            human_message="Generate 2 bullet points for this {item_type}: {item_data}{ranking_context}{job_context}"
+            human_message="Generate 2 bullet points for this {item_type}: {item_data}{ranking_context}{job_context}{candidate_instructions}"
         )
     
-    def generate_bullet_points_for_experience(self, experience_id: int, ranking_reason: Optional[str] = None, job_info: Optional[JobInfo] = None) -> Dict[str, Any]:
+    def _create_batch_bullet_prompt(self):
+        """Create prompt template for generating bullet points for several items at once."""
+        return self._create_prompt_template(
+            system_message="""You are an expert resume writer for software engineers. Generate bullet points in the Google XYZ format for each of the given work experiences and projects.
+
+The XYZ format is: Accomplished [X] by implementing [Y], which led to [Z].
+
+Rules:
+1. Generate EXACTLY the number of bullet points requested for each item
+2. Start each bullet point with an action verb
+3. Include specific metrics and achievements when possible
+4. Make each bullet point impactful and measurable
+5. Do not use bullet point symbols (*, -, •) - just write the text
+6. For experiences, emphasize technical details, professional impact and business value
+7. For projects, emphasize technical implementation, problem-solving and innovation
+8. Use the ranking context of each item to emphasize its most relevant aspects
+9. If job context is provided, tailor bullet points to highlight relevant skills and technologies
+10. Do not include write any generic bullet points (example: Contributed to technical documentation, planning, collaboration, etc...). Only include thing that is technical and relevant to the job.
+11. Each bullet point should be short, concise, and to the point.
+12. We want to save space, therefore, each bullet point should be less than 100 characters. If it is too long, do less than 250 characters but more than 200 characters to fill the space.
+13. Never mix content between items - each item's bullet points must only describe that item
+
+Return ONLY a JSON object mapping each item key to its list of bullet points, for example:
+{{"experience_1": ["Optimized database queries by implementing caching strategies, which achieved 60% reduction in response time"], "project_2": ["Built full-stack web application by integrating React frontend with Node.js backend, which supported 10,000+ users"]}}""",
+            human_message="Generate bullet points for each of the following items.{job_context}{candidate_instructions}\n\nItems:\n{items_data}"
+        )
+    
+    def _load_item_map(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Load every experience and project referenced by the items with one query per table."""
+        try:
+            return load_item_map(
+                [item.get('id') for item in items if item.get('type', 'experience') == "experience"],
+                [item.get('id') for item in items if item.get('type') == "project"]
+            )
+        except Exception as e:
+            print(f"Error loading items: {e}")
+            return {}
+    
+    def _format_candidate_instructions(self, item_type: Optional[str] = None) -> str:
+        """Ask for alternative bullet point sets when more than one candidate is requested."""
+        if self.candidate_count <= 1:
+            return ""
+        if item_type:
+            return (f"\n\nWrite {self.candidate_count} alternative sets of bullet points for this {item_type}, "
+                    f"each set taking a different angle. Separate the sets with a line containing only {CANDIDATE_SEPARATOR}")
+        return (f"\n\nFor each item, write {self.candidate_count} alternative sets of bullet points, each taking a different angle. "
+                f"Map each item key to a list of {self.candidate_count} lists of bullet points instead of a single list.")
+    
+    def _get_job_keywords(self, job_info: Optional[JobInfo], job_technical_skills: Optional[List[str]] = None) -> List[str]:
+        """Return the job keywords used to score candidates, falling back to known skills mentioned in the posting."""
+        if job_technical_skills:
+            return list(job_technical_skills)
+        if not job_info:
+            return []
+        job_text = " ".join([job_info.description] + list(job_info.qualifications)).lower()
+        return [
+            skill for skill in config.LANGUAGE_LIST + config.TECH_STACK_LIST
+            if re.search(rf"(?<![a-z0-9]){re.escape(skill.lower())}(?![a-z0-9])", job_text)
+        ]
+    
+    def _format_batch_item(self, key: str, item_type: str, item_data: str, ranking_reason: Optional[str], num_bullets: int) -> str:
+        """Format one item of a batch request."""
+        item_text = f"Item key: {key}\nType: {item_type}\nBullet points required: {num_bullets}\nDetails:\n{item_data}\n"
+        if ranking_reason:
+            item_text += f"Ranking Context: This {item_type} was selected because: {ranking_reason}\n"
+        return item_text
+    
+    def generate_bullet_points_batch(self, items: List[Dict[str, Any]], job_info: Optional[JobInfo] = None,
+                                     fresh_variant: bool = False,
+                                     job_technical_skills: Optional[List[str]] = None,
+                                     item_map: Optional[Dict[str, Any]] = None,
+                                     on_item_complete: Optional[Callable[[int, Dict[str, Any], Dict[str, Any]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """Generate bullet points for several experiences/projects with a single LLM call.
+        
+        The job context and instructions are sent once, and the response is keyed by
+        item. When several candidates are requested, the best scoring set is kept for
+        each item. Cached items are left out of the request, and items missing from
+        the response are generated individually.
+        
+        Args:
+            items: List of dicts with keys: 'id', 'type', 'ranking_reason' (optional),
+                'num_bullets' (optional, defaults to DEFAULT_BULLET_COUNTS for the type)
+            job_info: Job information used to tailor all bullet points
+            fresh_variant: Ignore cached bullet points and store the new ones as another variant
+            job_technical_skills: Job skills used to score candidates (detected from job_info if omitted)
+            item_map: Experiences/projects already loaded with load_item_map (loaded here if omitted)
+            on_item_complete: Optional callback called as ``(index, item, result)`` as each item is
+                resolved, from the cache, the batch response or its individual fallback
+        
+        Returns:
+            Dict keyed by "<type>_<id>" with the same fields as a single-item result
+        """
+        if item_map is None:
+            item_map = self._load_item_map(items)
+        
+        results = {}
+        # Position of each item in ``items``, reported to on_item_complete
+        indexes = {}
+        for index, item in enumerate(items):
+            item_id = item.get('id')
+            item_type = item.get('type', 'experience')
+            
+            if item_type == "project":
+                item_data = self.query_project_from_db(item_id, item_map)
+            else:
+                item_data = self.query_experience_from_db(item_id, item_map)
+            
+            num_bullets = item.get('num_bullets') or DEFAULT_BULLET_COUNTS.get(item_type, 3)
+            indexes.setdefault(f"{item_type}_{item_id}", index)
+            results[f"{item_type}_{item_id}"] = {
+                "messages": [],
+                "error": "",
+                "item_id": item_id,
+                "item_type": item_type,
+                "item_data": item_data,
+                "ranking_reason": item.get('ranking_reason'),
+                "job_info": job_info,
+                "bullet_points": [],
+                "fresh_variant": fresh_variant,
+                "job_technical_skills": job_technical_skills,
+                "candidate_scores": [],
+                "cache_key": self._get_cache_key(item_data, job_info, item.get('ranking_reason'), num_bullets, mode="batch"),
+                "from_cache": False,
+                "num_bullets": num_bullets
+            }
+        
+        if self.use_cache and not fresh_variant:
+            try:
+                cached = BulletCacheService().get_bullets_many([result["cache_key"] for result in results.values()])
+            except Exception as e:
+                print(f"Error reading bullet cache: {e}")
+                cached = {}
+            for result in results.values():
+                cached_entry = cached.get(result["cache_key"])
+                if cached_entry and cached_entry.bullet_points:
+                    result["bullet_points"] = list(cached_entry.bullet_points)
+                    result.pop("num_bullets")
+                    result["from_cache"] = True
+        
+        def report(key: str, result: Dict[str, Any]):
+            if on_item_complete:
+                on_item_complete(indexes[key], items[indexes[key]], result)
+        
+        # Cached items are done before the request is sent
+        for key, result in results.items():
+            if result["from_cache"]:
+                report(key, result)
+        
+        uncached = {key: result for key, result in results.items() if not result["from_cache"]}
+        generated = {}
+        if uncached:
+            item_blocks = [
+                self._format_batch_item(key, result["item_type"], result["item_data"], result["ranking_reason"], result["num_bullets"])
+                for key, result in uncached.items()
+            ]
+            try:
+                chain = self._create_batch_bullet_prompt() | self.llm | StrOutputParser()
+                response_text = chain.invoke({
+                    "job_context": self._format_job_context(job_info),
+                    "candidate_instructions": self._format_candidate_instructions(),
+                    "items_data": "\n".join(item_blocks)
+                })
+                generated = json.loads(self._clean_json_response(response_text))
+                if not isinstance(generated, dict):
+                    generated = {}
+            except Exception as e:
+                print(f"Batch bullet point generation failed, falling back to per-item generation: {e}")
+        
+        keywords = self._get_job_keywords(job_info, job_technical_skills)
+        missing_items = []
+        for key, result in results.items():
+            if result["from_cache"]:
+                continue
+            num_bullets = result.pop("num_bullets")
+            bullets = generated.get(key)
+            if isinstance(bullets, list) and bullets:
+                # Either a list of candidate sets or a single list of bullet points
+                candidate_sets = bullets if all(isinstance(candidate, list) for candidate in bullets) else [bullets]
+                candidates = [
+                    self._parse_bullet_points("\n".join(str(bullet) for bullet in candidate), max_points=num_bullets)
+                    for candidate in candidate_sets
+                ]
+                result["bullet_points"], result["candidate_scores"] = select_best_bullets(
+                    [candidate for candidate in candidates if candidate], num_bullets, keywords
+                )
+            if result["bullet_points"]:
+                if self.use_cache:
+                    self._save_to_cache(result["cache_key"], result["bullet_points"], result["item_type"])
+                report(key, result)
+            else:
+                missing_items.append({"id": result["item_id"], "type": result["item_type"], "ranking_reason": result["ranking_reason"]})
+        
+        if missing_items:
+            fallback_results = self.generate_bullet_points_concurrently(
+                missing_items, job_info=job_info, fresh_variant=fresh_variant,
+                job_technical_skills=job_technical_skills, item_map=item_map,
+                on_item_complete=lambda index, item, result: report(f"{item['type']}_{item['id']}", result)
+            )
+            for item, result in zip(missing_items, fallback_results):
+                results[f"{item['type']}_{item['id']}"] = result
+        
+        return results
+    
+    def generate_bullet_points_concurrently(self, items: List[Dict[str, Any]], job_info: Optional[JobInfo] = None,
+                                            max_concurrency: int = 4, fresh_variant: bool = False,
+                                            job_technical_skills: Optional[List[str]] = None,
+                                            item_map: Optional[Dict[str, Any]] = None,
+                                            on_item_complete: Optional[Callable[[int, Dict[str, Any], Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """Generate bullet points for several experiences/projects in parallel, one LLM call per item.
+        
+        At most ``max_concurrency`` items are generated at once, so the total time is close
+        to that of the slowest item. Results are returned in the same order as ``items``.
+        
+        Args:
+            items: List of dicts with keys: 'id', 'type', 'ranking_reason' (optional)
+            job_info: Job information used to tailor all bullet points
+            max_concurrency: Maximum number of items generated at the same time
+            fresh_variant: Ignore cached bullet points and store the new ones as another variant
+            job_technical_skills: Job skills used to score candidates (detected from job_info if omitted)
+            item_map: Experiences/projects already loaded with load_item_map (loaded here if omitted)
+            on_item_complete: Optional callback called as ``(index, item, result)`` when an item finishes
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if not items:
+            return []
+        if item_map is None:
+            item_map = self._load_item_map(items)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(items)))) as executor:
+            futures = {
+                executor.submit(
+                    self.generate_bullet_points,
+                    item.get('id'),
+                    item.get('type', 'experience'),
+                    item.get('ranking_reason'),
+                    job_info,
+                    fresh_variant,
+                    job_technical_skills,
+                    item_map
+                ): index
+                for index, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                item = items[index]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {
+                        "item_id": item.get('id'),
+                        "item_type": item.get('type', 'experience'),
+                        "bullet_points": [],
+                        "error": f"Failed to process {item.get('type', 'experience')} {item.get('id')}: {str(e)}"
+                    }
+                results[index] = result
+                if on_item_complete:
+                    on_item_complete(index, item, result)
+        
+        return results
+    
+    def generate_bullet_points_for_experience(self, experience_id: int, ranking_reason: Optional[str] = None, job_info: Optional[JobInfo] = None,
+                                              fresh_variant: bool = False, job_technical_skills: Optional[List[str]] = None,
+                                              item_map: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Main method to generate bullet points for an experience."""
         initial_state = {
             "messages": [],
@@ -255,13 +611,23 @@ Designed scalable database architecture by implementing MongoDB with Redis cachi
             "ranking_reason": ranking_reason,
             "job_info": job_info,
             "bullet_points": [],
+            "fresh_variant": fresh_variant,
+            "job_technical_skills": job_technical_skills,
+            "item_map": item_map,
+            "candidate_scores": [],
+            "cache_key": "",
+            "from_cache": False,
             "error": ""
         }
         
         result = self.run(initial_state)
+        # The item map is shared request state, not part of the result
+        result.pop("item_map", None)
         return result
     
-    def generate_bullet_points_for_project(self, project_id: int, ranking_reason: Optional[str] = None, job_info: Optional[JobInfo] = None) -> Dict[str, Any]:
+    def generate_bullet_points_for_project(self, project_id: int, ranking_reason: Optional[str] = None, job_info: Optional[JobInfo] = None,
+                                           fresh_variant: bool = False, job_technical_skills: Optional[List[str]] = None,
+                                           item_map: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Main method to generate bullet points for a project."""
         initial_state = {
             "messages": [],
@@ -271,18 +637,28 @@ Designed scalable database architecture by implementing MongoDB with Redis cachi
             "ranking_reason": ranking_reason,
             "job_info": job_info,
             "bullet_points": [],
+            "fresh_variant": fresh_variant,
+            "job_technical_skills": job_technical_skills,
+            "item_map": item_map,
+            "candidate_scores": [],
+            "cache_key": "",
+            "from_cache": False,
             "error": ""
         }
         
         result = self.run(initial_state)
+        # The item map is shared request state, not part of the result
+        result.pop("item_map", None)
         return result
     
-    def generate_bullet_points(self, item_id: int, item_type: str = "experience", ranking_reason: Optional[str] = None, job_info: Optional[JobInfo] = None) -> Dict[str, Any]:
+    def generate_bullet_points(self, item_id: int, item_type: str = "experience", ranking_reason: Optional[str] = None, job_info: Optional[JobInfo] = None,
+                               fresh_variant: bool = False, job_technical_skills: Optional[List[str]] = None,
+                               item_map: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generic method to generate bullet points for either experience or project."""
         if item_type == "project":
-            return self.generate_bullet_points_for_project(item_id, ranking_reason, job_info)
+            return self.generate_bullet_points_for_project(item_id, ranking_reason, job_info, fresh_variant, job_technical_skills, item_map)
         else:
-            return self.generate_bullet_points_for_experience(item_id, ranking_reason, job_info)
+            return self.generate_bullet_points_for_experience(item_id, ranking_reason, job_info, fresh_variant, job_technical_skills, item_map)
     
     def generate_multiple_items(self, items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Generate bullet points for multiple experiences/projects.
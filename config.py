@@ -12,4 +12,20 @@ LANGUAGE_LIST = ["Python", "C++", "C", "Golang", "SQL", "Java", "TypeScript"]
 TECH_STACK_LIST = ["PyTorch", "Numpy", "Matplotlib", "Sklearn", "FastAPI", "Flask", "Django", 
                    "CMake", "vcpkg", "CUDA", "OpenGL", "GLSL", "POSIX", "Gin", "Postgres", 
                    "Redis", "MySQL", "Docker", "Nextjs", "React", "Node.js", "Express.js", 
-                   "GraphQL", "AWS", "Google Cloud Platform", "Spark", "gRPC"]
\ No newline at end of file
+                   "GraphQL", "AWS", "Google Cloud Platform", "Spark", "gRPC"]
+
+# Maximum number of tokens of job page content sent to the extraction prompt
+JOB_CONTENT_TOKEN_BUDGET = 3000
+
+# Generate bullet points for all selected experiences and projects with one LLM call
+BATCH_BULLET_GENERATION = True
+
+# Maximum number of items generated at the same time when bullet points are generated per item
+BULLET_GENERATION_CONCURRENCY = 4
+
+# Alternative bullet point sets requested per item; the best one is picked with local scoring
+BULLET_CANDIDATE_COUNT = 3
+
+# Keep recently read users, experiences, projects and job postings in memory (LRU)
+READ_CACHE_ENABLED = True
+READ_CACHE_SIZE = 1024
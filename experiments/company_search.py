@@ -1,7 +1,4 @@
 from typing import TypedDict, Optional
-from langchain_community.tools import DuckDuckGoSearchRun
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langgraph.graph import StateGraph
 from model.database import Database
 from model.schema import CompanyDB
 import json
@@ -13,10 +10,8 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 # Load environment variables
 load_dotenv()
 
-# Get API key from environment
+# Get API key from environment (checked when the LLM is first needed)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-if not GOOGLE_API_KEY:
-    raise ValueError("GOOGLE_API_KEY not found in environment variables")
 
 class CompanyInfoState(TypedDict):
     company_name: str
@@ -24,18 +19,39 @@ class CompanyInfoState(TypedDict):
     structured_data: Optional[dict]
     error: Optional[str]
 
-# Initialize tools and models
-search_tool = DuckDuckGoSearchRun()
-try:
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash-lite",  # Updated model name
-        temperature=0,
-        google_api_key=GOOGLE_API_KEY
-    )
-except Exception as e:
-    raise ValueError(f"Failed to initialize Google AI model: {str(e)}")
+# Tools, models and the database handle are created on first use
+_search_tool = None
+_llm = None
 
-db = Database.get_instance()
+def get_search_tool():
+    """Return the shared DuckDuckGo search tool, creating it on first use."""
+    global _search_tool
+    if _search_tool is None:
+        from langchain_community.tools import DuckDuckGoSearchRun
+        _search_tool = DuckDuckGoSearchRun()
+    return _search_tool
+
+def get_llm():
+    """Return the shared LLM client, creating it on first use."""
+    global _llm
+    if _llm is None:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        api_key = GOOGLE_API_KEY or os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            raise ValueError("GOOGLE_API_KEY not found in environment variables")
+        try:
+            _llm = ChatGoogleGenerativeAI(
+                model="gemini-2.0-flash-lite",  # Updated model name
+                temperature=0,
+                google_api_key=api_key
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to initialize Google AI model: {str(e)}")
+    return _llm
+
+def get_db() -> Database:
+    """Return the database handle."""
+    return Database.get_instance()
 
 @retry(
     stop=stop_after_attempt(3),
@@ -45,7 +61,7 @@ db = Database.get_instance()
 def perform_search(query: str) -> str:
     """Perform a search with retry logic."""
     time.sleep(2)  # Add delay between searches
-    return search_tool.run(query)
+    return get_search_tool().run(query)
 
 def search_node(state: CompanyInfoState) -> CompanyInfoState:
     """Search for company information using DuckDuckGo."""
@@ -117,7 +133,7 @@ Search Results:
 IMPORTANT: Return ONLY the JSON object, nothing else. No additional text or explanation.
 """
     try:
-        response = llm.invoke(prompt)
+        response = get_llm().invoke(prompt)
         if not response or not response.content:
             return {**state, "error": "Empty response from LLM"}
             
@@ -153,7 +169,7 @@ def store_node(state: CompanyInfoState) -> CompanyInfoState:
         return state
 
     try:
-        with db as session:
+        with get_db() as session:
             # Check if company already exists
             existing_company = session.query(CompanyDB).filter(
                 CompanyDB.name == state['structured_data']['name']
@@ -176,8 +192,10 @@ def store_node(state: CompanyInfoState) -> CompanyInfoState:
     except Exception as e:
         return {**state, "error": f"Database operation failed: {str(e)}"}
 
-def create_company_workflow() -> StateGraph:
+def create_company_workflow():
     """Create and configure the company information workflow."""
+    from langgraph.graph import StateGraph
+    
     graph = StateGraph(CompanyInfoState)
 
     # Add nodes
@@ -196,7 +214,7 @@ def search_and_store_company(company_name: str) -> dict:
     """Search for company information and store it in the database."""
     # First check if company exists in database using case-insensitive partial match
     try:
-        with db as session:
+        with get_db() as session:
             # Convert company_name to lowercase for case-insensitive comparison
             search_term = f"%{company_name.lower()}%"
             existing_company = session.query(CompanyDB).filter(
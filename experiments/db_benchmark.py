@@ -0,0 +1,107 @@
+"""
+Query-latency benchmark for the hot lookup columns.
+
+Fills a temporary SQLite database with job postings and companies, drops the
+lookup indexes to reproduce an unmigrated database, and times the queries used
+by ``JobPostingService.get_job_posting_by_url`` and
+``CompanyService.get_company_by_name`` before and after ``run_migrations``.
+
+Usage:
+    python experiments/db_benchmark.py [--postings 100000] [--lookups 500]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, or_, text
+from sqlalchemy.orm import Session
+from model.schema import Base, CompanyDB, JobPostingDB
+from model.database import create_database_engine
+from model.migrations import run_migrations
+
+# Indexes added by the migrations; dropped first to measure the old schema
+LOOKUP_INDEXES = ["ix_job_postings_job_posting_url", "ix_companies_name"]
+
+def populate(engine, postings: int):
+    """Insert ``postings`` job postings and one company per hundred postings."""
+    companies = max(postings // 100, 1)
+    with engine.begin() as connection:
+        connection.execute(insert(CompanyDB), [
+            {"name": f"Company {i}", "location": "Remote", "industry": "Software"} for i in range(companies)
+        ])
+        connection.execute(insert(JobPostingDB), [
+            {
+                "job_posting_url": f"https://jobs.example.com/{i}?utm_source=feed",
+                "canonical_url": f"https://jobs.example.com/{i}",
+                "company_name": f"Company {i % companies}",
+                "job_title": "Software Engineer",
+                "job_description": "Build and operate services.",
+            }
+            for i in range(postings)
+        ])
+        for index in LOOKUP_INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+def time_lookups(engine, postings: int, lookups: int) -> dict:
+    """Return median and p95 latency in milliseconds for both lookups."""
+    rng = random.Random(0)
+    companies = max(postings // 100, 1)
+    timings = {"job_posting_by_url": [], "company_by_name": []}
+    with Session(engine) as session:
+        for _ in range(lookups):
+            i = rng.randrange(postings)
+            url = f"https://jobs.example.com/{i}?utm_source=feed"
+            start = time.perf_counter()
+            session.query(JobPostingDB).filter(or_(
+                JobPostingDB.canonical_url == f"https://jobs.example.com/{i}",
+                JobPostingDB.job_posting_url == url
+            )).first()
+            timings["job_posting_by_url"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            session.query(CompanyDB).filter(CompanyDB.name == f"Company {rng.randrange(companies)}").first()
+            timings["company_by_name"].append(time.perf_counter() - start)
+            session.expunge_all()
+
+    return {
+        name: {
+            "median_ms": statistics.median(values) * 1000,
+            "p95_ms": statistics.quantiles(values, n=20)[-1] * 1000,
+        }
+        for name, values in timings.items()
+    }
+
+def print_results(label: str, results: dict):
+    print(label)
+    for name, result in results.items():
+        print(f"  {name:<20} median {result['median_ms']:8.3f} ms   p95 {result['p95_ms']:8.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure lookup latency before and after the index migrations")
+    parser.add_argument("--postings", type=int, default=100000, help="Number of job postings to insert")
+    parser.add_argument("--lookups", type=int, default=500, help="Number of lookups to time per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_database_engine(f"sqlite:///{os.path.join(directory, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+
+        start = time.perf_counter()
+        populate(engine, args.postings)
+        print(f"Inserted {args.postings} postings in {time.perf_counter() - start:.1f} s")
+
+        print_results("Before migrations (no lookup indexes):", time_lookups(engine, args.postings, args.lookups))
+        applied = run_migrations(engine)
+        print(f"Applied: {', '.join(applied)}")
+        print_results("After migrations:", time_lookups(engine, args.postings, args.lookups))
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
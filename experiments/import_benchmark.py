@@ -0,0 +1,64 @@
+"""
+Import-time benchmark for the CLI entry point.
+
+Runs ``import <module>`` in fresh interpreters and reports the cold-start time
+along with which heavy third-party packages were loaded as a side effect.
+
+Usage:
+    python experiments/import_benchmark.py [--module main] [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages that should only be imported when the feature using them runs
+HEAVY_MODULES = [
+    "selenium", "webdriver_manager", "bs4", "langchain_google_genai",
+    "langchain_community", "langgraph", "duckduckgo_search",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+def run_once(module: str) -> dict:
+    """Import the module in a fresh interpreter and return the timing result."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to start")
+    args = parser.parse_args()
+
+    results = [run_once(args.module) for _ in range(args.runs)]
+    timings = [result["seconds"] for result in results]
+
+    print(f"import {args.module}: {args.runs} runs")
+    print(f"  median: {statistics.median(timings) * 1000:.0f} ms")
+    print(f"  min:    {min(timings) * 1000:.0f} ms")
+    print(f"  max:    {max(timings) * 1000:.0f} ms")
+    print(f"  heavy modules loaded: {', '.join(results[-1]['loaded']) or 'none'}")
+
+if __name__ == "__main__":
+    main()
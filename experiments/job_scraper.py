@@ -1,26 +1,30 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.output_parsers import PydanticOutputParser
-from langchain.prompts import PromptTemplate
+# Selenium, webdriver_manager, BeautifulSoup and the LLM client are imported
+# inside the functions that use them, so importing this module stays cheap.
 from pydantic import BaseModel, Field
 import os
 from dotenv import load_dotenv
 import json
-from webdriver_manager.chrome import ChromeDriverManager
 import time
-from bs4 import BeautifulSoup
 import re
+import sys
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from experiments.job_sections import select_job_sections
 
 # Load environment variables
 load_dotenv()
 
-# Get API key from environment
+# Get API key from environment (checked when the LLM is first needed)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-if not GOOGLE_API_KEY:
-    raise ValueError("GOOGLE_API_KEY not found in environment variables")
+
+def get_google_api_key():
+    """Return the Google API key, raising if it is not configured."""
+    api_key = GOOGLE_API_KEY or os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY not found in environment variables")
+    return api_key
 
 # Define the job information model
 class JobInfo(BaseModel):
@@ -31,8 +35,25 @@ class JobInfo(BaseModel):
     description: str = Field(description="The job description")
     qualifications: list[str] = Field(description="List of required qualifications and requirements, each as a separate string")
 
+# Job information plus technical skills, extracted with a single LLM call
+class JobExtraction(JobInfo):
+    technical_skills: list[str] = Field(description="Technical skills, tools, technologies and programming languages mentioned in the posting")
+
+TECHNICAL_SKILLS_INSTRUCTIONS = """
+        For technical_skills:
+        1. Extract ONLY technical skills, tools, technologies and programming languages
+        2. Include programming languages, frameworks and libraries, databases, cloud platforms, development tools and technical methodologies (Agile, DevOps, CI/CD, etc.)
+        3. Do NOT include soft skills, general business skills, industry knowledge or educational requirements
+        4. Return an empty list if no technical skills are mentioned
+"""
+
 def setup_driver():
     """Set up and return a configured Chrome WebDriver."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
+    
     try:
         chrome_options = Options()
         chrome_options.add_argument("--headless=new")  # Updated headless mode
@@ -62,6 +83,8 @@ def has_text_content(element):
 
 def clean_html(html_content):
     """Extract only text content from HTML, removing all tags and cleaning up whitespace."""
+    from bs4 import BeautifulSoup
+    
     soup = BeautifulSoup(html_content, 'html.parser')
     
     # Remove script and style elements
@@ -89,8 +112,14 @@ def clean_json_response(response_text):
     response_text = response_text.replace('```json', '').replace('```', '').strip()
     return response_text
 
-def extract_job_info(url):
-    """Extract job information from the given URL."""
+def fetch_job_page_content(url, token_budget=None):
+    """Load a job page and return its relevant sections and content metrics.
+
+    Only the description, responsibilities and qualifications sections of the
+    page are kept, trimmed to ``token_budget`` tokens.
+    """
+    from selenium.webdriver.common.by import By
+    
     driver = None
     try:
         driver = setup_driver()
@@ -110,68 +139,96 @@ def extract_job_info(url):
         
         # Clean the HTML content
         cleaned_content = clean_html(page_content)
-        print("Raw content extracted. Processing with LLM...")
-        
-        # Initialize LLM
-        llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash-lite",
-            temperature=0,
-            google_api_key=GOOGLE_API_KEY
-        )
+        selected_content, content_metrics = select_job_sections(cleaned_content, token_budget)
+        print(f"Selected sections {content_metrics['sections_found']}: "
+              f"{content_metrics['selected_tokens']}/{content_metrics['original_tokens']} tokens "
+              f"({content_metrics['tokens_saved']} saved)")
+        return selected_content, content_metrics
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
+
+def extract_job_info_from_content(text_content, include_technical_skills=False):
+    """Extract job information from cleaned job page text with the LLM.
+
+    With ``include_technical_skills`` the same call also returns the posting's
+    technical skills under the ``technical_skills`` key.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain.output_parsers import PydanticOutputParser
+    from langchain.prompts import PromptTemplate
+    
+    # Initialize LLM
+    llm = ChatGoogleGenerativeAI(
+        model="gemini-2.0-flash-lite",
+        temperature=0,
+        google_api_key=get_google_api_key()
+    )
+    
+    # Set up the output parser
+    parser = PydanticOutputParser(pydantic_object=JobExtraction if include_technical_skills else JobInfo)
+    
+    # Create the prompt template
+    prompt = PromptTemplate(
+        template="""
+        Given the following text content from a job listing page, extract the job information.
         
-        # Set up the output parser
-        parser = PydanticOutputParser(pydantic_object=JobInfo)
+        {format_instructions}
         
-        # Create the prompt template
-        prompt = PromptTemplate(
-            template="""
-            Given the following text content from a job listing page, extract the job information.
-            
-            {format_instructions}
-            
-            Text Content:
-            {text_content}
+        Text Content:
+        {text_content}
 
-            For description:
-            1. Extract the description of the job
-            2. Make sure to include the key responsibilities for the job as well
-            
-            For qualifications:
-            1. Extract each qualification as a separate item in the list
-            2. Include both required and preferred qualifications
-            3. Each qualification should be a complete, standalone statement
-            4. Include qualifications from sections like "Requirements", "Qualifications", "Nice to Have", etc.
-            5. Make sure each qualification is clear and specific
-            """,
-            input_variables=["text_content"],
-            partial_variables={"format_instructions": parser.get_format_instructions()}
-        )
-        
-        # Format the prompt
-        formatted_prompt = prompt.format(text_content=cleaned_content)
+        For description:
+        1. Extract the description of the job
+        2. Make sure to include the key responsibilities for the job as well
         
-        # Get structured response from LLM
-        print("Processing with LLM...")
-        response = llm.invoke(formatted_prompt)
+        For qualifications:
+        1. Extract each qualification as a separate item in the list
+        2. Include both required and preferred qualifications
+        3. Each qualification should be a complete, standalone statement
+        4. Include qualifications from sections like "Requirements", "Qualifications", "Nice to Have", etc.
+        5. Make sure each qualification is clear and specific
+        {extra_instructions}""",
+        input_variables=["text_content"],
+        partial_variables={
+            "format_instructions": parser.get_format_instructions(),
+            "extra_instructions": TECHNICAL_SKILLS_INSTRUCTIONS if include_technical_skills else ""
+        }
+    )
+    
+    # Format the prompt
+    formatted_prompt = prompt.format(text_content=text_content)
+    
+    # Get structured response from LLM
+    print("Processing with LLM...")
+    response = llm.invoke(formatted_prompt)
+    
+    # Parse the response
+    try:
+        job_info = parser.parse(response.content)
+        return job_info.dict()
+    except Exception as e:
+        print(f"Error parsing LLM response: {e}")
+        print("Raw response:", response.content)
+        return None
+
+def extract_job_info(url, token_budget=None):
+    """Extract job information from the given URL."""
+    try:
+        selected_content, content_metrics = fetch_job_page_content(url, token_budget)
+        print("Raw content extracted. Processing with LLM...")
         
-        # Parse the response
-        try:
-            job_info = parser.parse(response.content)
-            return job_info.dict()
-        except Exception as e:
-            print(f"Error parsing LLM response: {e}")
-            print("Raw response:", response.content)
-            return None
+        job_info = extract_job_info_from_content(selected_content)
+        if job_info is not None:
+            job_info["content_metrics"] = content_metrics
+        return job_info
             
     except Exception as e:
         print(f"Error during scraping: {str(e)}")
         return None
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception as e:
-                print(f"Error closing driver: {e}")
 
 if __name__ == "__main__":
     url = "https://nvidia.wd5.myworkdayjobs.com/en-US/NVIDIAExternalCareerSite/job/US-CA-Santa-Clara/Software-Research-Intern--AI-Networking-Team---Fall-2025_JR1998253?jobFamilyGroup=0c40f6bd1d8f10ae43ffda1e8d447e94&locationHierarchy1=2fcb99c455831013ea52fb338f2932d8"
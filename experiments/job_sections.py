@@ -0,0 +1,184 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+import config
+
+# Rough token estimate used for budgeting prompts (~4 characters per token)
+CHARS_PER_TOKEN = 4
+
+# Share of the budget reserved for the lines preceding the first detected
+# section (usually the job title, company and location)
+HEADER_BUDGET_RATIO = 0.15
+
+# Lines longer than this are treated as body text, never as headings
+MAX_HEADING_LENGTH = 60
+
+SECTION_KEYWORDS = {
+    "description": (
+        "job description", "about the role", "about the job", "about the position",
+        "position summary", "job summary", "role overview", "overview", "the role",
+        "the opportunity", "what you'll be doing", "what you will be doing",
+    ),
+    "responsibilities": (
+        "responsibilities", "what you'll do", "what you will do", "your role",
+        "duties", "in this role", "day to day", "day-to-day", "your impact",
+    ),
+    "qualifications": (
+        "qualifications", "requirements", "what we're looking for", "what we are looking for",
+        "what you need", "what you'll need", "what you bring", "who you are", "you have",
+        "skills", "nice to have", "preferred", "ways to stand out", "must have",
+    ),
+}
+
+# Keywords that also occur in ordinary body lines ("Strong communication skills").
+# They only mark a heading on their own, followed by a colon, or next to
+# heading words ("Technical Skills", "Job Overview", "What you have").
+WEAK_KEYWORDS = ("skills", "overview", "you have", "preferred")
+HEADING_WORDS = {
+    "required", "preferred", "technical", "key", "core", "desired", "additional", "bonus",
+    "job", "role", "position", "what", "your", "and", "&", "experience", "qualifications",
+}
+
+# Headings that start blocks we never want to send to the LLM
+NOISE_KEYWORDS = (
+    "similar jobs", "related jobs", "recommended jobs", "jobs for you", "share this job",
+    "follow us", "privacy", "cookie", "equal opportunity", "equal employment",
+    "sign in", "log in", "create alert", "job alert", "copyright", "©",
+)
+
+# Sections kept first when the budget is too small for all of them
+SECTION_PRIORITY = ["qualifications", "responsibilities", "description"]
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a piece of text."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def _normalize_heading(line: str) -> str:
+    """Lower-case a line and strip decorations such as trailing colons."""
+    line = line.lower().replace("’", "'")
+    return re.sub(r"[\s:\-–—#*]+$", "", re.sub(r"^[\s#*\-–—]+", "", line))
+
+def _contains_keyword(heading: str, keyword: str) -> bool:
+    return re.search(rf"(?<!\w){re.escape(keyword)}(?!\w)", heading) is not None
+
+def _is_weak_heading(line: str, heading: str, keyword: str) -> bool:
+    if heading == keyword or line.rstrip().endswith(":"):
+        return True
+    other_words = re.sub(rf"(?<!\w){re.escape(keyword)}(?!\w)", " ", heading).split()
+    return all(word in HEADING_WORDS for word in other_words)
+
+def classify_heading(line: str) -> Optional[str]:
+    """Return the section label a heading line introduces, or None for body text."""
+    if len(line) > MAX_HEADING_LENGTH or len(line.split()) > 8:
+        return None
+
+    heading = _normalize_heading(line)
+    if not heading:
+        return None
+
+    if any(_contains_keyword(heading, keyword) for keyword in NOISE_KEYWORDS):
+        return "noise"
+
+    for label, keywords in SECTION_KEYWORDS.items():
+        for keyword in keywords:
+            if not _contains_keyword(heading, keyword):
+                continue
+            if keyword not in WEAK_KEYWORDS or _is_weak_heading(line, heading, keyword):
+                return label
+    return None
+
+def detect_sections(text: str) -> List[Tuple[str, List[str]]]:
+    """Split cleaned page text into labelled blocks.
+
+    Lines before the first recognised section heading are labelled "header";
+    lines after a noise heading (footers, similar jobs, ...) are labelled "noise".
+    Noise headings only count once a section has started, so navigation such as
+    "Sign In" at the top of the page never hides the job title and location.
+    """
+    blocks: List[Tuple[str, List[str]]] = []
+    current_label = "header"
+    current_lines: List[str] = []
+
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        label = classify_heading(line)
+        if label == "noise" and current_label == "header":
+            label = None
+        if label:
+            if current_lines:
+                blocks.append((current_label, current_lines))
+            current_label = label
+            current_lines = [line]
+        else:
+            current_lines.append(line)
+
+    if current_lines:
+        blocks.append((current_label, current_lines))
+    return blocks
+
+def _take_lines(lines: List[str], budget: int) -> List[str]:
+    """Take lines from the start of a block until the token budget is used."""
+    taken = []
+    used = 0
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        taken.append(line)
+        used += cost
+    return taken
+
+def _take_trailing_lines(lines: List[str], budget: int) -> List[str]:
+    """Take lines from the end of a block until the token budget is used."""
+    return list(reversed(_take_lines(list(reversed(lines)), budget)))
+
+def select_job_sections(text: str, token_budget: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+    """Select the description, responsibilities and qualifications of a job page.
+
+    Returns the trimmed text and metrics describing how many tokens were saved.
+    If no known section is detected, the page is truncated to the budget as is.
+    """
+    token_budget = token_budget or config.JOB_CONTENT_TOKEN_BUDGET
+    original_tokens = estimate_tokens(text)
+    blocks = detect_sections(text)
+    sections_found = sorted({label for label, _ in blocks if label in SECTION_KEYWORDS})
+
+    if not sections_found:
+        selected = "\n".join(_take_lines(text.split("\n"), token_budget))
+    else:
+        selected_blocks: Dict[int, List[str]] = {}
+        remaining = token_budget
+
+        # Keep the part of the header closest to the first section (title, location)
+        first_label, first_lines = blocks[0]
+        if first_label == "header":
+            header_budget = int(token_budget * HEADER_BUDGET_RATIO)
+            selected_blocks[0] = _take_trailing_lines(first_lines, header_budget)
+            remaining -= sum(estimate_tokens(line) + 1 for line in selected_blocks[0])
+
+        for label in SECTION_PRIORITY:
+            for index, (block_label, lines) in enumerate(blocks):
+                if block_label != label or remaining <= 0:
+                    continue
+                taken = _take_lines(lines, remaining)
+                selected_blocks[index] = taken
+                remaining -= sum(estimate_tokens(line) + 1 for line in taken)
+
+        # Reassemble in page order so the LLM sees the original structure
+        selected = "\n".join(
+            "\n".join(selected_blocks[index]) for index in sorted(selected_blocks) if selected_blocks[index]
+        )
+
+    selected_tokens = estimate_tokens(selected)
+    metrics = {
+        "token_budget": token_budget,
+        "original_tokens": original_tokens,
+        "selected_tokens": selected_tokens,
+        "tokens_saved": max(original_tokens - selected_tokens, 0),
+        "sections_found": sections_found,
+    }
+    return selected, metrics
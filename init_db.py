@@ -1,19 +1,27 @@
-from sqlalchemy import create_engine
+import argparse
 from model.schema import Base
-from dotenv import load_dotenv
-import os
+from model.database import engine
+from model.migrations import run_migrations
 
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    DATABASE_URL = "sqlite:///resume.db"
+def init_db(reset: bool = False):
+    """Create missing tables and apply additive migrations, keeping existing data.
 
-def init_db():
-    """Initialize the database by creating all tables."""
-    engine = create_engine(DATABASE_URL)
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    print("Database tables created successfully.")
+    With ``reset`` the tables are dropped and recreated from scratch instead.
+    """
+    database = engine.url.render_as_string(hide_password=True)
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        print(f"Database tables created successfully ({database}).")
+        return
+
+    applied = run_migrations(engine)
+    for description in applied:
+        print(f"  • {description}")
+    print(f"Database is up to date ({database}, {len(applied)} changes applied).")
 
 if __name__ == "__main__":
-    init_db()
+    parser = argparse.ArgumentParser(description="Create or upgrade the database schema")
+    parser.add_argument("--reset", action="store_true", help="Drop all tables and recreate them (deletes all data)")
+    args = parser.parse_args()
+    init_db(reset=args.reset)
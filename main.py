@@ -1,6 +1,7 @@
 import click
 import json
 import os
+import config
 from typing import List, Dict, Optional
 from datetime import datetime
 from rich.console import Console
@@ -11,9 +12,13 @@ from rich.table import Table
 from services.user import UserService
 from services.experience import ExperienceService
 from services.project import ProjectService
+from services.job_posting import JobPostingService
 from agents import AgentFactory
 from services.resume_writer import ResumeWriter
+from services.item_map import profile_item_map
+from services.read_cache import get_read_cache
 from model.schema import User, Experience, Project
+from model.database import Database
 
 console = Console()
 
@@ -21,6 +26,7 @@ console = Console()
 user_service = UserService()
 experience_service = ExperienceService()
 project_service = ProjectService()
+job_posting_service = JobPostingService()
 
 def ensure_data_directory():
     """Ensure the data directory exists."""
@@ -361,8 +367,8 @@ def load_data_from_json(user_id: int):
         if not Confirm.ask("Do you want to proceed with loading this data?"):
             return
         
-        # Load experiences
-        exp_success = 0
+        # Validate experiences
+        experiences = []
         exp_errors = []
         for i, exp_data in enumerate(experiences_data):
             try:
@@ -374,7 +380,7 @@ def load_data_from_json(user_id: int):
                     exp_errors.append(f"Experience {i+1}: Missing fields: {', '.join(missing_fields)}")
                     continue
                 
-                experience = Experience(
+                experiences.append(Experience(
                     user_id=user_id,
                     company_name=exp_data['company_name'],
                     role_title=exp_data['role_title'],
@@ -384,16 +390,13 @@ def load_data_from_json(user_id: int):
                     short_description=exp_data['short_description'],
                     long_description=exp_data['long_description'],
                     tech_stack=exp_data.get('tech_stack', [])
-                )
-                
-                experience_service.create_experience(experience)
-                exp_success += 1
+                ))
                 
             except Exception as e:
                 exp_errors.append(f"Experience {i+1}: {str(e)}")
         
-        # Load projects
-        proj_success = 0
+        # Validate projects
+        projects = []
         proj_errors = []
         for i, proj_data in enumerate(projects_data):
             try:
@@ -404,7 +407,7 @@ def load_data_from_json(user_id: int):
                     proj_errors.append(f"Project {i+1}: Missing fields: {', '.join(missing_fields)}")
                     continue
                 
-                project = Project(
+                projects.append(Project(
                     user_id=user_id,
                     project_name=proj_data['project_name'],
                     start_date=proj_data.get('start_date'),
@@ -413,14 +416,16 @@ def load_data_from_json(user_id: int):
                     long_description=proj_data['long_description'],
                     tech_stack=proj_data.get('tech_stack', []),
                     team_size=proj_data.get('team_size', 1)
-                )
-                
-                project_service.create_project(project)
-                proj_success += 1
+                ))
                 
             except Exception as e:
                 proj_errors.append(f"Project {i+1}: {str(e)}")
         
+        # Insert all valid rows in one transaction so a failure leaves nothing half-loaded
+        with Database.get_instance().session_scope():
+            exp_success = len(experience_service.create_experiences(experiences))
+            proj_success = len(project_service.create_projects(projects))
+        
         # Report results
         console.print(f"\n[green]Successfully loaded {exp_success} experiences and {proj_success} projects![/green]")
         
@@ -509,14 +514,14 @@ def delete_all_user_data(user_id: int):
     console.print("\n[bold red]Delete All Data[/bold red]")
     
     # Get current data count
-    experiences = experience_service.get_user_experiences(user_id)
-    projects = project_service.get_user_projects(user_id)
+    experience_count = experience_service.count_user_experiences(user_id)
+    project_count = project_service.count_user_projects(user_id)
     
-    if not experiences and not projects:
+    if not experience_count and not project_count:
         console.print("[yellow]No data to delete.[/yellow]")
         return
     
-    console.print(f"[yellow]This will delete {len(experiences)} experiences and {len(projects)} projects.[/yellow]")
+    console.print(f"[yellow]This will delete {experience_count} experiences and {project_count} projects.[/yellow]")
     console.print("[bold red]This action cannot be undone![/bold red]")
     
     # Double confirmation
@@ -529,17 +534,10 @@ def delete_all_user_data(user_id: int):
         return
     
     try:
-        # Delete all experiences
-        exp_deleted = 0
-        for exp in experiences:
-            if experience_service.delete_experience(exp.id):
-                exp_deleted += 1
-        
-        # Delete all projects
-        proj_deleted = 0
-        for proj in projects:
-            if project_service.delete_project(proj.id):
-                proj_deleted += 1
+        # One DELETE per table, both in a single transaction
+        with Database.get_instance().session_scope():
+            exp_deleted = experience_service.delete_user_experiences(user_id)
+            proj_deleted = project_service.delete_user_projects(user_id)
         
         console.print(f"[green]Successfully deleted {exp_deleted} experiences and {proj_deleted} projects.[/green]")
         
@@ -556,6 +554,8 @@ def generate_resume_from_job_url(user_id: int):
     # Configuration
     num_experiences = int(Prompt.ask("Number of top experiences to include", default="3"))
     num_projects = int(Prompt.ask("Number of top projects to include", default="3"))
+    # Bullet points are cached per item and job; ask for a new variant to regenerate them
+    fresh_variant = Confirm.ask("Generate new bullet point variants instead of reusing cached ones?", default=False)
     
     try:
         console.print("\n[yellow]Step 1: Analyzing job posting...[/yellow]")
@@ -576,54 +576,66 @@ def generate_resume_from_job_url(user_id: int):
         console.print(f"[green]✓ Job analyzed: {job_info.job_title} at {job_info.company_name}[/green]")
         
         console.print("\n[yellow]Step 2: Ranking experiences and projects...[/yellow]")
+        if config.BATCH_BULLET_GENERATION:
+            console.print("[yellow]Step 3: Generating bullet points for all selected items in one request...[/yellow]")
+        else:
+            console.print("[yellow]Step 3: Generating bullet points as soon as each ranking is ready...[/yellow]")
         
-        # Ranking
-        ranking_agent = AgentFactory.create_agent("ranking", temperature=0.4)
-        ranking_result = ranking_agent.rank_both(job_info, user_id)
+        from agents.pipeline import generate_ranked_bullets
         
-        if ranking_result.get("error"):
-            console.print(f"[red]Error ranking: {ranking_result['error']}[/red]")
+        ranking_agent = AgentFactory.create_agent("ranking", temperature=0.4)
+        resume_agent = AgentFactory.create_agent("resume", temperature=1.0)
+        # Reuse the technical skills extracted during job analysis instead of extracting them again
+        job_technical_skills = analysis_result.get("job_technical_skills")
+        selection_limits = {"experience": num_experiences, "project": num_projects}
+        # The profile is loaded once; ranking, bullet generation and the LaTeX writer share it
+        profile = user_service.get_user_profile(user_id)
+        if not profile:
+            console.print("[red]User not found[/red]")
             return
+        item_map = profile_item_map(profile)
         
-        ranked_experiences = ranking_result.get("ranked_experiences", [])
-        ranked_projects = ranking_result.get("ranked_projects", [])
+        def report_ranking(item_type, ranking_result):
+            if ranking_result.get("error"):
+                console.print(f"[red]Error ranking {item_type}s: {ranking_result['error']}[/red]")
+                return
+            ranked = ranking_result.get(f"ranked_{item_type}s", [])
+            console.print(f"[green]✓ Ranked {len(ranked)} {item_type}s[/green]")
+            selected = min(len(ranked), selection_limits[item_type])
+            if selected:
+                console.print(f"  • Bullet points for the top {selected} {item_type}s...")
         
+        def report_progress(index, item, result):
+            status = "[red]failed[/red]" if result.get("error") else "done"
+            console.print(f"  • {item['type'].capitalize()} {item['id']} {status}")
+        
+        # Ranking streams each stage's result through a queue. Without batching, bullet generation
+        # for a stage starts immediately, so experiences are written while projects are still being
+        # ranked; with batching, all selected items are generated together once ranking finishes
+        ranked_items, bullet_results = generate_ranked_bullets(
+            ranking_agent,
+            resume_agent,
+            job_info,
+            user_id,
+            selection_limits,
+            job_technical_skills=job_technical_skills,
+            profile=profile,
+            item_map=item_map,
+            fresh_variant=fresh_variant,
+            batch=config.BATCH_BULLET_GENERATION,
+            max_concurrency=config.BULLET_GENERATION_CONCURRENCY,
+            on_ranked=report_ranking,
+            on_item_complete=report_progress
+        )
+        
+        ranked_experiences = ranked_items["experience"]
+        ranked_projects = ranked_items["project"]
         if not ranked_experiences and not ranked_projects:
             console.print("[red]No experiences or projects found for ranking[/red]")
             return
         
-        console.print(f"[green]✓ Ranked {len(ranked_experiences)} experiences and {len(ranked_projects)} projects[/green]")
-        
-        console.print("\n[yellow]Step 3: Generating bullet points...[/yellow]")
-        
-        # Generate bullet points
-        resume_agent = AgentFactory.create_agent("resume", temperature=1.0)
-        
-        experience_results = []
-        for i in range(min(num_experiences, len(ranked_experiences))):
-            experience_id = ranked_experiences[i][0]
-            experience_reason = ranked_experiences[i][1]
-            console.print(f"  • Processing experience {i+1}/{num_experiences}...")
-            
-            result = resume_agent.generate_bullet_points_for_experience(
-                experience_id, 
-                ranking_reason=experience_reason, 
-                job_info=job_info
-            )
-            experience_results.append(result)
-        
-        project_results = []
-        for i in range(min(num_projects, len(ranked_projects))):
-            project_id = ranked_projects[i][0]
-            project_reason = ranked_projects[i][1]
-            console.print(f"  • Processing project {i+1}/{num_projects}...")
-            
-            result = resume_agent.generate_bullet_points_for_project(
-                project_id, 
-                ranking_reason=project_reason, 
-                job_info=job_info
-            )
-            project_results.append(result)
+        experience_results = bullet_results["experience"]
+        project_results = bullet_results["project"]
         
         console.print("[green]✓ Bullet points generated successfully![/green]")
         
@@ -711,15 +723,63 @@ def generate_resume_from_job_url(user_id: int):
         console.print(f"\n[green]Resume generation complete![/green]")
         console.print(f"[dim]Log saved to: {log_filename}[/dim]")
         console.print(f"[dim]JSON saved to: {json_filename}[/dim]")
+        cache_stats = get_read_cache().stats()
+        console.print(f"[dim]Read cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hit_ratio']:.0%} hit ratio)[/dim]")
         
         # Ask if user wants to generate LaTeX resume
         if Confirm.ask("\nWould you like to generate a LaTeX resume file now?"):
-            write_resume_from_results(user_id, json_filename)
+            write_resume_from_results(user_id, json_filename, item_map=item_map, profile=profile)
         
     except Exception as e:
         console.print(f"[red]Error during resume generation: {str(e)}[/red]")
 
-def write_resume_from_results(user_id: int, results_file: Optional[str] = None):
+def analyze_job_urls_from_file():
+    """Analyze a list of job posting URLs from a text file (one URL per line)."""
+    console.print("\n[bold blue]Analyze Job URLs from File[/bold blue]")
+    
+    file_path = Prompt.ask("Enter the path to your URL list file")
+    
+    if not os.path.exists(file_path):
+        console.print(f"[red]File not found: {file_path}[/red]")
+        return
+    
+    with open(file_path, 'r', encoding='utf-8') as file:
+        job_urls = [line.strip() for line in file if line.strip() and not line.strip().startswith('#')]
+    
+    if not job_urls:
+        console.print("[yellow]No URLs found in the file.[/yellow]")
+        return
+    
+    max_concurrency = int(Prompt.ask("Maximum concurrent analyses", default="4"))
+    console.print(f"Found {len(job_urls)} URLs ({len(set(job_urls))} unique).")
+    
+    try:
+        job_analysis_agent = AgentFactory.create_agent("job_analysis", temperature=0.7)
+        
+        analyzed = 0
+        cached = 0
+        failed = 0
+        for result in job_analysis_agent.analyze_jobs(job_urls, max_concurrency=max_concurrency):
+            url = result["job_posting_url"]
+            if result.get("error"):
+                failed += 1
+                console.print(f"  [red]✗ {url}: {result['error']}[/red]")
+            elif result.get("job_exists_in_db"):
+                cached += 1
+                job_info = result["job_info"]
+                console.print(f"  [dim]• Already stored: {job_info.job_title} at {job_info.company_name}[/dim]")
+            else:
+                analyzed += 1
+                job_info = result["job_info"]
+                console.print(f"  [green]✓ {job_info.job_title} at {job_info.company_name}[/green]")
+        
+        console.print(f"\n[green]Analyzed {analyzed} new postings ({cached} already stored, {failed} failed).[/green]")
+        
+    except Exception as e:
+        console.print(f"[red]Error analyzing job URLs: {str(e)}[/red]")
+
+def write_resume_from_results(user_id: int, results_file: Optional[str] = None, item_map: Optional[Dict] = None,
+                              profile=None):
     """Write LaTeX resume from generated results JSON file."""
     console.print("\n[bold blue]Generate LaTeX Resume[/bold blue]")
     
@@ -763,7 +823,7 @@ def write_resume_from_results(user_id: int, results_file: Optional[str] = None):
         console.print("\n[yellow]Generating LaTeX resume...[/yellow]")
         
         resume_writer = ResumeWriter(template_path=template_path)
-        resume_writer.write_resume(user_id, output_file, exp_list, proj_list)
+        resume_writer.write_resume(user_id, output_file, exp_list, proj_list, item_map=item_map, profile=profile)
         
         console.print(f"[green]✓ LaTeX resume generated: {output_file}[/green]")
         console.print(f"[dim]Used {len(exp_list)} experiences and {len(proj_list)} projects[/dim]")
@@ -779,6 +839,36 @@ def write_resume_from_results(user_id: int, results_file: Optional[str] = None):
     except Exception as e:
         console.print(f"[red]Error generating resume: {str(e)}[/red]")
 
+def search_data(user_id: int):
+    """Search your experiences and projects and the stored job postings by keyword."""
+    console.print("\n[bold blue]Search[/bold blue]")
+    
+    query = Prompt.ask("Enter keywords")
+    match_any = Confirm.ask("Match any keyword instead of all of them?", default=False)
+    
+    experiences = experience_service.search_experiences(query, user_id=user_id, match_any=match_any)
+    projects = project_service.search_projects(query, user_id=user_id, match_any=match_any)
+    job_postings = job_posting_service.search_job_postings(query, limit=10, match_any=match_any)
+    
+    if not experiences and not projects and not job_postings:
+        console.print("[yellow]No matches found.[/yellow]")
+        return
+    
+    table = Table(title=f"Results for '{query}'")
+    table.add_column("Type", style="cyan")
+    table.add_column("ID", style="magenta")
+    table.add_column("Title", style="green")
+    table.add_column("Details", style="yellow")
+    
+    for exp in experiences:
+        table.add_row("Experience", str(exp.id), f"{exp.role_title} at {exp.company_name}", ", ".join(exp.tech_stack or []))
+    for proj in projects:
+        table.add_row("Project", str(proj.id), proj.project_name, ", ".join(proj.tech_stack or []))
+    for job_posting in job_postings:
+        table.add_row("Job Posting", str(job_posting.id), f"{job_posting.job_title} at {job_posting.company_name}", job_posting.job_posting_url)
+    
+    console.print(table)
+
 def list_generated_results():
     """List available resume generation result files."""
     console.print("\n[bold blue]Available Resume Generation Results[/bold blue]")
@@ -851,9 +941,11 @@ def main():
         console.print("10. Delete All My Data")
         console.print("11. Generate Resume from Job URL")
         console.print("12. List Generated Results")
-        console.print("13. Exit")
+        console.print("13. Analyze Job URLs from File")
+        console.print("14. Search My Data and Job Postings")
+        console.print("15. Exit")
         
-        choice = Prompt.ask("Enter your choice", choices=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13"])
+        choice = Prompt.ask("Enter your choice", choices=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15"])
         
         try:
             if choice == "1":
@@ -917,6 +1009,12 @@ def main():
                     write_resume_from_results(user_id, selected_file)
                 
             elif choice == "13":
+                analyze_job_urls_from_file()
+                
+            elif choice == "14":
+                search_data(user_id)
+                
+            elif choice == "15":
                 if Confirm.ask("Are you sure you want to exit?"):
                     console.print("[green]Thank you for using Resume Builder CLI![/green]")
                     break
@@ -1,21 +1,139 @@
-from sqlalchemy import create_engine
+import os
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Optional
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./resume.db"
+load_dotenv()
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+DEFAULT_DATABASE_URL = "sqlite:///./resume.db"
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL") or DEFAULT_DATABASE_URL
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# SQLite tuning: WAL lets readers run alongside a writer, and NORMAL sync is safe in WAL mode
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+}
+
+# Connection pool settings for server databases (PostgreSQL, MySQL, ...)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+# Async drivers used by AsyncDatabase for each backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+def _is_memory_database(database: Optional[str]) -> bool:
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+def _pool_options(engine_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    options.update(engine_kwargs)
+    return options
+
+def _apply_sqlite_pragmas_on_connect(sync_engine: Engine, url: URL):
+    pragmas = dict(SQLITE_PRAGMAS)
+    if _is_memory_database(url.database):
+        # In-memory databases have no journal file to switch to WAL
+        pragmas.pop("journal_mode")
+
+    @event.listens_for(sync_engine, "connect")
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def to_async_database_url(database_url: Optional[str] = None) -> URL:
+    """Switch a database URL to its async driver, e.g. ``sqlite://`` to ``sqlite+aiosqlite://``."""
+    url = make_url(database_url or SQLALCHEMY_DATABASE_URL)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver and url.get_driver_name() != driver:
+        url = url.set(drivername=f"{url.get_backend_name()}+{driver}")
+    return url
+
+def create_database_engine(database_url: Optional[str] = None, **engine_kwargs) -> Engine:
+    """Create the engine for a database URL (``DATABASE_URL`` by default).
+
+    SQLite engines get WAL journaling, synchronous=NORMAL, a busy timeout and
+    memory-mapped reads on every connection. Other databases get a connection
+    pool sized by ``DB_POOL_SIZE``/``DB_MAX_OVERFLOW`` with pre-ping enabled.
+    """
+    url = make_url(database_url or SQLALCHEMY_DATABASE_URL)
+
+    if url.get_backend_name() != "sqlite":
+        return create_engine(url, **_pool_options(engine_kwargs))
+
+    connect_args = {"check_same_thread": False, **engine_kwargs.pop("connect_args", {})}
+    new_engine = create_engine(url, connect_args=connect_args, **engine_kwargs)
+    _apply_sqlite_pragmas_on_connect(new_engine, url)
+    return new_engine
+
+def create_async_database_engine(database_url: Optional[str] = None, **engine_kwargs):
+    """Create an ``AsyncEngine`` for a database URL (``DATABASE_URL`` by default).
+
+    The URL is switched to its async driver (aiosqlite or asyncpg), and the engine
+    gets the same SQLite pragmas or pool settings as ``create_database_engine``.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = to_async_database_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return create_async_engine(url, **_pool_options(engine_kwargs))
+
+    new_engine = create_async_engine(url, **engine_kwargs)
+    _apply_sqlite_pragmas_on_connect(new_engine.sync_engine, url)
+    return new_engine
+
+engine = create_database_engine()
+
+# Services return rows after their session closes, so committed rows must stay loaded
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# One session per thread; each unit of work gets a fresh session and a pooled connection
+ScopedSession = scoped_session(SessionLocal)
 
 Base = declarative_base()
 
+def insert_returning_ids(session: Session, model, rows: List[Dict[str, Any]]) -> List[int]:
+    """Insert many rows in one statement and return their ids in input order.
+
+    Uses ``INSERT ... RETURNING`` where the database supports it, and falls back to
+    flushing ORM objects otherwise.
+    """
+    if not rows:
+        return []
+    if session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+        return list(session.scalars(statement, rows))
+    objects = [model(**row) for row in rows]
+    session.add_all(objects)
+    session.flush()
+    return [obj.id for obj in objects]
+
 class Database:
+    """Entry point for database sessions.
+
+    ``with db as session`` opens a unit of work: the calling thread gets its own
+    session, nested blocks in the same thread share it, and the session is closed
+    when the outermost block exits. Threads never share a session.
+    """
     _instance: Optional['Database'] = None
-    _session: Optional[Session] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -25,28 +143,123 @@ class Database:
     def __init__(self):
         if not hasattr(self, 'initialized'):
             self.initialized = True
-            self._session = None
+            self._local = threading.local()
 
     @property
     def session(self) -> Session:
-        if self._session is None:
-            self._session = SessionLocal()
-        return self._session
+        """Return the calling thread's current session."""
+        return ScopedSession()
 
     def close(self):
-        if self._session is not None:
-            self._session.close()
-            self._session = None
+        """Close the calling thread's session and return its connection to the pool."""
+        ScopedSession.remove()
+        self._local.depth = 0
+        self._local.tx_depth = 0
 
-    def __enter__(self):
-        return self.session
+    def __enter__(self) -> Session:
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        return ScopedSession()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        if exc_type is not None:
+            ScopedSession().rollback()
+        self._local.depth -= 1
+        if self._local.depth <= 0:
+            self.close()
+
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Run a transactional unit of work: commit on success, roll back on error.
+
+        Scopes nested in the same thread join the outermost one, which commits once.
+        Only scopes count towards that nesting: a scope opened inside a plain
+        ``with db`` block (e.g. while iterating a streaming query) still commits.
+        """
+        with self as session:
+            self._local.tx_depth = getattr(self._local, "tx_depth", 0) + 1
+            if self._local.tx_depth == 1:
+                self._local.after_commit = []
+            try:
+                yield session
+                if self._local.tx_depth == 1:
+                    session.commit()
+                    callbacks, self._local.after_commit = self._local.after_commit, []
+                    for callback in callbacks:
+                        callback()
+            except Exception:
+                session.rollback()
+                self._local.after_commit = []
+                raise
+            finally:
+                self._local.tx_depth -= 1
+
+    def run_after_commit(self, callback: Callable[[], Any]):
+        """Run ``callback`` once the calling thread's outermost ``session_scope`` commits.
+
+        Outside a scope it runs right away. Used to invalidate cached reads only when
+        the new data is visible to other threads, so they cannot re-cache old rows.
+        """
+        if getattr(self._local, "tx_depth", 0) > 0:
+            self._local.after_commit.append(callback)
+        else:
+            callback()
 
     @classmethod
     def get_instance(cls) -> 'Database':
         if cls._instance is None:
             cls._instance = cls()
         return cls._instance
-        
\ No newline at end of file
+
+class AsyncDatabase:
+    """Entry point for ``AsyncSession``s, used by the async services.
+
+    The async engine is created on first use, so the async drivers are only
+    needed by code that actually awaits the database.
+    """
+    _instance: Optional['AsyncDatabase'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AsyncDatabase, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+            self.engine = None
+            self._sessionmaker = None
+
+    def configure(self, database_url: Optional[str] = None, **engine_kwargs):
+        """Create the async engine for a database URL (``DATABASE_URL`` by default)."""
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        self.engine = create_async_database_engine(database_url, **engine_kwargs)
+        self._sessionmaker = async_sessionmaker(self.engine, autoflush=False, expire_on_commit=False)
+
+    def session(self):
+        """Return a new ``AsyncSession``; use it as ``async with db.session() as session``."""
+        if self._sessionmaker is None:
+            self.configure()
+        return self._sessionmaker()
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[Any]:
+        """Run a transactional unit of work: commit on success, roll back on error."""
+        async with self.session() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def dispose(self):
+        """Close all pooled connections of the async engine."""
+        if self.engine is not None:
+            await self.engine.dispose()
+
+    @classmethod
+    def get_instance(cls) -> 'AsyncDatabase':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
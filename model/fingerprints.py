@@ -0,0 +1,95 @@
+import hashlib
+import re
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy import Table, bindparam, or_, select, update
+from sqlalchemy.engine import Connection
+from model.schema import JobPostingDB
+
+FINGERPRINT_BITS = 64
+
+# Fingerprints are also stored as FINGERPRINT_BANDS indexed slices of BAND_BITS bits each
+FINGERPRINT_BANDS = 4
+BAND_BITS = FINGERPRINT_BITS // FINGERPRINT_BANDS
+BAND_COLUMNS = [f"fingerprint_band_{band}" for band in range(FINGERPRINT_BANDS)]
+
+# Maximum number of differing simhash bits for two postings to count as the same job
+NEAR_DUPLICATE_DISTANCE = 3
+
+def compute_content_fingerprint(text: str) -> str:
+    """Compute a 64-bit simhash of job text, returned as a hex string.
+
+    Postings whose text differs only slightly (dates, counters, footers) get
+    fingerprints that differ in a few bits.
+    """
+    words = re.findall(r"\w+", text.lower())
+    shingles = [" ".join(words[i:i + 3]) for i in range(max(len(words) - 2, 1))] if words else []
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.md5(shingle.encode("utf-8")).digest()[:8], "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = sum(1 << bit for bit in range(FINGERPRINT_BITS) if weights[bit] > 0)
+    return f"{fingerprint:016x}"
+
+def fingerprint_distance(first: str, second: str) -> int:
+    """Return the number of differing bits between two content fingerprints."""
+    return bin(int(first, 16) ^ int(second, 16)).count("1")
+
+def fingerprint_bands(content_fingerprint: Optional[str]) -> Dict[str, Optional[int]]:
+    """Split a fingerprint into the values of its band columns (all None without a fingerprint)."""
+    if not content_fingerprint:
+        return {column: None for column in BAND_COLUMNS}
+    value = int(content_fingerprint, 16)
+    mask = (1 << BAND_BITS) - 1
+    return {column: value >> (band * BAND_BITS) & mask for band, column in enumerate(BAND_COLUMNS)}
+
+def near_duplicate_candidates_select(content_fingerprint: str, max_distance: int = NEAR_DUPLICATE_DISTANCE):
+    """Select ``(id, content_fingerprint)`` of the postings that may be within ``max_distance`` bits.
+
+    Two fingerprints differing in fewer bits than there are bands agree exactly on at
+    least one band, so those searches only read rows sharing a band, through the band
+    indexes. Wider searches fall back to every fingerprinted posting.
+    """
+    statement = select(JobPostingDB.id, JobPostingDB.content_fingerprint).where(
+        JobPostingDB.content_fingerprint.isnot(None)
+    )
+    if max_distance < FINGERPRINT_BANDS:
+        statement = statement.where(or_(*[
+            getattr(JobPostingDB, column) == value
+            for column, value in fingerprint_bands(content_fingerprint).items()
+        ]))
+    return statement
+
+def closest_fingerprint(content_fingerprint: str, candidates: Iterable[Tuple[int, str]],
+                        max_distance: int = NEAR_DUPLICATE_DISTANCE) -> Optional[int]:
+    """Return the id of the candidate closest to ``content_fingerprint`` within ``max_distance`` bits."""
+    best_id, best_distance = None, max_distance + 1
+    for job_posting_id, fingerprint in candidates:
+        distance = fingerprint_distance(content_fingerprint, fingerprint)
+        if distance < best_distance:
+            best_id, best_distance = job_posting_id, distance
+    return best_id
+
+def band_existing_fingerprints(connection: Connection, table: Table) -> int:
+    """Fill in the band columns of every fingerprinted posting that has none; returns how many were filled.
+
+    Used when upgrading a database whose fingerprints predate the band columns.
+    """
+    rows = connection.execute(
+        select(table.c.id, table.c.content_fingerprint).where(
+            table.c.content_fingerprint.isnot(None), table.c[BAND_COLUMNS[0]].is_(None)
+        )
+    ).all()
+    if rows:
+        connection.execute(
+            update(table).where(table.c.id == bindparam("row_id")).values(
+                **{column: bindparam(f"row_{column}") for column in BAND_COLUMNS}
+            ),
+            [
+                {"row_id": row_id, **{f"row_{column}": value for column, value in fingerprint_bands(fingerprint).items()}}
+                for row_id, fingerprint in rows
+            ]
+        )
+    return len(rows)
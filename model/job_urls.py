@@ -0,0 +1,34 @@
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track how a posting was reached and never change its content
+TRACKING_PARAMS = {
+    "gclid", "fbclid", "msclkid", "ref", "referrer", "source", "src", "trk", "trackingid",
+    "jobfamilygroup", "locationhierarchy1", "locationhierarchy2", "locationcountry",
+    "workersubtype", "timetype", "lang", "locale",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+# Leading locale path segment such as "/en-US/" (used by Workday and others)
+LOCALE_SEGMENT = re.compile(r"^[a-z]{2}[-_][a-zA-Z]{2}$")
+
+def canonicalize_job_url(url: str) -> str:
+    """Normalize a job posting URL so that the same job always maps to the same string."""
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if segments and LOCALE_SEGMENT.match(segments[0]):
+        segments = segments[1:]
+    path = "/" + "/".join(segments)
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
@@ -0,0 +1,149 @@
+from functools import partial
+from typing import List, Optional, Tuple
+from sqlalchemy import MetaData, Table, UniqueConstraint, bindparam, inspect, select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable, DDLElement
+from model.database import Base, engine as default_engine
+from model.fingerprints import BAND_COLUMNS, band_existing_fingerprints
+from model.job_urls import canonicalize_job_url
+from model.search import FTS_COLUMNS, fts_create_statements, fts_rebuild_statement, fts_table_name
+from model.skills import rebuild_skill_index
+from model.versioning import CONTENT_HASH_FIELDS, hash_existing_rows
+
+# A migration step: (human readable description, DDL statement, SQL string or callable
+# taking the migration connection)
+MigrationStep = Tuple[str, object]
+
+# Tables filled from the tech stacks and job skills already stored in other tables
+SKILL_TABLES = {"skills", "item_skills", "job_skills"}
+
+def _index_existing_skills(connection: Connection):
+    session = Session(bind=connection)
+    rebuild_skill_index(session)
+    session.flush()
+
+def _canonicalize_existing_urls(connection: Connection, table: Table):
+    """Fill in canonical_url for job postings stored before the column existed.
+
+    canonical_url is unique, so when several old postings canonicalize to the same
+    URL only the oldest gets it; the others stay reachable by their exact URL.
+    content_fingerprint is not backfilled: it is a simhash of the scraped page,
+    which old rows do not keep, so it stays empty for them.
+    """
+    taken = set(connection.execute(select(table.c.canonical_url).where(table.c.canonical_url.isnot(None))).scalars())
+    rows = []
+    for row_id, url in connection.execute(
+        select(table.c.id, table.c.job_posting_url)
+        .where(table.c.canonical_url.is_(None), table.c.job_posting_url.isnot(None))
+        .order_by(table.c.id)
+    ):
+        canonical_url = canonicalize_job_url(url)
+        if canonical_url not in taken:
+            taken.add(canonical_url)
+            rows.append({"row_id": row_id, "row_url": canonical_url})
+    if rows:
+        connection.execute(
+            update(table).where(table.c.id == bindparam("row_id")).values(canonical_url=bindparam("row_url")),
+            rows
+        )
+
+def _add_column_sql(bind: Engine, table, column) -> str:
+    preparer = bind.dialect.identifier_preparer
+    column_type = column.type.compile(dialect=bind.dialect)
+    return f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}"
+
+def _create_unique_index_sql(bind: Engine, table, constraint: UniqueConstraint) -> Tuple[str, str]:
+    preparer = bind.dialect.identifier_preparer
+    columns = [column.name for column in constraint.columns]
+    name = constraint.name or f"uq_{table.name}_{'_'.join(columns)}"
+    column_list = ", ".join(preparer.quote(column) for column in columns)
+    return name, f"CREATE UNIQUE INDEX {preparer.quote(name)} ON {preparer.format_table(table)} ({column_list})"
+
+def plan_migrations(bind: Optional[Engine] = None, metadata: MetaData = Base.metadata) -> List[MigrationStep]:
+    """Compare the live database with the models and list the additive changes it needs.
+
+    Only changes that keep existing data are planned: missing tables, missing
+    columns (added as nullable) and missing indexes, including indexes backing
+    unique constraints. Columns are never dropped or altered. Derived data for
+    new tables and columns (full-text indexes, skill links, content hashes,
+    fingerprint bands) is filled in from the existing rows, including the
+    canonical URLs of old job postings (their content fingerprints stay empty).
+    """
+    bind = bind or default_engine
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    steps: List[MigrationStep] = []
+    backfill_steps: List[MigrationStep] = []
+
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            steps.append((f"create table {table.name}", CreateTable(table)))
+            steps.extend((f"create index {index.name}", CreateIndex(index)) for index in table.indexes)
+            continue
+
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing_columns:
+                steps.append((f"add column {table.name}.{column.name}", _add_column_sql(bind, table, column)))
+                if column.name == "content_hash" and table.name in CONTENT_HASH_FIELDS:
+                    backfill_steps.append((f"hash existing {table.name} rows", partial(hash_existing_rows, table=table)))
+                if table.name == "job_postings" and column.name == "canonical_url":
+                    backfill_steps.append(("canonicalize existing job posting URLs",
+                                           partial(_canonicalize_existing_urls, table=table)))
+                if table.name == "job_postings" and column.name == BAND_COLUMNS[0]:
+                    backfill_steps.append(("band existing job posting fingerprints",
+                                           partial(band_existing_fingerprints, table=table)))
+
+        existing_indexes = inspector.get_indexes(table.name)
+        indexed = {(tuple(index["column_names"]), bool(index["unique"])) for index in existing_indexes}
+        index_names = {index["name"] for index in existing_indexes}
+        # Unique constraints created with the table count as unique indexes
+        indexed |= {(tuple(constraint["column_names"]), True) for constraint in inspector.get_unique_constraints(table.name)}
+
+        # Model indexes, plus unique indexes standing in for constraints missing on old tables
+        wanted = [
+            (index.name, tuple(column.name for column in index.columns), bool(index.unique), CreateIndex(index))
+            for index in table.indexes
+        ]
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                name, statement = _create_unique_index_sql(bind, table, constraint)
+                wanted.append((name, tuple(column.name for column in constraint.columns), True, statement))
+
+        for name, columns, unique, statement in wanted:
+            if name in index_names or (columns, unique) in indexed:
+                continue
+            steps.append((f"create {'unique ' if unique else ''}index {name}", statement))
+            indexed.add((columns, unique))
+
+    # Full-text indexes are built from the rows already in their content tables
+    if bind.dialect.name == "sqlite":
+        for table_name in FTS_COLUMNS:
+            if table_name in metadata.tables and fts_table_name(table_name) not in existing_tables:
+                steps.extend((f"create full-text index {fts_table_name(table_name)}", statement)
+                             for statement in fts_create_statements(table_name))
+                steps.append((f"index existing {table_name} rows", fts_rebuild_statement(table_name)))
+
+    # Skill links are derived from JSON columns, so they are rebuilt in Python
+    if SKILL_TABLES <= set(metadata.tables) and not SKILL_TABLES <= existing_tables:
+        steps.append(("index existing skills", _index_existing_skills))
+    return steps + backfill_steps
+
+def run_migrations(bind: Optional[Engine] = None, metadata: MetaData = Base.metadata,
+                   dry_run: bool = False) -> List[str]:
+    """Apply the planned additive changes in one transaction and return their descriptions."""
+    bind = bind or default_engine
+    steps = plan_migrations(bind, metadata)
+    if dry_run or not steps:
+        return [description for description, _ in steps]
+
+    with bind.begin() as connection:
+        for description, statement in steps:
+            if isinstance(statement, DDLElement):
+                connection.execute(statement)
+            elif callable(statement):
+                statement(connection)
+            else:
+                connection.exec_driver_sql(statement)
+    return [description for description, _ in steps]
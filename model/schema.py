@@ -1,8 +1,10 @@
+from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel
-from sqlalchemy import JSON, Column, Integer, String, ForeignKey
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from model.database import Base
+from model.search import register_fts_tables
 
 class Experience(BaseModel):
     id: Optional[int] = None
@@ -15,6 +17,8 @@ class Experience(BaseModel):
     long_description: str
     short_description: str
     tech_stack: Optional[List[str]] = None
+    content_hash: Optional[str] = None
+    updated_at: Optional[datetime] = None
 
 class Project(BaseModel):
     id: Optional[int] = None
@@ -26,6 +30,8 @@ class Project(BaseModel):
     short_description: str
     tech_stack: Optional[List[str]] = None
     team_size: Optional[int] = 1
+    content_hash: Optional[str] = None
+    updated_at: Optional[datetime] = None
 
 class User(BaseModel):
     id: Optional[int] = None
@@ -41,6 +47,8 @@ class User(BaseModel):
     grad_year: Optional[str] = None
     experiences: Optional[List[Experience]] = None
     projects: Optional[List[Project]] = None
+    content_hash: Optional[str] = None
+    updated_at: Optional[datetime] = None
 
 class Company(BaseModel):
     name: str
@@ -64,6 +72,9 @@ class UserDB(Base):
     grade = Column(String, nullable=True)
     location = Column(String)
     grad_year = Column(String, nullable=True)
+    # SHA-256 of the content columns and time of the last write, set by the services
+    content_hash = Column(String, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
     experiences = relationship("ExperienceDB", back_populates="rel_user")
     projects = relationship("ProjectDB", back_populates="rel_user")
 
@@ -80,6 +91,8 @@ class ExperienceDB(Base):
     long_description = Column(String)
     short_description = Column(String)
     tech_stack = Column(JSON)
+    content_hash = Column(String, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
     rel_user = relationship("UserDB", back_populates="experiences")
 
 class ProjectDB(Base):
@@ -94,6 +107,8 @@ class ProjectDB(Base):
     short_description = Column(String)
     tech_stack = Column(JSON)
     team_size = Column(Integer, nullable=True)
+    content_hash = Column(String, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
     rel_user = relationship("UserDB", back_populates="projects")
 
 
@@ -101,7 +116,7 @@ class CompanyDB(Base):
     __tablename__ = "companies"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String)
+    name = Column(String, index=True)
     mission = Column(String)
     location = Column(String)
     website = Column(String)
@@ -117,12 +132,16 @@ class JobPosting(BaseModel):
     job_description: str
     job_qualifications: List[str]
     job_technical_skills: List[str]
+    content_fingerprint: Optional[str] = None
+    content_hash: Optional[str] = None
+    updated_at: Optional[datetime] = None
 
 class JobPostingDB(Base):
     __tablename__ = "job_postings"
 
     id=Column(Integer, primary_key=True, index=True)
-    job_posting_url=Column(String)
+    job_posting_url=Column(String, index=True)
+    canonical_url=Column(String, unique=True, index=True)
     company_name=Column(String)
     job_title=Column(String)
     job_location=Column(String)
@@ -130,3 +149,59 @@ class JobPostingDB(Base):
     job_description=Column(String)
     job_qualifications=Column(JSON)
     job_technical_skills=Column(JSON)
+    content_fingerprint=Column(String, index=True)
+    # 16-bit slices of content_fingerprint, indexed so near duplicates are found without a full scan
+    fingerprint_band_0=Column(Integer, index=True)
+    fingerprint_band_1=Column(Integer, index=True)
+    fingerprint_band_2=Column(Integer, index=True)
+    fingerprint_band_3=Column(Integer, index=True)
+    content_hash=Column(String, nullable=True)
+    updated_at=Column(DateTime, nullable=True)
+
+class BulletCacheDB(Base):
+    __tablename__ = "bullet_cache"
+    __table_args__ = (UniqueConstraint("cache_key", "variant"),)
+
+    id=Column(Integer, primary_key=True, index=True)
+    # Hash of (item content, job context, ranking reason, prompt version)
+    cache_key=Column(String, index=True)
+    variant=Column(Integer, default=0)
+    item_type=Column(String)
+    bullet_points=Column(JSON)
+
+class SkillDB(Base):
+    __tablename__ = "skills"
+
+    id=Column(Integer, primary_key=True, index=True)
+    # Lowercased, whitespace-collapsed name used for matching ("react native")
+    name=Column(String, unique=True, index=True)
+    # Spelling the skill was first stored with ("React Native")
+    display_name=Column(String)
+
+class ItemSkillDB(Base):
+    """Links an experience or project (``item_type``/``item_id``) to each skill of its tech stack."""
+    __tablename__ = "item_skills"
+    __table_args__ = (
+        UniqueConstraint("item_type", "item_id", "skill_id"),
+        Index("ix_item_skills_skill_item", "skill_id", "item_type", "item_id"),
+    )
+
+    id=Column(Integer, primary_key=True, index=True)
+    item_type=Column(String)
+    item_id=Column(Integer)
+    skill_id=Column(Integer, ForeignKey("skills.id"))
+
+class JobSkillDB(Base):
+    """Links a job posting to each of its technical skills."""
+    __tablename__ = "job_skills"
+    __table_args__ = (
+        UniqueConstraint("job_posting_id", "skill_id"),
+        Index("ix_job_skills_skill_job_posting", "skill_id", "job_posting_id"),
+    )
+
+    id=Column(Integer, primary_key=True, index=True)
+    job_posting_id=Column(Integer, ForeignKey("job_postings.id"))
+    skill_id=Column(Integer, ForeignKey("skills.id"))
+
+# Full-text search indexes over experiences, projects and job postings (SQLite FTS5)
+register_fts_tables(Base.metadata)
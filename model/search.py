@@ -0,0 +1,105 @@
+import re
+from typing import Dict, List, Optional
+from sqlalchemy import DDL, JSON, MetaData, String, and_, cast, event, or_, text
+from sqlalchemy.orm import Session
+
+# Columns indexed for full-text search, per content table. JSON columns such as
+# tech_stack are indexed as their stored text, which the tokenizer splits into words.
+FTS_COLUMNS: Dict[str, List[str]] = {
+    "experiences": ["company_name", "role_title", "short_description", "long_description", "tech_stack"],
+    "projects": ["project_name", "short_description", "long_description", "tech_stack"],
+    "job_postings": ["job_title", "company_name", "job_description", "job_qualifications", "job_technical_skills"],
+}
+
+def fts_table_name(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+def fts_create_statements(table_name: str) -> List[str]:
+    """Return the DDL for an external-content FTS5 table and the triggers keeping it in sync."""
+    fts = fts_table_name(table_name)
+    columns = FTS_COLUMNS[table_name]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column_list}, content='{table_name}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+    ]
+
+def fts_rebuild_statement(table_name: str) -> str:
+    """Return the statement that re-indexes every existing row of a content table."""
+    fts = fts_table_name(table_name)
+    return f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"
+
+def register_fts_tables(metadata: MetaData):
+    """Make create_all/drop_all create and drop the FTS tables with their content tables on SQLite."""
+    for table_name in FTS_COLUMNS:
+        table = metadata.tables[table_name]
+        for statement in fts_create_statements(table_name):
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+        event.listen(table, "after_drop",
+                     DDL(f"DROP TABLE IF EXISTS {fts_table_name(table_name)}").execute_if(dialect="sqlite"))
+
+def build_match_query(query: str, match_any: bool = False) -> str:
+    """Turn free text into an FTS5 query: every word quoted, combined with AND (or OR)."""
+    words = re.findall(r"\w+", query.lower())
+    return (" OR " if match_any else " ").join(f'"{word}"' for word in words)
+
+def _searchable_column(model, name: str):
+    column = getattr(model, name)
+    # JSON columns have no LIKE operator (PostgreSQL rejects json ILIKE text); search their text
+    if isinstance(column.type, JSON):
+        return cast(column, String)
+    return column
+
+def like_condition(model, query: str, match_any: bool = False):
+    """Build the LIKE fallback condition used on databases without FTS5."""
+    columns = [_searchable_column(model, name) for name in FTS_COLUMNS[model.__tablename__]]
+    conditions = [or_(*[column.ilike(f"%{word}%") for column in columns]) for word in re.findall(r"\w+", query.lower())]
+    return or_(*conditions) if match_any else and_(*conditions)
+
+def search_ids(session: Session, model, query: str, limit: int = 20, match_any: bool = False,
+               user_id: Optional[int] = None, exclude_id: Optional[int] = None) -> List[int]:
+    """Return the ids of the rows of ``model`` matching ``query``, best match first.
+
+    Uses the table's FTS5 index (ranked by bm25) on SQLite and falls back to an
+    unranked LIKE scan on other databases.
+    """
+    table_name = model.__tablename__
+    match_query = build_match_query(query, match_any)
+    if not match_query:
+        return []
+
+    if session.get_bind().dialect.name != "sqlite":
+        statement = session.query(model.id).filter(like_condition(model, query, match_any))
+        if user_id is not None:
+            statement = statement.filter(model.user_id == user_id)
+        if exclude_id is not None:
+            statement = statement.filter(model.id != exclude_id)
+        return [row_id for row_id, in statement.limit(limit)]
+
+    fts = fts_table_name(table_name)
+    filters = ""
+    params = {"query": match_query, "limit": limit}
+    if user_id is not None:
+        filters += f" AND {table_name}.user_id = :user_id"
+        params["user_id"] = user_id
+    if exclude_id is not None:
+        filters += f" AND {table_name}.id != :exclude_id"
+        params["exclude_id"] = exclude_id
+    rows = session.execute(text(
+        f"SELECT {table_name}.id FROM {fts} JOIN {table_name} ON {table_name}.id = {fts}.rowid "
+        f"WHERE {fts} MATCH :query{filters} ORDER BY {fts}.rank LIMIT :limit"
+    ), params)
+    return [row_id for row_id, in rows]
+
+def order_by_ids(rows: list, ids: List[int]) -> list:
+    """Sort rows loaded with an IN query back into the order of ``ids``."""
+    position = {row_id: index for index, row_id in enumerate(ids)}
+    return sorted(rows, key=lambda row: position[row.id])
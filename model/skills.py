@@ -0,0 +1,145 @@
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+from model.database import insert_returning_ids
+from model.schema import ExperienceDB, ItemSkillDB, JobPostingDB, JobSkillDB, ProjectDB, SkillDB
+
+# Item types stored in item_skills, with the table each item id refers to
+ITEM_MODELS = {
+    "experience": ExperienceDB,
+    "project": ProjectDB,
+}
+
+def normalize_skill(name: str) -> str:
+    """Return the lookup key of a skill name: lowercased with whitespace collapsed."""
+    return " ".join(name.split()).lower()
+
+def _unique_skills(names: Optional[Iterable[str]]) -> Dict[str, str]:
+    """Map each distinct normalized name to the first spelling it was given in."""
+    skills = {}
+    for name in names or []:
+        if isinstance(name, str) and name.strip():
+            skills.setdefault(normalize_skill(name), name.strip())
+    return skills
+
+def get_skill_ids(session: Session, names: Iterable[str], create: bool = True) -> Dict[str, int]:
+    """Return the ids of the given skills keyed by normalized name, creating missing ones if ``create``."""
+    skills = _unique_skills(names)
+    if not skills:
+        return {}
+    ids = dict(session.execute(select(SkillDB.name, SkillDB.id).where(SkillDB.name.in_(skills))).all())
+    missing = [{"name": key, "display_name": name} for key, name in skills.items() if key not in ids]
+    if missing and create:
+        new_ids = insert_returning_ids(session, SkillDB, missing)
+        ids.update(zip([row["name"] for row in missing], new_ids))
+    return ids
+
+def _link_rows(session: Session, skills_by_owner: Dict[int, Optional[List[str]]], owner_column: str, **values) -> List[dict]:
+    skill_ids = get_skill_ids(session, [name for names in skills_by_owner.values() for name in names or []])
+    return [
+        {**values, owner_column: owner_id, "skill_id": skill_ids[key]}
+        for owner_id, names in skills_by_owner.items()
+        for key in _unique_skills(names)
+    ]
+
+def set_item_skills(session: Session, item_type: str, skills_by_item: Dict[int, Optional[List[str]]]):
+    """Replace the skills linked to each item with its tech stack, in one DELETE and one INSERT."""
+    if not skills_by_item:
+        return
+    clear_item_skills(session, item_type, list(skills_by_item))
+    rows = _link_rows(session, skills_by_item, "item_id", item_type=item_type)
+    if rows:
+        session.execute(insert(ItemSkillDB), rows)
+
+def clear_item_skills(session: Session, item_type: str, item_ids):
+    """Unlink all skills from the given items; ``item_ids`` may be a list or a select of ids."""
+    session.execute(
+        delete(ItemSkillDB).where(ItemSkillDB.item_type == item_type, ItemSkillDB.item_id.in_(item_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+def set_job_skills(session: Session, skills_by_job_posting: Dict[int, Optional[List[str]]]):
+    """Replace the technical skills linked to each job posting, in one DELETE and one INSERT."""
+    if not skills_by_job_posting:
+        return
+    session.execute(
+        delete(JobSkillDB).where(JobSkillDB.job_posting_id.in_(list(skills_by_job_posting)))
+        .execution_options(synchronize_session=False)
+    )
+    rows = _link_rows(session, skills_by_job_posting, "job_posting_id")
+    if rows:
+        session.execute(insert(JobSkillDB), rows)
+
+def user_items_condition(user_id: int):
+    """Condition on item_skills rows selecting the items (experiences and projects) of one user."""
+    return or_(*[
+        and_(ItemSkillDB.item_type == item_type, ItemSkillDB.item_id.in_(select(model.id).where(model.user_id == user_id)))
+        for item_type, model in ITEM_MODELS.items()
+    ])
+
+def user_skill_ids(user_id: int):
+    """Select the distinct ids of the skills used anywhere in a user's profile."""
+    return select(ItemSkillDB.skill_id).where(user_items_condition(user_id)).distinct()
+
+def items_with_skill_select(item_type: str, skill: str, user_id: Optional[int] = None):
+    """Select the experiences or projects whose tech stack contains ``skill``."""
+    model = ITEM_MODELS[item_type]
+    statement = select(model).join(
+        ItemSkillDB, and_(ItemSkillDB.item_type == item_type, ItemSkillDB.item_id == model.id)
+    ).join(SkillDB, SkillDB.id == ItemSkillDB.skill_id).where(SkillDB.name == normalize_skill(skill))
+    if user_id is not None:
+        statement = statement.where(model.user_id == user_id)
+    return statement.order_by(model.id)
+
+def job_postings_with_skill_select(skill: str):
+    """Select the job postings listing ``skill`` among their technical skills."""
+    return select(JobPostingDB).join(JobSkillDB, JobSkillDB.job_posting_id == JobPostingDB.id).join(
+        SkillDB, SkillDB.id == JobSkillDB.skill_id
+    ).where(SkillDB.name == normalize_skill(skill)).order_by(JobPostingDB.id)
+
+def job_skills_select(user_id: int, job_posting_id: int, matched: bool = True):
+    """Select the display names of a posting's skills the user has (or, with ``matched=False``, lacks)."""
+    in_profile = SkillDB.id.in_(user_skill_ids(user_id))
+    return select(SkillDB.display_name).join(JobSkillDB, JobSkillDB.skill_id == SkillDB.id).where(
+        JobSkillDB.job_posting_id == job_posting_id, in_profile if matched else ~in_profile
+    ).order_by(SkillDB.name)
+
+def item_overlaps_select(user_id: int, job_posting_id: int):
+    """Select ``(item_type, item_id, overlap)`` for each of a user's items sharing skills with a posting.
+
+    Items sharing the most skills come first.
+    """
+    overlap = func.count(JobSkillDB.skill_id).label("overlap")
+    return select(ItemSkillDB.item_type, ItemSkillDB.item_id, overlap).join(
+        JobSkillDB, and_(JobSkillDB.skill_id == ItemSkillDB.skill_id, JobSkillDB.job_posting_id == job_posting_id)
+    ).where(user_items_condition(user_id)).group_by(
+        ItemSkillDB.item_type, ItemSkillDB.item_id
+    ).order_by(overlap.desc(), ItemSkillDB.item_type, ItemSkillDB.item_id)
+
+def job_posting_overlaps_select(user_id: int, limit: int = 10):
+    """Select ``(JobPostingDB, overlap)`` for the postings sharing the most skills with a user's profile."""
+    overlap = func.count(JobSkillDB.skill_id).label("overlap")
+    return select(JobPostingDB, overlap).join(JobSkillDB, JobSkillDB.job_posting_id == JobPostingDB.id).where(
+        JobSkillDB.skill_id.in_(user_skill_ids(user_id))
+    ).group_by(JobPostingDB.id).order_by(overlap.desc(), JobPostingDB.id).limit(limit)
+
+def rebuild_skill_index(session: Session) -> Dict[str, int]:
+    """Re-derive every item and job skill link from the stored tech stacks and job skills.
+
+    Used after upgrading a database whose rows predate the skill tables.
+    """
+    session.execute(delete(ItemSkillDB))
+    session.execute(delete(JobSkillDB))
+    counts = {}
+    for item_type, model in ITEM_MODELS.items():
+        skills_by_item = dict(session.execute(select(model.id, model.tech_stack)).all())
+        rows = _link_rows(session, skills_by_item, "item_id", item_type=item_type)
+        if rows:
+            session.execute(insert(ItemSkillDB), rows)
+        counts[f"{item_type}s"] = len(skills_by_item)
+    skills_by_job_posting = dict(session.execute(select(JobPostingDB.id, JobPostingDB.job_technical_skills)).all())
+    rows = _link_rows(session, skills_by_job_posting, "job_posting_id")
+    if rows:
+        session.execute(insert(JobSkillDB), rows)
+    counts["job_postings"] = len(skills_by_job_posting)
+    return counts
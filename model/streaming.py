@@ -0,0 +1,42 @@
+from typing import Any, Iterator, List, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Rows fetched from the cursor at a time when streaming
+DEFAULT_BATCH_SIZE = 1000
+
+def build_select(model, columns: Optional[Sequence[str]] = None, after_id: Optional[int] = None):
+    """Select whole rows of ``model`` (or only ``columns``) in id order, optionally after an id.
+
+    Projected selects return lightweight ``Row`` tuples with attribute access, so large
+    text and JSON columns are only read when asked for. The id is always included.
+    """
+    if columns:
+        names = ["id"] + [name for name in columns if name != "id"]
+        statement = select(*[getattr(model, name) for name in names])
+    else:
+        statement = select(model)
+    if after_id is not None:
+        statement = statement.where(model.id > after_id)
+    return statement.order_by(model.id)
+
+def stream_rows(session: Session, model, columns: Optional[Sequence[str]] = None,
+                batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+    """Iterate over every row of ``model`` while holding at most ``batch_size`` rows in memory.
+
+    Uses ``yield_per``, which also asks drivers that support it for a server-side cursor.
+    """
+    result = session.execute(build_select(model, columns).execution_options(yield_per=batch_size))
+    rows = result.scalars() if not columns else result
+    for partition in rows.partitions():
+        yield from partition
+
+def keyset_page(session: Session, model, after_id: Optional[int] = None, limit: int = 100,
+                columns: Optional[Sequence[str]] = None) -> List[Any]:
+    """Return up to ``limit`` rows with an id greater than ``after_id``.
+
+    Pass the id of the last row to get the next page; unlike OFFSET, every page
+    costs one index seek however deep into the table it is.
+    """
+    result = session.execute(build_select(model, columns, after_id).limit(limit))
+    return list(result.scalars() if not columns else result)
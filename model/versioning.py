@@ -0,0 +1,59 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping
+from sqlalchemy import Table, bindparam, select, update
+from sqlalchemy.engine import Connection
+
+# Columns covered by each table's content hash. Ids, foreign keys and bookkeeping
+# columns are left out, so the hash only changes when the content does.
+CONTENT_HASH_FIELDS: Dict[str, List[str]] = {
+    "users": ["name", "email", "phone", "personality", "education", "degree", "major", "grade", "location", "grad_year"],
+    "experiences": ["company_name", "role_title", "company_location", "start_date", "end_date",
+                    "long_description", "short_description", "tech_stack"],
+    "projects": ["project_name", "start_date", "end_date", "long_description", "short_description",
+                 "tech_stack", "team_size"],
+    "job_postings": ["company_name", "job_title", "job_location", "job_type", "job_description",
+                     "job_qualifications", "job_technical_skills"],
+}
+
+def compute_content_hash(table_name: str, values: Mapping[str, Any]) -> str:
+    """Return a SHA-256 hex digest of a row's content columns, stable across processes."""
+    content = [values.get(field) for field in CONTENT_HASH_FIELDS[table_name]]
+    payload = json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the form SQLite stores and returns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def stamp_row(table_name: str, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Set ``content_hash`` and ``updated_at`` on a row dict about to be inserted, and return it."""
+    row["content_hash"] = compute_content_hash(table_name, row)
+    row["updated_at"] = utcnow()
+    return row
+
+def touch(db_object):
+    """Recompute ``content_hash`` and bump ``updated_at`` on an ORM object after it was modified."""
+    table_name = db_object.__tablename__
+    db_object.content_hash = compute_content_hash(
+        table_name, {field: getattr(db_object, field) for field in CONTENT_HASH_FIELDS[table_name]}
+    )
+    db_object.updated_at = utcnow()
+
+def hash_existing_rows(connection: Connection, table: Table) -> int:
+    """Fill in the content hash of every row of ``table`` that has none; returns how many were hashed.
+
+    Used when upgrading a database whose rows predate the column; ``updated_at`` stays
+    empty for them since the time of their last change is unknown.
+    """
+    fields = CONTENT_HASH_FIELDS[table.name]
+    rows = connection.execute(
+        select(table.c.id, *[table.c[field] for field in fields]).where(table.c.content_hash.is_(None))
+    ).mappings().all()
+    if rows:
+        connection.execute(
+            update(table).where(table.c.id == bindparam("row_id")).values(content_hash=bindparam("row_hash")),
+            [{"row_id": row["id"], "row_hash": compute_content_hash(table.name, row)} for row in rows]
+        )
+    return len(rows)
@@ -0,0 +1,519 @@
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.orm import selectinload
+from model.schema import (
+    User, UserDB, Experience, ExperienceDB, Project, ProjectDB,
+    JobPosting, JobPostingDB, Company, CompanyDB, SkillDB
+)
+from model.database import AsyncDatabase, insert_returning_ids
+from model.search import order_by_ids, search_ids
+from model.skills import (
+    clear_item_skills, item_overlaps_select, items_with_skill_select, job_posting_overlaps_select,
+    job_postings_with_skill_select, job_skills_select, rebuild_skill_index, set_item_skills, set_job_skills
+)
+from model.streaming import DEFAULT_BATCH_SIZE, build_select
+from model.versioning import touch
+from services.read_cache import get_read_cache
+from services.user import UserService
+from services.experience import ExperienceService
+from services.project import ProjectService
+from services.job_posting import (
+    JobPostingService, NEAR_DUPLICATE_DISTANCE, canonicalize_job_url, closest_fingerprint,
+    near_duplicate_candidates_select
+)
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+# Async twins of the services in this package. Each class exposes the same methods
+# as its synchronous counterpart, as coroutines running on an AsyncSession, so async
+# agent graphs and API handlers can await database reads without blocking the loop.
+# Reads go straight to the database, but writes invalidate the process-wide read
+# cache after they commit, so the synchronous services never serve stale rows.
+
+async def _stream_rows(session, model, columns: Optional[Sequence[str]], batch_size: int) -> AsyncIterator[Any]:
+    result = await session.stream(build_select(model, columns).execution_options(yield_per=batch_size))
+    rows = result.scalars() if not columns else result
+    async for partition in rows.partitions():
+        for row in partition:
+            yield row
+
+async def _keyset_page(session, model, after_id: Optional[int], limit: int,
+                       columns: Optional[Sequence[str]]) -> List[Any]:
+    result = await session.execute(build_select(model, columns, after_id).limit(limit))
+    return list(result.scalars() if not columns else result)
+
+class AsyncUserService:
+    def __init__(self):
+        self.db = AsyncDatabase.get_instance()
+        self.cache = get_read_cache()
+
+    async def create_user(self, user: User) -> UserDB:
+        async with self.db.session() as session:
+            db_user = UserDB(**UserService._to_row(user))
+            session.add(db_user)
+            await session.commit()
+            await session.refresh(db_user)
+            return db_user
+
+    async def get_user(self, user_id: int) -> Optional[UserDB]:
+        async with self.db.session() as session:
+            return await session.scalar(select(UserDB).where(UserDB.id == user_id))
+
+    async def get_user_profile(self, user_id: int) -> Optional[UserDB]:
+        """Load a user together with all experiences and projects as a detached snapshot."""
+        async with self.db.session() as session:
+            return await session.scalar(select(UserDB).options(
+                selectinload(UserDB.experiences),
+                selectinload(UserDB.projects)
+            ).where(UserDB.id == user_id))
+
+    async def get_user_by_email(self, email: str) -> Optional[UserDB]:
+        async with self.db.session() as session:
+            return await session.scalar(select(UserDB).where(UserDB.email == email))
+
+    async def get_all_users(self) -> List[UserDB]:
+        async with self.db.session() as session:
+            return list(await session.scalars(select(UserDB)))
+
+    async def update_user(self, user_id: int, user_data: User) -> Optional[UserDB]:
+        async with self.db.session() as session:
+            db_user = await session.get(UserDB, user_id)
+            if db_user:
+                for key, value in user_data.dict(exclude_unset=True).items():
+                    setattr(db_user, key, value)
+                touch(db_user)
+                await session.commit()
+                await session.refresh(db_user)
+                self.cache.invalidate("user", user_id)
+            return db_user
+
+    async def delete_user(self, user_id: int) -> bool:
+        async with self.db.session() as session:
+            db_user = await session.get(UserDB, user_id)
+            if db_user:
+                await session.delete(db_user)
+                await session.commit()
+                self.cache.invalidate("user", user_id)
+                return True
+            return False
+
+    async def purge_user(self, user_id: int) -> Dict[str, int]:
+        """Delete a user with all of their experiences and projects in one transaction."""
+        async with self.db.session_scope() as session:
+            for item_type, model in [("experience", ExperienceDB), ("project", ProjectDB)]:
+                await session.run_sync(clear_item_skills, item_type, select(model.id).where(model.user_id == user_id))
+            counts = {}
+            for name, model, column in [
+                ("experiences", ExperienceDB, ExperienceDB.user_id),
+                ("projects", ProjectDB, ProjectDB.user_id),
+                ("users", UserDB, UserDB.id),
+            ]:
+                result = await session.execute(
+                    delete(model).where(column == user_id).execution_options(synchronize_session=False)
+                )
+                counts[name] = result.rowcount
+        self.cache.invalidate_where("experience", lambda experience: experience.user_id == user_id)
+        self.cache.invalidate_where("project", lambda project: project.user_id == user_id)
+        self.cache.invalidate("user", user_id)
+        return counts
+
+class AsyncExperienceService:
+    def __init__(self):
+        self.db = AsyncDatabase.get_instance()
+        self.cache = get_read_cache()
+
+    async def create_experience(self, experience: Experience) -> ExperienceDB:
+        async with self.db.session() as session:
+            db_experience = ExperienceDB(**ExperienceService._to_row(experience))
+            session.add(db_experience)
+            await session.flush()
+            await session.run_sync(set_item_skills, "experience", {db_experience.id: db_experience.tech_stack})
+            await session.commit()
+            await session.refresh(db_experience)
+            return db_experience
+
+    async def create_experiences(self, experiences: List[Experience]) -> List[int]:
+        """Insert many experiences in one statement and transaction, returning their ids in order."""
+        rows = [ExperienceService._to_row(experience) for experience in experiences]
+        async with self.db.session_scope() as session:
+            ids = await session.run_sync(insert_returning_ids, ExperienceDB, rows)
+            await session.run_sync(set_item_skills, "experience", {id: experience.tech_stack for id, experience in zip(ids, experiences)})
+            return ids
+
+    async def get_experience(self, experience_id: int) -> Optional[ExperienceDB]:
+        async with self.db.session() as session:
+            return await session.get(ExperienceDB, experience_id)
+
+    async def get_experiences_by_ids(self, experience_ids: List[int]) -> List[ExperienceDB]:
+        """Fetch several experiences with a single IN query."""
+        if not experience_ids:
+            return []
+        async with self.db.session() as session:
+            return list(await session.scalars(select(ExperienceDB).where(ExperienceDB.id.in_(set(experience_ids)))))
+
+    async def search_experiences(self, query: str, user_id: Optional[int] = None, limit: int = 20,
+                                 match_any: bool = False) -> List[ExperienceDB]:
+        """Full-text search over experiences, best match first."""
+        async with self.db.session() as session:
+            ids = await session.run_sync(search_ids, ExperienceDB, query, limit=limit, match_any=match_any, user_id=user_id)
+        return order_by_ids(await self.get_experiences_by_ids(ids), ids)
+
+    async def get_user_experiences(self, user_id: int) -> List[ExperienceDB]:
+        async with self.db.session() as session:
+            return list(await session.scalars(select(ExperienceDB).where(ExperienceDB.user_id == user_id)))
+
+    async def update_experience(self, experience_id: int, experience_data: Experience) -> Optional[ExperienceDB]:
+        async with self.db.session() as session:
+            db_experience = await session.get(ExperienceDB, experience_id)
+            if db_experience:
+                values = experience_data.dict(exclude_unset=True)
+                for key, value in values.items():
+                    setattr(db_experience, key, value)
+                touch(db_experience)
+                if "tech_stack" in values:
+                    await session.run_sync(set_item_skills, "experience", {experience_id: db_experience.tech_stack})
+                await session.commit()
+                await session.refresh(db_experience)
+                self.cache.invalidate("experience", experience_id)
+            return db_experience
+
+    async def delete_experience(self, experience_id: int) -> bool:
+        async with self.db.session() as session:
+            db_experience = await session.get(ExperienceDB, experience_id)
+            if db_experience:
+                await session.run_sync(clear_item_skills, "experience", [experience_id])
+                await session.delete(db_experience)
+                await session.commit()
+                self.cache.invalidate("experience", experience_id)
+                return True
+            return False
+
+    async def count_user_experiences(self, user_id: int) -> int:
+        async with self.db.session() as session:
+            return await session.scalar(select(func.count(ExperienceDB.id)).where(ExperienceDB.user_id == user_id))
+
+    async def delete_user_experiences(self, user_id: int) -> int:
+        """Delete all of a user's experiences with one DELETE statement and return how many were removed."""
+        async with self.db.session_scope() as session:
+            await session.run_sync(clear_item_skills, "experience", select(ExperienceDB.id).where(ExperienceDB.user_id == user_id))
+            result = await session.execute(
+                delete(ExperienceDB).where(ExperienceDB.user_id == user_id).execution_options(synchronize_session=False)
+            )
+        self.cache.invalidate_where("experience", lambda experience: experience.user_id == user_id)
+        return result.rowcount
+
+class AsyncProjectService:
+    def __init__(self):
+        self.db = AsyncDatabase.get_instance()
+        self.cache = get_read_cache()
+
+    async def create_project(self, project: Project) -> ProjectDB:
+        async with self.db.session() as session:
+            db_project = ProjectDB(**ProjectService._to_row(project))
+            session.add(db_project)
+            await session.flush()
+            await session.run_sync(set_item_skills, "project", {db_project.id: db_project.tech_stack})
+            await session.commit()
+            await session.refresh(db_project)
+            return db_project
+
+    async def create_projects(self, projects: List[Project]) -> List[int]:
+        """Insert many projects in one statement and transaction, returning their ids in order."""
+        rows = [ProjectService._to_row(project) for project in projects]
+        async with self.db.session_scope() as session:
+            ids = await session.run_sync(insert_returning_ids, ProjectDB, rows)
+            await session.run_sync(set_item_skills, "project", {id: project.tech_stack for id, project in zip(ids, projects)})
+            return ids
+
+    async def get_project(self, project_id: int) -> Optional[ProjectDB]:
+        async with self.db.session() as session:
+            return await session.get(ProjectDB, project_id)
+
+    async def get_projects_by_ids(self, project_ids: List[int]) -> List[ProjectDB]:
+        """Fetch several projects with a single IN query."""
+        if not project_ids:
+            return []
+        async with self.db.session() as session:
+            return list(await session.scalars(select(ProjectDB).where(ProjectDB.id.in_(set(project_ids)))))
+
+    async def search_projects(self, query: str, user_id: Optional[int] = None, limit: int = 20,
+                              match_any: bool = False) -> List[ProjectDB]:
+        """Full-text search over projects, best match first."""
+        async with self.db.session() as session:
+            ids = await session.run_sync(search_ids, ProjectDB, query, limit=limit, match_any=match_any, user_id=user_id)
+        return order_by_ids(await self.get_projects_by_ids(ids), ids)
+
+    async def get_user_projects(self, user_id: int) -> List[ProjectDB]:
+        async with self.db.session() as session:
+            return list(await session.scalars(select(ProjectDB).where(ProjectDB.user_id == user_id)))
+
+    async def update_project(self, project_id: int, project_data: Project) -> Optional[ProjectDB]:
+        async with self.db.session() as session:
+            db_project = await session.get(ProjectDB, project_id)
+            if db_project:
+                values = project_data.dict(exclude_unset=True)
+                for key, value in values.items():
+                    setattr(db_project, key, value)
+                touch(db_project)
+                if "tech_stack" in values:
+                    await session.run_sync(set_item_skills, "project", {project_id: db_project.tech_stack})
+                await session.commit()
+                await session.refresh(db_project)
+                self.cache.invalidate("project", project_id)
+            return db_project
+
+    async def delete_project(self, project_id: int) -> bool:
+        async with self.db.session() as session:
+            db_project = await session.get(ProjectDB, project_id)
+            if db_project:
+                await session.run_sync(clear_item_skills, "project", [project_id])
+                await session.delete(db_project)
+                await session.commit()
+                self.cache.invalidate("project", project_id)
+                return True
+            return False
+
+    async def count_user_projects(self, user_id: int) -> int:
+        async with self.db.session() as session:
+            return await session.scalar(select(func.count(ProjectDB.id)).where(ProjectDB.user_id == user_id))
+
+    async def delete_user_projects(self, user_id: int) -> int:
+        """Delete all of a user's projects with one DELETE statement and return how many were removed."""
+        async with self.db.session_scope() as session:
+            await session.run_sync(clear_item_skills, "project", select(ProjectDB.id).where(ProjectDB.user_id == user_id))
+            result = await session.execute(
+                delete(ProjectDB).where(ProjectDB.user_id == user_id).execution_options(synchronize_session=False)
+            )
+        self.cache.invalidate_where("project", lambda project: project.user_id == user_id)
+        return result.rowcount
+
+class AsyncJobPostingService:
+    def __init__(self):
+        self.db = AsyncDatabase.get_instance()
+        self.cache = get_read_cache()
+
+    async def create_job_posting(self, job_posting: JobPosting) -> JobPostingDB:
+        async with self.db.session() as session:
+            db_job_posting = JobPostingService._to_db(job_posting)
+            session.add(db_job_posting)
+            await session.flush()
+            await session.run_sync(set_job_skills, {db_job_posting.id: db_job_posting.job_technical_skills})
+            await session.commit()
+            await session.refresh(db_job_posting)
+            self.cache.invalidate("job_posting_url", db_job_posting.canonical_url)
+            return db_job_posting
+
+    async def create_job_postings(self, job_postings: List[JobPosting]) -> List[JobPostingDB]:
+        """Insert many job postings in a single transaction."""
+        if not job_postings:
+            return []
+        async with self.db.session() as session:
+            db_job_postings = [JobPostingService._to_db(job_posting) for job_posting in job_postings]
+            session.add_all(db_job_postings)
+            await session.flush()
+            await session.run_sync(set_job_skills, {
+                db_job_posting.id: db_job_posting.job_technical_skills for db_job_posting in db_job_postings
+            })
+            await session.commit()
+            for db_job_posting in db_job_postings:
+                self.cache.invalidate("job_posting_url", db_job_posting.canonical_url)
+            return db_job_postings
+
+    async def get_job_posting(self, job_posting_id: int) -> Optional[JobPostingDB]:
+        async with self.db.session() as session:
+            return await session.get(JobPostingDB, job_posting_id)
+
+    async def get_all_job_postings(self) -> List[JobPostingDB]:
+        async with self.db.session() as session:
+            return list(await session.scalars(select(JobPostingDB)))
+
+    async def iter_job_postings(self, columns: Optional[Sequence[str]] = None,
+                                batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Any]:
+        """Stream every job posting in id order with constant memory, optionally only some ``columns``."""
+        async with self.db.session() as session:
+            async for row in _stream_rows(session, JobPostingDB, columns, batch_size):
+                yield row
+
+    async def get_job_postings_page(self, after_id: Optional[int] = None, limit: int = 100,
+                                    columns: Optional[Sequence[str]] = None) -> List[Any]:
+        """Return the next page of job postings after ``after_id`` (keyset pagination)."""
+        async with self.db.session() as session:
+            return await _keyset_page(session, JobPostingDB, after_id, limit, columns)
+
+    async def iter_job_posting_pages(self, page_size: int = DEFAULT_BATCH_SIZE,
+                                     columns: Optional[Sequence[str]] = None) -> AsyncIterator[List[Any]]:
+        """Yield job postings page by page, each page read in its own short session."""
+        after_id = None
+        while True:
+            page = await self.get_job_postings_page(after_id, page_size, columns)
+            if not page:
+                return
+            yield page
+            after_id = page[-1].id
+
+    async def get_job_posting_by_url(self, job_posting_url: str) -> Optional[JobPostingDB]:
+        async with self.db.session() as session:
+            return (await session.scalars(select(JobPostingDB).where(or_(
+                JobPostingDB.canonical_url == canonicalize_job_url(job_posting_url),
+                JobPostingDB.job_posting_url == job_posting_url
+            )))).first()
+
+    async def get_job_postings_by_urls(self, job_posting_urls: List[str]) -> List[JobPostingDB]:
+        """Fetch all job postings matching any of the given URLs with a single IN query."""
+        if not job_posting_urls:
+            return []
+        canonical_urls = [canonicalize_job_url(url) for url in job_posting_urls]
+        async with self.db.session() as session:
+            return list(await session.scalars(select(JobPostingDB).where(or_(
+                JobPostingDB.canonical_url.in_(canonical_urls),
+                JobPostingDB.job_posting_url.in_(job_posting_urls)
+            ))))
+
+    async def _get_job_postings_by_ids(self, job_posting_ids: List[int]) -> List[JobPostingDB]:
+        if not job_posting_ids:
+            return []
+        async with self.db.session() as session:
+            rows = list(await session.scalars(select(JobPostingDB).where(JobPostingDB.id.in_(job_posting_ids))))
+        return order_by_ids(rows, job_posting_ids)
+
+    async def search_job_postings(self, query: str, limit: int = 20, match_any: bool = False) -> List[JobPostingDB]:
+        """Full-text search over titles, companies, descriptions, qualifications and skills, best match first."""
+        async with self.db.session() as session:
+            ids = await session.run_sync(search_ids, JobPostingDB, query, limit=limit, match_any=match_any)
+        return await self._get_job_postings_by_ids(ids)
+
+    async def find_similar_job_postings(self, job_posting_id: int, limit: int = 10) -> List[JobPostingDB]:
+        """Find the stored postings sharing the most title words and technical skills with a posting."""
+        job_posting = await self.get_job_posting(job_posting_id)
+        if job_posting is None:
+            return []
+        terms = " ".join([job_posting.job_title or "", *(job_posting.job_technical_skills or [])])
+        async with self.db.session() as session:
+            ids = await session.run_sync(search_ids, JobPostingDB, terms, limit=limit, match_any=True,
+                                         exclude_id=job_posting_id)
+        return await self._get_job_postings_by_ids(ids)
+
+    async def find_near_duplicate(self, content_fingerprint: str, max_distance: int = NEAR_DUPLICATE_DISTANCE) -> Optional[JobPostingDB]:
+        """Find a stored posting whose content fingerprint is within ``max_distance`` bits."""
+        async with self.db.session() as session:
+            exact = (await session.scalars(
+                select(JobPostingDB).where(JobPostingDB.content_fingerprint == content_fingerprint)
+            )).first()
+            if exact or max_distance <= 0:
+                return exact
+
+            # Only postings sharing a fingerprint band are compared, reading just their id and fingerprint
+            candidates = await session.execute(near_duplicate_candidates_select(content_fingerprint, max_distance))
+            best_id = closest_fingerprint(content_fingerprint, candidates, max_distance)
+            if best_id is None:
+                return None
+            return await session.get(JobPostingDB, best_id)
+
+class AsyncCompanyService:
+    def __init__(self):
+        self.db = AsyncDatabase.get_instance()
+
+    async def create_company(self, company: Company) -> CompanyDB:
+        async with self.db.session() as session:
+            db_company = CompanyDB(
+                name=company.name,
+                mission=company.mission,
+                location=company.location,
+                website=company.website,
+                industry=company.industry,
+                description=company.description
+            )
+            session.add(db_company)
+            await session.commit()
+            await session.refresh(db_company)
+            return db_company
+
+    async def get_company(self, company_id: int) -> Optional[CompanyDB]:
+        async with self.db.session() as session:
+            return await session.get(CompanyDB, company_id)
+
+    async def get_company_by_name(self, name: str) -> Optional[CompanyDB]:
+        async with self.db.session() as session:
+            return (await session.scalars(select(CompanyDB).where(CompanyDB.name == name))).first()
+
+    async def get_all_companies(self) -> List[CompanyDB]:
+        async with self.db.session() as session:
+            return list(await session.scalars(select(CompanyDB)))
+
+    async def iter_companies(self, columns: Optional[Sequence[str]] = None,
+                             batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Any]:
+        """Stream every company in id order with constant memory, optionally only some ``columns``."""
+        async with self.db.session() as session:
+            async for row in _stream_rows(session, CompanyDB, columns, batch_size):
+                yield row
+
+    async def get_companies_page(self, after_id: Optional[int] = None, limit: int = 100,
+                                 columns: Optional[Sequence[str]] = None) -> List[Any]:
+        """Return the next page of companies after ``after_id`` (keyset pagination)."""
+        async with self.db.session() as session:
+            return await _keyset_page(session, CompanyDB, after_id, limit, columns)
+
+    async def update_company(self, company_id: int, company_data: Company) -> Optional[CompanyDB]:
+        async with self.db.session() as session:
+            db_company = await session.get(CompanyDB, company_id)
+            if db_company:
+                for key, value in company_data.dict(exclude_unset=True).items():
+                    setattr(db_company, key, value)
+                await session.commit()
+                await session.refresh(db_company)
+            return db_company
+
+    async def delete_company(self, company_id: int) -> bool:
+        async with self.db.session() as session:
+            db_company = await session.get(CompanyDB, company_id)
+            if db_company:
+                await session.delete(db_company)
+                await session.commit()
+                return True
+            return False
+
+class AsyncSkillService:
+    def __init__(self):
+        self.db = AsyncDatabase.get_instance()
+
+    async def get_all_skills(self) -> List[SkillDB]:
+        async with self.db.session() as session:
+            return list(await session.scalars(select(SkillDB).order_by(SkillDB.name)))
+
+    async def find_experiences_with_skill(self, skill: str, user_id: Optional[int] = None) -> List[ExperienceDB]:
+        """Return the experiences whose tech stack lists ``skill`` (case-insensitive)."""
+        async with self.db.session() as session:
+            return list(await session.scalars(items_with_skill_select("experience", skill, user_id)))
+
+    async def find_projects_with_skill(self, skill: str, user_id: Optional[int] = None) -> List[ProjectDB]:
+        """Return the projects whose tech stack lists ``skill`` (case-insensitive)."""
+        async with self.db.session() as session:
+            return list(await session.scalars(items_with_skill_select("project", skill, user_id)))
+
+    async def find_job_postings_with_skill(self, skill: str) -> List[JobPostingDB]:
+        """Return the job postings asking for ``skill`` (case-insensitive)."""
+        async with self.db.session() as session:
+            return list(await session.scalars(job_postings_with_skill_select(skill)))
+
+    async def get_matching_skills(self, user_id: int, job_posting_id: int) -> List[str]:
+        """Return the posting's technical skills that appear anywhere in the user's profile."""
+        async with self.db.session() as session:
+            return list(await session.scalars(job_skills_select(user_id, job_posting_id)))
+
+    async def get_missing_skills(self, user_id: int, job_posting_id: int) -> List[str]:
+        """Return the posting's technical skills that appear nowhere in the user's profile."""
+        async with self.db.session() as session:
+            return list(await session.scalars(job_skills_select(user_id, job_posting_id, matched=False)))
+
+    async def get_item_skill_overlaps(self, user_id: int, job_posting_id: int) -> List[Tuple[str, int, int]]:
+        """Count the skills each of the user's experiences and projects shares with a posting."""
+        async with self.db.session() as session:
+            return [tuple(row) for row in await session.execute(item_overlaps_select(user_id, job_posting_id))]
+
+    async def find_matching_job_postings(self, user_id: int, limit: int = 10) -> List[Tuple[JobPostingDB, int]]:
+        """Return ``(job_posting, overlap)`` for the postings sharing the most skills with the user."""
+        async with self.db.session() as session:
+            return [tuple(row) for row in await session.execute(job_posting_overlaps_select(user_id, limit))]
+
+    async def rebuild_skill_index(self) -> Dict[str, int]:
+        """Re-derive all skill links from the stored tech stacks and job skills in one transaction."""
+        async with self.db.session_scope() as session:
+            return await session.run_sync(rebuild_skill_index)
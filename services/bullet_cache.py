@@ -0,0 +1,94 @@
+import hashlib
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from model.schema import BulletCacheDB
+from model.database import Database
+from typing import Dict, List, Optional
+
+def hash_text(text: Optional[str]) -> str:
+    """Return a stable hash of a piece of prompt input."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+def make_bullet_cache_key(item_data: str, job_context: str, ranking_reason: Optional[str], prompt_version: str,
+                          num_bullets: Optional[int] = None, candidate_count: int = 1, mode: str = "single") -> str:
+    """Build the cache key for the bullet points of one item tailored to one job.
+
+    The number of bullet points, the number of candidate sets and the generation
+    mode ("single" or "batch" prompt) are part of the key, since each changes the output.
+    """
+    parts = [hash_text(item_data), hash_text(job_context), hash_text(ranking_reason), prompt_version,
+             mode, str(num_bullets), str(candidate_count)]
+    return hash_text("|".join(parts))
+
+class BulletCacheService:
+    def __init__(self):
+        self.db = Database.get_instance()
+
+    def get_bullets(self, cache_key: str, variant: Optional[int] = None) -> Optional[BulletCacheDB]:
+        """Return the cached bullet points for a key; the latest variant if none is given."""
+        with self.db as session:
+            query = session.query(BulletCacheDB).filter(BulletCacheDB.cache_key == cache_key)
+            if variant is not None:
+                return query.filter(BulletCacheDB.variant == variant).first()
+            return query.order_by(BulletCacheDB.variant.desc()).first()
+
+    def get_bullets_many(self, cache_keys: List[str]) -> Dict[str, BulletCacheDB]:
+        """Return the latest cached variant of each key with a single IN query."""
+        if not cache_keys:
+            return {}
+        with self.db as session:
+            rows = session.query(BulletCacheDB).filter(
+                BulletCacheDB.cache_key.in_(cache_keys)
+            ).order_by(BulletCacheDB.variant).all()
+            # Later variants overwrite earlier ones
+            return {row.cache_key: row for row in rows}
+
+    def next_variant(self, cache_key: str) -> int:
+        """Return the first unused variant slot for a key."""
+        with self.db as session:
+            latest = session.query(func.max(BulletCacheDB.variant)).filter(BulletCacheDB.cache_key == cache_key).scalar()
+            return 0 if latest is None else latest + 1
+
+    def save_bullets(self, cache_key: str, bullet_points: List[str], item_type: str, variant: int = 0) -> BulletCacheDB:
+        """Store bullet points in a variant slot, replacing whatever the slot held."""
+        with self.db as session:
+            db_entry = session.query(BulletCacheDB).filter(
+                BulletCacheDB.cache_key == cache_key, BulletCacheDB.variant == variant
+            ).first()
+            if db_entry is None:
+                db_entry = BulletCacheDB(cache_key=cache_key, variant=variant)
+                session.add(db_entry)
+            db_entry.item_type = item_type
+            db_entry.bullet_points = bullet_points
+            session.commit()
+            session.refresh(db_entry)
+            return db_entry
+
+    def add_variant(self, cache_key: str, bullet_points: List[str], item_type: str, max_attempts: int = 5) -> BulletCacheDB:
+        """Store bullet points in the next free variant slot within one transaction.
+
+        If another writer takes the same slot first, the insert is retried with the next one.
+        """
+        for attempt in range(max_attempts):
+            try:
+                with self.db.session_scope() as session:
+                    latest = session.query(func.max(BulletCacheDB.variant)).filter(BulletCacheDB.cache_key == cache_key).scalar()
+                    db_entry = BulletCacheDB(
+                        cache_key=cache_key,
+                        variant=0 if latest is None else latest + 1,
+                        item_type=item_type,
+                        bullet_points=bullet_points
+                    )
+                    session.add(db_entry)
+                    session.flush()
+                    return db_entry
+            except IntegrityError:
+                if attempt == max_attempts - 1:
+                    raise
+
+    def clear(self) -> int:
+        """Delete all cached bullet points and return how many entries were removed."""
+        with self.db as session:
+            deleted = session.query(BulletCacheDB).delete()
+            session.commit()
+            return deleted
@@ -1,6 +1,7 @@
 from model.schema import Company, CompanyDB
 from model.database import Database
-from typing import List, Optional
+from model.streaming import DEFAULT_BATCH_SIZE, keyset_page, stream_rows
+from typing import Any, Iterator, List, Optional, Sequence
 
 class CompanyService:
     def __init__(self):
@@ -33,6 +34,18 @@ class CompanyService:
         with self.db as session:
             return session.query(CompanyDB).all()
 
+    def iter_companies(self, columns: Optional[Sequence[str]] = None,
+                       batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+        """Stream every company in id order with constant memory, optionally only some ``columns``."""
+        with self.db as session:
+            yield from stream_rows(session, CompanyDB, columns, batch_size)
+
+    def get_companies_page(self, after_id: Optional[int] = None, limit: int = 100,
+                           columns: Optional[Sequence[str]] = None) -> List[Any]:
+        """Return the next page of companies after ``after_id`` (keyset pagination)."""
+        with self.db as session:
+            return keyset_page(session, CompanyDB, after_id, limit, columns)
+
     def update_company(self, company_id: int, company_data: Company) -> Optional[CompanyDB]:
         with self.db as session:
             db_company = session.query(CompanyDB).filter(CompanyDB.id == company_id).first()
@@ -1,52 +1,115 @@
+from sqlalchemy import delete, func, select
 from model.schema import Experience, ExperienceDB
-from model.database import Database
+from model.database import Database, insert_returning_ids
+from model.search import order_by_ids, search_ids
+from model.skills import clear_item_skills, set_item_skills
+from model.versioning import stamp_row, touch
+from services.read_cache import get_read_cache
 from typing import List, Optional
 
 class ExperienceService:
     def __init__(self):
         self.db = Database.get_instance()
+        self.cache = get_read_cache()
+
+    @staticmethod
+    def _to_row(experience: Experience) -> dict:
+        return stamp_row("experiences", {
+            "user_id": experience.user_id,
+            "company_name": experience.company_name,
+            "role_title": experience.role_title,
+            "company_location": experience.company_location,
+            "start_date": experience.start_date,
+            "end_date": experience.end_date,
+            "long_description": experience.long_description,
+            "short_description": experience.short_description,
+            "tech_stack": experience.tech_stack
+        })
 
     def create_experience(self, experience: Experience) -> ExperienceDB:
         with self.db as session:
-            db_experience = ExperienceDB(
-                user_id=experience.user_id,
-                company_name=experience.company_name,
-                role_title=experience.role_title,
-                company_location=experience.company_location,
-                start_date=experience.start_date,
-                end_date=experience.end_date,
-                long_description=experience.long_description,
-                short_description=experience.short_description,
-                tech_stack=experience.tech_stack
-            )
+            db_experience = ExperienceDB(**self._to_row(experience))
             session.add(db_experience)
+            session.flush()
+            set_item_skills(session, "experience", {db_experience.id: db_experience.tech_stack})
             session.commit()
             session.refresh(db_experience)
             return db_experience
 
+    def create_experiences(self, experiences: List[Experience]) -> List[int]:
+        """Insert many experiences in one statement and transaction, returning their ids in order."""
+        with self.db.session_scope() as session:
+            ids = insert_returning_ids(session, ExperienceDB, [self._to_row(experience) for experience in experiences])
+            set_item_skills(session, "experience", {id: experience.tech_stack for id, experience in zip(ids, experiences)})
+            return ids
+
     def get_experience(self, experience_id: int) -> Optional[ExperienceDB]:
+        return self.cache.get("experience", experience_id, lambda: self._load_experience(experience_id))
+
+    def _load_experience(self, experience_id: int) -> Optional[ExperienceDB]:
         with self.db as session:
             return session.query(ExperienceDB).filter(ExperienceDB.id == experience_id).first()
 
+    def get_experiences_by_ids(self, experience_ids: List[int]) -> List[ExperienceDB]:
+        """Fetch several experiences, loading the uncached ones with a single IN query."""
+        if not experience_ids:
+            return []
+        return self.cache.get_many("experience", experience_ids, self._load_experiences_by_ids, lambda experience: experience.id)
+
+    def _load_experiences_by_ids(self, experience_ids: List[int]) -> List[ExperienceDB]:
+        with self.db as session:
+            return session.query(ExperienceDB).filter(ExperienceDB.id.in_(set(experience_ids))).all()
+
+    def search_experiences(self, query: str, user_id: Optional[int] = None, limit: int = 20,
+                           match_any: bool = False) -> List[ExperienceDB]:
+        """Full-text search over experiences, best match first.
+
+        Every word must match unless ``match_any`` is set; pass ``user_id`` to search one profile.
+        """
+        with self.db as session:
+            ids = search_ids(session, ExperienceDB, query, limit=limit, match_any=match_any, user_id=user_id)
+        return order_by_ids(self.get_experiences_by_ids(ids), ids)
+
     def get_user_experiences(self, user_id: int) -> List[ExperienceDB]:
         with self.db as session:
             return session.query(ExperienceDB).filter(ExperienceDB.user_id == user_id).all()
 
     def update_experience(self, experience_id: int, experience_data: Experience) -> Optional[ExperienceDB]:
-        with self.db as session:
+        with self.db.session_scope() as session:
             db_experience = session.query(ExperienceDB).filter(ExperienceDB.id == experience_id).first()
             if db_experience:
-                for key, value in experience_data.dict(exclude_unset=True).items():
+                values = experience_data.dict(exclude_unset=True)
+                for key, value in values.items():
                     setattr(db_experience, key, value)
-                session.commit()
-                session.refresh(db_experience)
+                touch(db_experience)
+                if "tech_stack" in values:
+                    set_item_skills(session, "experience", {experience_id: db_experience.tech_stack})
+                session.flush()
+                self.db.run_after_commit(lambda: self.cache.invalidate("experience", experience_id))
             return db_experience
 
     def delete_experience(self, experience_id: int) -> bool:
-        with self.db as session:
+        with self.db.session_scope() as session:
             db_experience = session.query(ExperienceDB).filter(ExperienceDB.id == experience_id).first()
             if db_experience:
+                clear_item_skills(session, "experience", [experience_id])
                 session.delete(db_experience)
-                session.commit()
+                self.db.run_after_commit(lambda: self.cache.invalidate("experience", experience_id))
                 return True
-            return False 
\ No newline at end of file
+            return False
+
+    def count_user_experiences(self, user_id: int) -> int:
+        with self.db as session:
+            return session.query(func.count(ExperienceDB.id)).filter(ExperienceDB.user_id == user_id).scalar()
+
+    def delete_user_experiences(self, user_id: int) -> int:
+        """Delete all of a user's experiences with one DELETE statement and return how many were removed."""
+        with self.db.session_scope() as session:
+            clear_item_skills(session, "experience", select(ExperienceDB.id).where(ExperienceDB.user_id == user_id))
+            result = session.execute(
+                delete(ExperienceDB).where(ExperienceDB.user_id == user_id).execution_options(synchronize_session=False)
+            )
+            self.db.run_after_commit(
+                lambda: self.cache.invalidate_where("experience", lambda experience: experience.user_id == user_id)
+            )
+            return result.rowcount 
\ No newline at end of file
@@ -0,0 +1,29 @@
+from typing import Any, Dict, Iterable
+from services.experience import ExperienceService
+from services.project import ProjectService
+
+def item_key(item_type: str, item_id: int) -> str:
+    """Return the key of an experience or project in an item map, e.g. "experience_5"."""
+    return f"{item_type}_{item_id}"
+
+def load_item_map(experience_ids: Iterable[int] = (), project_ids: Iterable[int] = ()) -> Dict[str, Any]:
+    """Load the selected experiences and projects with one query per table.
+
+    The returned map is keyed by ``item_key`` and can be shared by every component
+    working on the same resume, so each row is only fetched once per request.
+    """
+    item_map = {}
+    for experience in ExperienceService().get_experiences_by_ids(list(experience_ids)):
+        item_map[item_key("experience", experience.id)] = experience
+    for project in ProjectService().get_projects_by_ids(list(project_ids)):
+        item_map[item_key("project", project.id)] = project
+    return item_map
+
+def profile_item_map(profile: Any) -> Dict[str, Any]:
+    """Build an item map from a profile loaded with ``UserService.get_user_profile``, without querying."""
+    item_map = {}
+    for experience in profile.experiences:
+        item_map[item_key("experience", experience.id)] = experience
+    for project in profile.projects:
+        item_map[item_key("project", project.id)] = project
+    return item_map
@@ -1,36 +1,161 @@
+from sqlalchemy import or_
 from model.schema import JobPosting, JobPostingDB
 from model.database import Database
-from typing import List, Optional
+from model.fingerprints import (
+    FINGERPRINT_BITS, NEAR_DUPLICATE_DISTANCE, closest_fingerprint, compute_content_fingerprint,
+    fingerprint_bands, fingerprint_distance, near_duplicate_candidates_select
+)
+from model.job_urls import LOCALE_SEGMENT, TRACKING_PARAM_PREFIXES, TRACKING_PARAMS, canonicalize_job_url
+from model.search import order_by_ids, search_ids
+from model.skills import set_job_skills
+from model.streaming import DEFAULT_BATCH_SIZE, keyset_page, stream_rows
+from model.versioning import touch
+from services.read_cache import get_read_cache
+from typing import Any, Iterator, List, Optional, Sequence
 
 class JobPostingService:
     def __init__(self):
         self.db = Database.get_instance()
+        self.cache = get_read_cache()
+
+    @staticmethod
+    def _to_db(job_posting: JobPosting) -> JobPostingDB:
+        db_job_posting = JobPostingDB(
+            job_posting_url=job_posting.job_posting_url,
+            canonical_url=canonicalize_job_url(job_posting.job_posting_url),
+            company_name=job_posting.company_name,
+            job_title=job_posting.job_title,
+            job_location=job_posting.job_location,
+            job_type=job_posting.job_type,
+            job_description=job_posting.job_description,
+            job_qualifications=job_posting.job_qualifications,
+            job_technical_skills=job_posting.job_technical_skills,
+            content_fingerprint=job_posting.content_fingerprint,
+            **fingerprint_bands(job_posting.content_fingerprint)
+        )
+        touch(db_job_posting)
+        return db_job_posting
 
     def create_job_posting(self, job_posting: JobPosting) -> JobPostingDB:
         with self.db as session:
-            db_job_posting = JobPostingDB(
-                job_posting_url=job_posting.job_posting_url,
-                company_name=job_posting.company_name,
-                job_title=job_posting.job_title,
-                job_location=job_posting.job_location,
-                job_type=job_posting.job_type,
-                job_description=job_posting.job_description,
-                job_qualifications=job_posting.job_qualifications,
-                job_technical_skills=job_posting.job_technical_skills
-            )
+            db_job_posting = self._to_db(job_posting)
             session.add(db_job_posting)
+            session.flush()
+            set_job_skills(session, {db_job_posting.id: db_job_posting.job_technical_skills})
             session.commit()
             session.refresh(db_job_posting)
+            self.cache.invalidate("job_posting_url", db_job_posting.canonical_url)
             return db_job_posting
-        
+
+    def create_job_postings(self, job_postings: List[JobPosting]) -> List[JobPostingDB]:
+        """Insert many job postings in a single transaction."""
+        if not job_postings:
+            return []
+        with self.db as session:
+            db_job_postings = [self._to_db(job_posting) for job_posting in job_postings]
+            session.add_all(db_job_postings)
+            session.flush()
+            ids = [db_job_posting.id for db_job_posting in db_job_postings]
+            set_job_skills(session, {
+                db_job_posting.id: db_job_posting.job_technical_skills for db_job_posting in db_job_postings
+            })
+            session.commit()
+            for db_job_posting in db_job_postings:
+                self.cache.invalidate("job_posting_url", db_job_posting.canonical_url)
+            # Reload all rows in one query instead of refreshing them one by one
+            return session.query(JobPostingDB).filter(JobPostingDB.id.in_(ids)).order_by(JobPostingDB.id).all()
+
     def get_job_posting(self, job_posting_id: int) -> Optional[JobPostingDB]:
         with self.db as session:
             return session.query(JobPostingDB).filter(JobPostingDB.id == job_posting_id).first()
-        
+
     def get_all_job_postings(self) -> List[JobPostingDB]:
         with self.db as session:
             return session.query(JobPostingDB).all()
-        
+
+    def iter_job_postings(self, columns: Optional[Sequence[str]] = None,
+                          batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+        """Stream every job posting in id order with constant memory.
+
+        Pass ``columns`` (e.g. ``["job_title", "company_name"]``) to read only those
+        columns; rows are then tuples with attribute access instead of ORM objects.
+        """
+        with self.db as session:
+            yield from stream_rows(session, JobPostingDB, columns, batch_size)
+
+    def get_job_postings_page(self, after_id: Optional[int] = None, limit: int = 100,
+                              columns: Optional[Sequence[str]] = None) -> List[Any]:
+        """Return the next page of job postings after ``after_id`` (keyset pagination)."""
+        with self.db as session:
+            return keyset_page(session, JobPostingDB, after_id, limit, columns)
+
+    def iter_job_posting_pages(self, page_size: int = DEFAULT_BATCH_SIZE,
+                               columns: Optional[Sequence[str]] = None) -> Iterator[List[Any]]:
+        """Yield job postings page by page, each page read in its own short unit of work."""
+        after_id = None
+        while True:
+            page = self.get_job_postings_page(after_id, page_size, columns)
+            if not page:
+                return
+            yield page
+            after_id = page[-1].id
+
     def get_job_posting_by_url(self, job_posting_url: str) -> Optional[JobPostingDB]:
+        canonical_url = canonicalize_job_url(job_posting_url)
+        return self.cache.get("job_posting_url", canonical_url,
+                              lambda: self._load_job_posting_by_url(job_posting_url, canonical_url))
+
+    def _load_job_posting_by_url(self, job_posting_url: str, canonical_url: str) -> Optional[JobPostingDB]:
+        with self.db as session:
+            return session.query(JobPostingDB).filter(or_(
+                JobPostingDB.canonical_url == canonical_url,
+                JobPostingDB.job_posting_url == job_posting_url
+            )).first()
+
+    def get_job_postings_by_urls(self, job_posting_urls: List[str]) -> List[JobPostingDB]:
+        """Fetch all job postings matching any of the given URLs with a single IN query."""
+        if not job_posting_urls:
+            return []
+        canonical_urls = [canonicalize_job_url(url) for url in job_posting_urls]
+        with self.db as session:
+            return session.query(JobPostingDB).filter(or_(
+                JobPostingDB.canonical_url.in_(canonical_urls),
+                JobPostingDB.job_posting_url.in_(job_posting_urls)
+            )).all()
+
+    def _get_job_postings_by_ids(self, job_posting_ids: List[int]) -> List[JobPostingDB]:
+        if not job_posting_ids:
+            return []
+        with self.db as session:
+            rows = session.query(JobPostingDB).filter(JobPostingDB.id.in_(job_posting_ids)).all()
+        return order_by_ids(rows, job_posting_ids)
+
+    def search_job_postings(self, query: str, limit: int = 20, match_any: bool = False) -> List[JobPostingDB]:
+        """Full-text search over titles, companies, descriptions, qualifications and skills, best match first."""
+        with self.db as session:
+            ids = search_ids(session, JobPostingDB, query, limit=limit, match_any=match_any)
+        return self._get_job_postings_by_ids(ids)
+
+    def find_similar_job_postings(self, job_posting_id: int, limit: int = 10) -> List[JobPostingDB]:
+        """Find the stored postings sharing the most title words and technical skills with a posting."""
+        job_posting = self.get_job_posting(job_posting_id)
+        if job_posting is None:
+            return []
+        terms = " ".join([job_posting.job_title or "", *(job_posting.job_technical_skills or [])])
         with self.db as session:
-            return session.query(JobPostingDB).filter(JobPostingDB.job_posting_url == job_posting_url).first()
\ No newline at end of file
+            ids = search_ids(session, JobPostingDB, terms, limit=limit, match_any=True, exclude_id=job_posting_id)
+        return self._get_job_postings_by_ids(ids)
+
+    def find_near_duplicate(self, content_fingerprint: str, max_distance: int = NEAR_DUPLICATE_DISTANCE) -> Optional[JobPostingDB]:
+        """Find a stored posting whose content fingerprint is within ``max_distance`` bits."""
+        with self.db as session:
+            exact = session.query(JobPostingDB).filter(JobPostingDB.content_fingerprint == content_fingerprint).first()
+            if exact or max_distance <= 0:
+                return exact
+
+            # Only postings sharing a fingerprint band are compared, reading just their id and fingerprint
+            candidates = session.execute(near_duplicate_candidates_select(content_fingerprint, max_distance))
+            best_id = closest_fingerprint(content_fingerprint, candidates, max_distance)
+            if best_id is None:
+                return None
+            return session.query(JobPostingDB).filter(JobPostingDB.id == best_id).first()
@@ -1,51 +1,114 @@
+from sqlalchemy import delete, func, select
 from model.schema import Project, ProjectDB
-from model.database import Database
+from model.database import Database, insert_returning_ids
+from model.search import order_by_ids, search_ids
+from model.skills import clear_item_skills, set_item_skills
+from model.versioning import stamp_row, touch
+from services.read_cache import get_read_cache
 from typing import List, Optional
 
 class ProjectService:
     def __init__(self):
         self.db = Database.get_instance()
+        self.cache = get_read_cache()
+
+    @staticmethod
+    def _to_row(project: Project) -> dict:
+        return stamp_row("projects", {
+            "user_id": project.user_id,
+            "project_name": project.project_name,
+            "start_date": project.start_date,
+            "end_date": project.end_date,
+            "long_description": project.long_description,
+            "short_description": project.short_description,
+            "tech_stack": project.tech_stack,
+            "team_size": project.team_size
+        })
 
     def create_project(self, project: Project) -> ProjectDB:
         with self.db as session:
-            db_project = ProjectDB(
-                user_id=project.user_id,
-                project_name=project.project_name,
-                start_date=project.start_date,
-                end_date=project.end_date,
-                long_description=project.long_description,
-                short_description=project.short_description,
-                tech_stack=project.tech_stack,
-                team_size=project.team_size
-            )
+            db_project = ProjectDB(**self._to_row(project))
             session.add(db_project)
+            session.flush()
+            set_item_skills(session, "project", {db_project.id: db_project.tech_stack})
             session.commit()
             session.refresh(db_project)
             return db_project
 
+    def create_projects(self, projects: List[Project]) -> List[int]:
+        """Insert many projects in one statement and transaction, returning their ids in order."""
+        with self.db.session_scope() as session:
+            ids = insert_returning_ids(session, ProjectDB, [self._to_row(project) for project in projects])
+            set_item_skills(session, "project", {id: project.tech_stack for id, project in zip(ids, projects)})
+            return ids
+
     def get_project(self, project_id: int) -> Optional[ProjectDB]:
+        return self.cache.get("project", project_id, lambda: self._load_project(project_id))
+
+    def _load_project(self, project_id: int) -> Optional[ProjectDB]:
         with self.db as session:
             return session.query(ProjectDB).filter(ProjectDB.id == project_id).first()
 
+    def get_projects_by_ids(self, project_ids: List[int]) -> List[ProjectDB]:
+        """Fetch several projects, loading the uncached ones with a single IN query."""
+        if not project_ids:
+            return []
+        return self.cache.get_many("project", project_ids, self._load_projects_by_ids, lambda project: project.id)
+
+    def _load_projects_by_ids(self, project_ids: List[int]) -> List[ProjectDB]:
+        with self.db as session:
+            return session.query(ProjectDB).filter(ProjectDB.id.in_(set(project_ids))).all()
+
+    def search_projects(self, query: str, user_id: Optional[int] = None, limit: int = 20,
+                        match_any: bool = False) -> List[ProjectDB]:
+        """Full-text search over projects, best match first.
+
+        Every word must match unless ``match_any`` is set; pass ``user_id`` to search one profile.
+        """
+        with self.db as session:
+            ids = search_ids(session, ProjectDB, query, limit=limit, match_any=match_any, user_id=user_id)
+        return order_by_ids(self.get_projects_by_ids(ids), ids)
+
     def get_user_projects(self, user_id: int) -> List[ProjectDB]:
         with self.db as session:
             return session.query(ProjectDB).filter(ProjectDB.user_id == user_id).all()
 
     def update_project(self, project_id: int, project_data: Project) -> Optional[ProjectDB]:
-        with self.db as session:
+        with self.db.session_scope() as session:
             db_project = session.query(ProjectDB).filter(ProjectDB.id == project_id).first()
             if db_project:
-                for key, value in project_data.dict(exclude_unset=True).items():
+                values = project_data.dict(exclude_unset=True)
+                for key, value in values.items():
                     setattr(db_project, key, value)
-                session.commit()
-                session.refresh(db_project)
+                touch(db_project)
+                if "tech_stack" in values:
+                    set_item_skills(session, "project", {project_id: db_project.tech_stack})
+                session.flush()
+                self.db.run_after_commit(lambda: self.cache.invalidate("project", project_id))
             return db_project
 
     def delete_project(self, project_id: int) -> bool:
-        with self.db as session:
+        with self.db.session_scope() as session:
             db_project = session.query(ProjectDB).filter(ProjectDB.id == project_id).first()
             if db_project:
+                clear_item_skills(session, "project", [project_id])
                 session.delete(db_project)
-                session.commit()
+                self.db.run_after_commit(lambda: self.cache.invalidate("project", project_id))
                 return True
-            return False 
\ No newline at end of file
+            return False
+
+    def count_user_projects(self, user_id: int) -> int:
+        with self.db as session:
+            return session.query(func.count(ProjectDB.id)).filter(ProjectDB.user_id == user_id).scalar()
+
+    def delete_user_projects(self, user_id: int) -> int:
+        """Delete all of a user's projects with one DELETE statement and return how many were removed."""
+        with self.db.session_scope() as session:
+            clear_item_skills(session, "project", select(ProjectDB.id).where(ProjectDB.user_id == user_id))
+            result = session.execute(
+                delete(ProjectDB).where(ProjectDB.user_id == user_id).execution_options(synchronize_session=False)
+            )
+            self.db.run_after_commit(
+                lambda: self.cache.invalidate_where("project", lambda project: project.user_id == user_id)
+            )
+            return result.rowcount 
\ No newline at end of file
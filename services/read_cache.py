@@ -0,0 +1,151 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from model.database import Base
+import config
+
+class ReadCache:
+    """Thread-safe LRU cache for rows read by the services, keyed by ``(entity, key)``.
+
+    Reads go through ``get``/``get_many``, which load missing entries and keep the
+    most recently used ``max_size`` of them. Writers invalidate the exact entries
+    they change. A ``max_size`` of 0 disables caching.
+
+    Loaders run outside the lock, so every invalidation also bumps a generation
+    counter of its entity: a value loaded while its entity was invalidated may be
+    stale and is returned without being cached. Missing rows (``None``) are never
+    cached, so looking up ids that do not exist always reaches the database.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # Invalidation count per entity, and of clear() calls across all entities
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def _generation(self, entity: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(entity, 0)
+
+    def _lookup(self, key: Tuple[str, Hashable]) -> Tuple[Any, Tuple[int, int]]:
+        """Return the cached value (None on a miss) and the generation of its entity."""
+        with self._lock:
+            generation = self._generation(key[0])
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key], generation
+            self.misses += 1
+            return None, generation
+
+    def _store(self, key: Tuple[str, Hashable], value: Any, generation: Tuple[int, int]):
+        # Missing rows are not cached, so creating them later needs no invalidation
+        if value is None:
+            return
+        with self._lock:
+            # The entity was invalidated while the value was loading
+            if self._generation(key[0]) != generation:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _bump(self, entity: str):
+        self._generations[entity] = self._generations.get(entity, 0) + 1
+
+    def get(self, entity: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for ``(entity, key)``, calling ``loader`` on a miss.
+
+        ``None`` results are returned but not cached.
+        """
+        if not self.enabled:
+            return loader()
+        value, generation = self._lookup((entity, key))
+        if value is None:
+            value = loader()
+            self._store((entity, key), value, generation)
+        return value
+
+    def get_many(self, entity: str, keys: Iterable[Hashable],
+                 loader: Callable[[List[Hashable]], Iterable[Any]], key_of: Callable[[Any], Hashable]) -> List[Any]:
+        """Return the cached values for several keys, loading all misses with one ``loader`` call.
+
+        Keys the loader returns nothing for are left out of the result and not cached.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not self.enabled:
+            return list(loader(keys))
+        values = []
+        missing = []
+        with self._lock:
+            generation = self._generation(entity)
+        for key in keys:
+            value, _ = self._lookup((entity, key))
+            if value is None:
+                missing.append(key)
+            else:
+                values.append(value)
+        if missing:
+            for value in loader(missing):
+                self._store((entity, key_of(value)), value, generation)
+                values.append(value)
+        return values
+
+    def invalidate(self, entity: str, key: Hashable):
+        """Drop one entry."""
+        with self._lock:
+            self._entries.pop((entity, key), None)
+            self._bump(entity)
+
+    def invalidate_where(self, entity: str, predicate: Callable[[Any], bool]):
+        """Drop every entry of an entity whose value matches ``predicate``."""
+        with self._lock:
+            for cache_key in [cache_key for cache_key, value in self._entries.items()
+                              if cache_key[0] == entity and predicate(value)]:
+                del self._entries[cache_key]
+            self._bump(entity)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hits, misses, hit ratio and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+_read_cache: Optional[ReadCache] = None
+
+def get_read_cache() -> ReadCache:
+    """Return the process-wide cache, sized by ``config.READ_CACHE_SIZE``."""
+    global _read_cache
+    if _read_cache is None:
+        _read_cache = ReadCache(config.READ_CACHE_SIZE if config.READ_CACHE_ENABLED else 0)
+    return _read_cache
+
+@event.listens_for(Base.metadata, "after_drop")
+def _clear_after_drop(target, connection, **kw):
+    # Dropped tables take every cached row with them (init_db, test teardown)
+    get_read_cache().clear()
@@ -1,74 +1,101 @@
 import sys
 import os
+import tempfile
 
 # Add the project root directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from services.user import UserService
 from services.experience import ExperienceService
 from services.project import ProjectService
+from services.item_map import item_key, load_item_map, profile_item_map
 import config
 
+def write_file_atomically(file_path: str, content: str):
+    """Write ``content`` to a temporary file next to ``file_path`` and rename it into place.
+
+    Readers see either the previous file or the complete new one, never a partial write.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file as owner-only; give it the permissions open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
 class ResumeWriter:
     def __init__(self, template_path: str = "template/my_resume.tex"):
         self.template_path = template_path
+        self.user_service = UserService()
+        self.experience_service = ExperienceService()
+        self.project_service = ProjectService()
     
-    def _get_user_data(self, user_id: int):
-        user_service = UserService()
-        user = user_service.get_user(user_id)
-        return user
+    def _get_user_data(self, user_id: int, profile: Optional[Any] = None):
+        if profile is not None:
+            return profile
+        return self.user_service.get_user(user_id)
     
-    def _write_header(self, user_id: int):
-        user_data = self._get_user_data(user_id)
+    def _write_header(self, user_id: int, profile: Optional[Any] = None):
+        user_data = self._get_user_data(user_id, profile)
 
-        result = "\n"
-        result += "\t\\begin{center}\n"
-        result += f"\t\t\\textbf{{\Huge \\scshape {user_data.name}}} \\\\ \\vspace{{1pt}} \n"
+        parts = ["\n"]
+        parts.append("\t\\begin{center}\n")
+        parts.append(f"\t\t\\textbf{{\Huge \\scshape {user_data.name}}} \\\\ \\vspace{{1pt}} \n")
         # \small 123-456-7890 $|$ \href{mailto:x@x.com}{\underline{jake@su.edu}} $|$
-        result += f"\t\t\\small {self._format_phone_number(user_data.phone)} $|$ \href{{mailto:{user_data.email}}}{{\\underline{{{user_data.email}}}}} $|$ "
-        result += f"\\href{{{config.GITHUB_URL}}}{{\\underline{{github.com/{config.GITHUB_SHORT_HANDLE}}}}} $|$ "
-        result += f"\\href{{{config.LINKEDIN_URL}}}{{\\underline{{linkedin.com/in/{config.LINKEDIN_SHORT_HANDLE}}}}}"
+        parts.append(f"\t\t\\small {self._format_phone_number(user_data.phone)} $|$ \href{{mailto:{user_data.email}}}{{\\underline{{{user_data.email}}}}} $|$ ")
+        parts.append(f"\\href{{{config.GITHUB_URL}}}{{\\underline{{github.com/{config.GITHUB_SHORT_HANDLE}}}}} $|$ ")
+        parts.append(f"\\href{{{config.LINKEDIN_URL}}}{{\\underline{{linkedin.com/in/{config.LINKEDIN_SHORT_HANDLE}}}}}")
         if config.PORTFOLIO_URL:
-            result += f" $|$ \\href{{{config.PORTFOLIO_URL}}}{{\\underline{{{config.PORTFOLIO_SHORT_HANDLE}}}}}\n"
+            parts.append(f" $|$ \\href{{{config.PORTFOLIO_URL}}}{{\\underline{{{config.PORTFOLIO_SHORT_HANDLE}}}}}\n")
         else:
-            result += "\n"
-        result += "\t\\end{center}\n"
-        result += "\n"
-        return result
+            parts.append("\n")
+        parts.append("\t\\end{center}\n")
+        parts.append("\n")
+        return "".join(parts)
 
-    def _write_education(self, user_id: int):
-        user_data = self._get_user_data(user_id)
-        result = "\n"
-        result += "\section{Education}\n"
+    def _write_education(self, user_id: int, profile: Optional[Any] = None):
+        user_data = self._get_user_data(user_id, profile)
+        parts = ["\n"]
+        parts.append("\section{Education}\n")
 
-        result += "\t\\resumeSubHeadingListStart\n"
-        result += "\t\t\\resumeSubheading\n"
+        parts.append("\t\\resumeSubHeadingListStart\n")
+        parts.append("\t\t\\resumeSubheading\n")
         if user_data.grad_year:
             if int(user_data.grad_year[-4:]) >= datetime.now().year:
-                result += f"\t\t\t{{{user_data.education}}}{{Expected {user_data.grad_year}}}\n"
+                parts.append(f"\t\t\t{{{user_data.education}}}{{Expected {user_data.grad_year}}}\n")
             else:
-                result += f"\t\t\t{{{user_data.education}}}{{Graduated {user_data.grad_year}}}\n"
+                parts.append(f"\t\t\t{{{user_data.education}}}{{Graduated {user_data.grad_year}}}\n")
         else:
-            result += f"\t\t\t{{{user_data.education}}}{{}}"
-        result += f"\t\t\t{{{user_data.degree} in {user_data.major}}}{{{'GPA : ' + user_data.grade if user_data.grade else ''}}}"
-        result += "\t\\resumeSubHeadingListEnd\n"
-        result += "\n"
-        return result
+            parts.append(f"\t\t\t{{{user_data.education}}}{{}}")
+        parts.append(f"\t\t\t{{{user_data.degree} in {user_data.major}}}{{{'GPA : ' + user_data.grade if user_data.grade else ''}}}")
+        parts.append("\t\\resumeSubHeadingListEnd\n")
+        parts.append("\n")
+        return "".join(parts)
     
     def _write_skills(self):
-        result = "\n"
-        result += "\\vspace{-13pt}\\section{Skills}\n"
-        result += " \\begin{itemize}[leftmargin=0.15in, label={}]\n"
-        result += "    \\footnotesize{\\item{\n"
-        result += f"     \\textbf{{Languages}}{{: {', '.join(config.LANGUAGE_LIST)}}} \\\\\n"
-        result += f"     \\textbf{{Frameworks and Libraries}}{{: {', '.join(config.TECH_STACK_LIST)}}} \\\\\n"
-        result += "     \n"
-        result += "    }}\n"
-        result += " \\end{itemize}\n"
-        result += "\n"
-        return result
+        parts = ["\n"]
+        parts.append("\\vspace{-13pt}\\section{Skills}\n")
+        parts.append(" \\begin{itemize}[leftmargin=0.15in, label={}]\n")
+        parts.append("    \\footnotesize{\\item{\n")
+        parts.append(f"     \\textbf{{Languages}}{{: {', '.join(config.LANGUAGE_LIST)}}} \\\\\n")
+        parts.append(f"     \\textbf{{Frameworks and Libraries}}{{: {', '.join(config.TECH_STACK_LIST)}}} \\\\\n")
+        parts.append("     \n")
+        parts.append("    }}\n")
+        parts.append(" \\end{itemize}\n")
+        parts.append("\n")
+        return "".join(parts)
 
     
     def _escape_latex(self, text: str) -> str:
@@ -92,10 +119,11 @@ class ResumeWriter:
         return text
     
 
-    def _write_project_with_bullet_points(self, project_id: int, bullet_points: List[str]) -> str:
-        result = ""
-        project_service = ProjectService()
-        project = project_service.get_project(project_id)
+    def _write_project_with_bullet_points(self, project_id: int, bullet_points: List[str], item_map: Optional[Dict[str, Any]] = None) -> str:
+        parts = []
+        project = (item_map or {}).get(item_key("project", project_id))
+        if project is None:
+            project = self.project_service.get_project(project_id)
 
         project_name = self._escape_latex(project.project_name)
         tech_stack = self._escape_latex(", ".join(project.tech_stack))
@@ -106,110 +134,111 @@ class ResumeWriter:
             start_date = ""
             end_date = ""
 
-        result += "\n"
-        result += "\t\\resumeProjectHeading\n"
+        parts.append("\n")
+        parts.append("\t\\resumeProjectHeading\n")
         # {\textbf{Gitlytics} $|$ \emph{Python, Flask, React, PostgreSQL, Docker}}{June 2020 -- Present}
-        result += f"\t{{\\textbf{{{project_name}}} $|$ \\emph{{{tech_stack}}}}}{{{start_date} {'--' if start_date and end_date else ''} {end_date}}}\n"
+        parts.append(f"\t{{\\textbf{{{project_name}}} $|$ \\emph{{{tech_stack}}}}}{{{start_date} {'--' if start_date and end_date else ''} {end_date}}}\n")
         
-        result += "\t\\resumeItemListStart\n"
+        parts.append("\t\\resumeItemListStart\n")
         for bullet_point in bullet_points:
-            result += f"\t\t\t\\resumeItem{{{self._escape_latex(bullet_point)}}}\n"
+            parts.append(f"\t\t\t\\resumeItem{{{self._escape_latex(bullet_point)}}}\n")
         
-        result += "\t\t\\resumeItemListEnd\n"
-        result += "\n"
+        parts.append("\t\t\\resumeItemListEnd\n")
+        parts.append("\n")
 
-        return result
+        return "".join(parts)
     
     def _format_phone_number(self, phone_number: str) -> str:
         # format phone number to be 123-456-7890
         return f"{phone_number[:3]}-{phone_number[3:6]}-{phone_number[6:]}"
 
-    def _write_experience_with_bullet_points(self, experience_id: int, bullet_points: List[str]) -> str:
-        result = ""
-        experience_service = ExperienceService()
-        experience = experience_service.get_experience(experience_id)
+    def _write_experience_with_bullet_points(self, experience_id: int, bullet_points: List[str], item_map: Optional[Dict[str, Any]] = None) -> str:
+        parts = []
+        experience = (item_map or {}).get(item_key("experience", experience_id))
+        if experience is None:
+            experience = self.experience_service.get_experience(experience_id)
 
-        result += "\n"
+        parts.append("\n")
         title = self._escape_latex(experience.role_title)
         start_date = datetime.strptime(experience.start_date, "%Y-%m").strftime("%b %Y")
         end_date = datetime.strptime(experience.end_date, "%Y-%m").strftime("%b %Y")
         company_name = self._escape_latex(experience.company_name)
         company_location = self._escape_latex(experience.company_location)
 
-        result += "\t\\resumeSubheading\n"
-        result += f"\t\t{{{title}}}{{{start_date} -- {end_date}}}\n"
-        result += f"\t\t{{{company_name}}}{{{company_location}}}\n"
-        result += "\t\t\\resumeItemListStart\n"
+        parts.append("\t\\resumeSubheading\n")
+        parts.append(f"\t\t{{{title}}}{{{start_date} -- {end_date}}}\n")
+        parts.append(f"\t\t{{{company_name}}}{{{company_location}}}\n")
+        parts.append("\t\t\\resumeItemListStart\n")
 
         for bullet_point in bullet_points:
-            result += f"\t\t\t\\resumeItem{{{self._escape_latex(bullet_point)}}}\n"
+            parts.append(f"\t\t\t\\resumeItem{{{self._escape_latex(bullet_point)}}}\n")
         
-        result += "\t\t\\resumeItemListEnd\n"
-        result += "\n"
+        parts.append("\t\t\\resumeItemListEnd\n")
+        parts.append("\n")
         
-        return result
+        return "".join(parts)
     
-    def _write_experience_section(self, exp: List[Tuple[int, List[str]]]):
-        result = "\n"
-        result += "\section{Experience}\n"
-        result += "\t\\resumeSubHeadingListStart\n"
+    def _write_experience_section(self, exp: List[Tuple[int, List[str]]], item_map: Optional[Dict[str, Any]] = None):
+        parts = ["\n"]
+        parts.append("\section{Experience}\n")
+        parts.append("\t\\resumeSubHeadingListStart\n")
         for exp_id, bullet_points in exp:
-            result += self._write_experience_with_bullet_points(exp_id, bullet_points)
-        result += "\t\\resumeSubHeadingListEnd\n"
-        result += "\n"
-        return result
+            parts.append(self._write_experience_with_bullet_points(exp_id, bullet_points, item_map))
+        parts.append("\t\\resumeSubHeadingListEnd\n")
+        parts.append("\n")
+        return "".join(parts)
     
-    def _write_project_section(self, proj: List[Tuple[int, List[str]]]):
-        result = "\n"
-        result += "\section{Projects}\n"
-        result += "\t\\resumeSubHeadingListStart\n"
+    def _write_project_section(self, proj: List[Tuple[int, List[str]]], item_map: Optional[Dict[str, Any]] = None):
+        parts = ["\n"]
+        parts.append("\section{Projects}\n")
+        parts.append("\t\\resumeSubHeadingListStart\n")
         for proj_id, bullet_points in proj:
-            result += self._write_project_with_bullet_points(proj_id, bullet_points)
-        result += "\t\\resumeSubHeadingListEnd\n"
-        result += "\n"
-        return result
+            parts.append(self._write_project_with_bullet_points(proj_id, bullet_points, item_map))
+        parts.append("\t\\resumeSubHeadingListEnd\n")
+        parts.append("\n")
+        return "".join(parts)
 
-    def write_resume(self, user_id: int, file_path: str, exp: List[Tuple[int, List[str]]], proj: List[Tuple[int, List[str]]]):
+    def render_resume(self, user_id: int, exp: List[Tuple[int, List[str]]], proj: List[Tuple[int, List[str]]],
+                      item_map: Optional[Dict[str, Any]] = None, profile: Optional[Any] = None) -> str:
         """
-        Write resume to file
-        """                 
-        # copy and write template to file
-        template = self._load_template()
-        with open(file_path, "w") as file:
-            file.write(template)
-            file.write("\n")
-            file.write("\\begin{document}")
-        
-        # write header
-        header_str = self._write_header(user_id)
-        with open(file_path, "a") as file:
-            file.write(header_str)
+        Render the resume LaTeX source and return it without touching the output directory
 
-        # write education
-        education_str = self._write_education(user_id)
-        with open(file_path, "a") as file:
-            file.write(education_str)
-        
-        # write skills
-        skills_str = self._write_skills()
-        with open(file_path, "a") as file:
-            file.write(skills_str)
-        
-        # write experience
-        exp_str = self._write_experience_section(exp)
-        with open(file_path, "a") as file:
-            file.write(exp_str)
+        profile is the user snapshot from UserService.get_user_profile and item_map holds
+        the experiences and projects already loaded for this request (see services.item_map).
+        Both are loaded here if not given, so no section queries the database on its own.
+        """
+        if profile is None:
+            profile = self.user_service.get_user_profile(user_id)
+        if item_map is None:
+            if profile is not None:
+                item_map = profile_item_map(profile)
+            else:
+                item_map = load_item_map([exp_id for exp_id, _ in exp], [proj_id for proj_id, _ in proj])
 
-        # write project
-        proj_str = self._write_project_section(proj)
-        with open(file_path, "a") as file:
-            file.write(proj_str)
+        parts = [
+            self._load_template(),
+            "\n",
+            "\\begin{document}",
+            self._write_header(user_id, profile),
+            self._write_education(user_id, profile),
+            self._write_skills(),
+            self._write_experience_section(exp, item_map),
+            self._write_project_section(proj, item_map),
+            "\n",
+            "\\end{document}",
+        ]
+        return "".join(parts)
 
-        # close file
-        with open(file_path, "a") as file:
-            file.write("\n")
-            file.write("\\end{document}")
-        
+    def write_resume(self, user_id: int, file_path: str, exp: List[Tuple[int, List[str]]], proj: List[Tuple[int, List[str]]],
+                     item_map: Optional[Dict[str, Any]] = None, profile: Optional[Any] = None):
+        """
+        Write resume to file
+
+        The whole document is rendered in memory first and then written in one go, so
+        a failure while rendering never leaves a truncated .tex file behind.
+        """
+        content = self.render_resume(user_id, exp, proj, item_map, profile)
+        write_file_atomically(file_path, content)
 
     def _load_template(self):
         with open(self.template_path, "r") as file:
@@ -0,0 +1,64 @@
+from model.schema import ExperienceDB, JobPostingDB, ProjectDB, SkillDB
+from model.database import Database
+from model.skills import (
+    item_overlaps_select, items_with_skill_select, job_posting_overlaps_select,
+    job_postings_with_skill_select, job_skills_select, rebuild_skill_index
+)
+from typing import Dict, List, Optional, Tuple
+
+class SkillService:
+    """Set-based skill queries over the normalized skills, item_skills and job_skills tables.
+
+    The tables are kept in sync by the experience, project and job posting services,
+    so these queries never need to load tech stacks into Python.
+    """
+    def __init__(self):
+        self.db = Database.get_instance()
+
+    def get_all_skills(self) -> List[SkillDB]:
+        with self.db as session:
+            return session.query(SkillDB).order_by(SkillDB.name).all()
+
+    def find_experiences_with_skill(self, skill: str, user_id: Optional[int] = None) -> List[ExperienceDB]:
+        """Return the experiences whose tech stack lists ``skill`` (case-insensitive)."""
+        with self.db as session:
+            return session.scalars(items_with_skill_select("experience", skill, user_id)).all()
+
+    def find_projects_with_skill(self, skill: str, user_id: Optional[int] = None) -> List[ProjectDB]:
+        """Return the projects whose tech stack lists ``skill`` (case-insensitive)."""
+        with self.db as session:
+            return session.scalars(items_with_skill_select("project", skill, user_id)).all()
+
+    def find_job_postings_with_skill(self, skill: str) -> List[JobPostingDB]:
+        """Return the job postings asking for ``skill`` (case-insensitive)."""
+        with self.db as session:
+            return session.scalars(job_postings_with_skill_select(skill)).all()
+
+    def get_matching_skills(self, user_id: int, job_posting_id: int) -> List[str]:
+        """Return the posting's technical skills that appear anywhere in the user's profile."""
+        with self.db as session:
+            return session.scalars(job_skills_select(user_id, job_posting_id)).all()
+
+    def get_missing_skills(self, user_id: int, job_posting_id: int) -> List[str]:
+        """Return the posting's technical skills that appear nowhere in the user's profile."""
+        with self.db as session:
+            return session.scalars(job_skills_select(user_id, job_posting_id, matched=False)).all()
+
+    def get_item_skill_overlaps(self, user_id: int, job_posting_id: int) -> List[Tuple[str, int, int]]:
+        """Count the skills each of the user's experiences and projects shares with a posting.
+
+        Returns ``(item_type, item_id, overlap)`` tuples, largest overlap first; items
+        sharing no skill are left out.
+        """
+        with self.db as session:
+            return [tuple(row) for row in session.execute(item_overlaps_select(user_id, job_posting_id))]
+
+    def find_matching_job_postings(self, user_id: int, limit: int = 10) -> List[Tuple[JobPostingDB, int]]:
+        """Return ``(job_posting, overlap)`` for the postings sharing the most skills with the user."""
+        with self.db as session:
+            return [tuple(row) for row in session.execute(job_posting_overlaps_select(user_id, limit))]
+
+    def rebuild_skill_index(self) -> Dict[str, int]:
+        """Re-derive all skill links from the stored tech stacks and job skills in one transaction."""
+        with self.db.session_scope() as session:
+            return rebuild_skill_index(session)
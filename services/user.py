@@ -1,34 +1,67 @@
+from sqlalchemy import delete
+from sqlalchemy.orm import selectinload
 from model.schema import User, UserDB
 from model.database import Database
-from typing import List, Optional
+from model.versioning import stamp_row, touch
+from services.experience import ExperienceService
+from services.project import ProjectService
+from services.read_cache import get_read_cache
+from typing import Dict, List, Optional
 
 class UserService:
     def __init__(self):
         self.db = Database.get_instance()
+        self.cache = get_read_cache()
+
+    @staticmethod
+    def _to_row(user: User) -> dict:
+        return stamp_row("users", {
+            "name": user.name,
+            "email": user.email,
+            "phone": user.phone,
+            "personality": user.personality,
+            "education": user.education,
+            "degree": user.degree,
+            "major": user.major,
+            "grade": user.grade,
+            "location": user.location,
+            "grad_year": user.grad_year
+        })
 
     def create_user(self, user: User) -> UserDB:
         with self.db as session:
-            db_user = UserDB(
-                name=user.name,
-                email=user.email,
-                phone=user.phone,
-                personality=user.personality,
-                education=user.education,
-                degree=user.degree,
-                major=user.major,
-                grade=user.grade,
-                location=user.location,
-                grad_year=user.grad_year
-            )
+            db_user = UserDB(**self._to_row(user))
             session.add(db_user)
             session.commit()
             session.refresh(db_user)
             return db_user
 
     def get_user(self, user_id: int) -> Optional[UserDB]:
+        return self.cache.get("user", user_id, lambda: self._load_user(user_id))
+
+    def _load_user(self, user_id: int) -> Optional[UserDB]:
         with self.db as session:
             return session.query(UserDB).filter(UserDB.id == user_id).first()
 
+    def get_user_profile(self, user_id: int) -> Optional[UserDB]:
+        """Load a user together with all experiences and projects as a detached snapshot.
+
+        The collections are fetched with ``selectinload`` (one query per table), so
+        ``profile.experiences`` and ``profile.projects`` can be read after the session
+        closes and shared across threads without touching the database again.
+        """
+        with self.db as session:
+            user = session.query(UserDB).options(
+                selectinload(UserDB.experiences),
+                selectinload(UserDB.projects)
+            ).filter(UserDB.id == user_id).first()
+            if user is None:
+                return None
+            for item in [*user.experiences, *user.projects]:
+                session.expunge(item)
+            session.expunge(user)
+            return user
+
     def get_user_by_email(self, email: str) -> Optional[UserDB]:
         with self.db as session:
             return session.query(UserDB).filter(UserDB.email == email).first()
@@ -38,20 +71,38 @@ class UserService:
             return session.query(UserDB).all()
 
     def update_user(self, user_id: int, user_data: User) -> Optional[UserDB]:
-        with self.db as session:
+        with self.db.session_scope() as session:
             db_user = session.query(UserDB).filter(UserDB.id == user_id).first()
             if db_user:
                 for key, value in user_data.dict(exclude_unset=True).items():
                     setattr(db_user, key, value)
-                session.commit()
-                session.refresh(db_user)
+                touch(db_user)
+                session.flush()
+                self.db.run_after_commit(lambda: self.cache.invalidate("user", user_id))
             return db_user
 
     def delete_user(self, user_id: int) -> bool:
-        with self.db as session:
+        with self.db.session_scope() as session:
             db_user = session.query(UserDB).filter(UserDB.id == user_id).first()
             if db_user:
                 session.delete(db_user)
-                session.commit()
+                self.db.run_after_commit(lambda: self.cache.invalidate("user", user_id))
                 return True
             return False
+
+    def purge_user(self, user_id: int) -> Dict[str, int]:
+        """Delete a user with all of their experiences and projects in one transaction.
+
+        Runs one DELETE per table and returns the number of rows removed from each.
+        """
+        with self.db.session_scope() as session:
+            counts = {
+                "experiences": ExperienceService().delete_user_experiences(user_id),
+                "projects": ProjectService().delete_user_projects(user_id),
+            }
+            result = session.execute(
+                delete(UserDB).where(UserDB.id == user_id).execution_options(synchronize_session=False)
+            )
+            counts["users"] = result.rowcount
+            self.db.run_after_commit(lambda: self.cache.invalidate("user", user_id))
+            return counts
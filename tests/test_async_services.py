@@ -0,0 +1,171 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from sqlalchemy.orm import object_session
+from model.schema import User, Experience, Project, JobPosting, Company
+from model.database import AsyncDatabase, Base, engine, to_async_database_url
+from services.user import UserService
+from services.async_services import (
+    AsyncUserService, AsyncExperienceService, AsyncProjectService,
+    AsyncJobPostingService, AsyncCompanyService, AsyncSkillService
+)
+from services.experience import ExperienceService
+from services.project import ProjectService
+from services.job_posting import JobPostingService, compute_content_fingerprint
+from services.company import CompanyService
+from services.skill import SkillService
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    asyncio.run(AsyncDatabase.get_instance().dispose())
+    Base.metadata.drop_all(bind=engine)
+
+def _public_methods(cls):
+    return {name for name in dir(cls) if not name.startswith("_") and callable(getattr(cls, name))}
+
+async def run_async_services():
+    user_service = AsyncUserService()
+    experience_service = AsyncExperienceService()
+    project_service = AsyncProjectService()
+    job_posting_service = AsyncJobPostingService()
+    company_service = AsyncCompanyService()
+    skill_service = AsyncSkillService()
+
+    print("\nTest 2: Creating and reading a user...")
+    user = await user_service.create_user(User(
+        name="Jane Doe",
+        email="jane@example.com",
+        phone="1234567890",
+        education="Bachelor's",
+        degree="BS",
+        major="Computer Science",
+        location="Seattle"
+    ))
+    assert (await user_service.get_user(user.id)).email == "jane@example.com"
+    assert (await user_service.get_user_by_email("jane@example.com")).id == user.id
+
+    print("\nTest 3: Bulk creating experiences and projects...")
+    experience_ids = await experience_service.create_experiences([
+        Experience(
+            user_id=user.id,
+            company_name=f"Company {i}",
+            role_title="Engineer",
+            company_location="Remote",
+            start_date="2020-01",
+            end_date="2021-01",
+            long_description="Long description",
+            short_description="Short description"
+        )
+        for i in range(10)
+    ])
+    assert len(experience_ids) == 10
+    assert (await experience_service.get_experience(experience_ids[3])).company_name == "Company 3"
+    assert len(await experience_service.get_experiences_by_ids(experience_ids[:4])) == 4
+    assert [row.id for row in await experience_service.search_experiences("company 3")] == [experience_ids[3]]
+    project = await project_service.create_project(Project(
+        user_id=user.id,
+        project_name="Resume AI",
+        long_description="Long description",
+        short_description="Short description",
+        tech_stack=["python", "SQLite"]
+    ))
+    assert await project_service.count_user_projects(user.id) == 1
+
+    print("\nTest 4: Async writes invalidate the synchronous read cache...")
+    sync_experience_service = ExperienceService()
+    assert sync_experience_service.get_experience(experience_ids[9]).company_name == "Company 9"
+    await experience_service.update_experience(experience_ids[9], Experience(
+        user_id=user.id,
+        company_name="Renamed",
+        role_title="Engineer",
+        company_location="Remote",
+        start_date="2020-01",
+        end_date="2021-01",
+        long_description="Long description",
+        short_description="Short description"
+    ))
+    assert sync_experience_service.get_experience(experience_ids[9]).company_name == "Renamed"
+    assert await experience_service.delete_experience(experience_ids[9])
+    assert sync_experience_service.get_experience(experience_ids[9]) is None
+    experience_ids = experience_ids[:9]
+
+    print("\nTest 5: Loading the profile concurrently with other reads...")
+    profile, experiences, projects = await asyncio.gather(
+        user_service.get_user_profile(user.id),
+        experience_service.get_user_experiences(user.id),
+        project_service.get_user_projects(user.id)
+    )
+    assert object_session(profile) is None
+    assert len(profile.experiences) == 9 and len(experiences) == 9
+    assert [item.id for item in profile.projects] == [item.id for item in projects] == [project.id]
+
+    print("\nTest 6: Job postings and companies...")
+    description = "Build distributed systems in Python and Go for our platform team."
+    posting = await job_posting_service.create_job_posting(JobPosting(
+        job_posting_url="https://www.example.com/jobs/1?utm_source=feed",
+        company_name="Example",
+        job_title="Engineer",
+        job_location="Remote",
+        job_type="Full-time",
+        job_description=description,
+        job_qualifications=["Python"],
+        job_technical_skills=["Python", "Go"],
+        content_fingerprint=compute_content_fingerprint(description)
+    ))
+    assert (await job_posting_service.get_job_posting_by_url("https://example.com/jobs/1")).id == posting.id
+    assert (await job_posting_service.find_near_duplicate(posting.content_fingerprint)).id == posting.id
+    company = await company_service.create_company(Company(
+        name="Example",
+        mission="Build things",
+        location="Remote",
+        website="https://example.com",
+        industry="Software",
+        description="An example company"
+    ))
+    assert (await company_service.get_company_by_name("Example")).id == company.id
+    assert [row.job_title async for row in job_posting_service.iter_job_postings(columns=["job_title"])] == ["Engineer"]
+    assert [len(page) async for page in job_posting_service.iter_job_posting_pages(page_size=1)] == [1]
+    assert [row.id for row in await company_service.get_companies_page(limit=5)] == [company.id]
+    assert await skill_service.get_matching_skills(user.id, posting.id) == ["python"]
+    assert await skill_service.get_missing_skills(user.id, posting.id) == ["Go"]
+
+    print("\nTest 7: Purging the user...")
+    assert sync_experience_service.get_experience(experience_ids[0]) is not None
+    assert UserService().get_user(user.id) is not None
+    assert await user_service.purge_user(user.id) == {"experiences": 9, "projects": 1, "users": 1}
+    assert sync_experience_service.get_experience(experience_ids[0]) is None
+    assert UserService().get_user(user.id) is None
+    assert await user_service.get_user(user.id) is None
+
+def test_async_services():
+    init_test_db()
+
+    try:
+        print("\nTest 1: Matching the synchronous method sets...")
+        for async_cls, sync_cls in [
+            (AsyncUserService, UserService),
+            (AsyncExperienceService, ExperienceService),
+            (AsyncProjectService, ProjectService),
+            (AsyncJobPostingService, JobPostingService),
+            (AsyncCompanyService, CompanyService),
+            (AsyncSkillService, SkillService),
+        ]:
+            assert _public_methods(async_cls) == _public_methods(sync_cls), async_cls.__name__
+        assert to_async_database_url("sqlite:///./resume.db").drivername == "sqlite+aiosqlite"
+        assert to_async_database_url("postgresql://user@host/db").drivername == "postgresql+asyncpg"
+
+        asyncio.run(run_async_services())
+    finally:
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting async service tests...")
+    test_async_services()
+    print("\nAll tests completed!")
@@ -0,0 +1,73 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.bullet_cache import BulletCacheService, make_bullet_cache_key
+from model.database import Base, engine
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def test_bullet_cache_service():
+    init_test_db()
+    try:
+        service = BulletCacheService()
+
+        print("\nTest 1: Building cache keys...")
+        key = make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", "Python match", "1")
+        assert key == make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", "Python match", "1")
+        assert key != make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", "Python match", "2")
+        assert key != make_bullet_cache_key("Company: Tech Corp", "Job Context: Frontend", "Python match", "1")
+        assert key != make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", None, "1")
+        # Outputs differing in size or prompt never share an entry
+        sized_key = make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", "Python match", "1", num_bullets=3)
+        assert sized_key != make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", "Python match", "1", num_bullets=5)
+        assert sized_key != make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", "Python match", "1",
+                                                  num_bullets=3, candidate_count=3)
+        assert sized_key != make_bullet_cache_key("Company: Tech Corp", "Job Context: Backend", "Python match", "1",
+                                                  num_bullets=3, mode="batch")
+
+        print("\nTest 2: Saving and reading variants...")
+        assert service.get_bullets(key) is None
+        assert service.next_variant(key) == 0
+        service.save_bullets(key, ["First variant bullet"], "experience", variant=0)
+        assert service.next_variant(key) == 1
+        service.save_bullets(key, ["Second variant bullet"], "experience", variant=1)
+        assert service.get_bullets(key).bullet_points == ["Second variant bullet"]
+        assert service.get_bullets(key, variant=0).bullet_points == ["First variant bullet"]
+
+        print("\nTest 3: Replacing a variant slot...")
+        service.save_bullets(key, ["Replaced bullet"], "experience", variant=0)
+        assert service.get_bullets(key, variant=0).bullet_points == ["Replaced bullet"]
+        assert service.next_variant(key) == 2
+
+        print("\nTest 4: Reading many keys at once...")
+        other_key = make_bullet_cache_key("Project: Compiler", "Job Context: Backend", None, "1")
+        service.save_bullets(other_key, ["Project bullet"], "project")
+        cached = service.get_bullets_many([key, other_key, "missing"])
+        print(f"Cached keys: {len(cached)}")
+        assert cached[key].bullet_points == ["Second variant bullet"]
+        assert cached[other_key].item_type == "project"
+        assert "missing" not in cached
+
+        print("\nTest 5: Adding a variant in the next free slot...")
+        added = service.add_variant(other_key, ["Another project bullet"], "project")
+        assert added.variant == 1
+        assert service.get_bullets(other_key).bullet_points == ["Another project bullet"]
+
+        print("\nTest 6: Clearing the cache...")
+        assert service.clear() == 4
+        assert service.get_bullets(key) is None
+    finally:
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting bullet cache service tests...")
+    test_bullet_cache_service()
+    print("\nAll tests completed!")
@@ -0,0 +1,60 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.bullet_scoring import (
+    count_duplicates, keyword_coverage, length_score, score_bullet_set, select_best_bullets, xyz_structure_score
+)
+
+GOOD_SET = [
+    "Cut API latency by 40% by adding Redis caching in Go, which reduced p99 latency to 80ms",
+    "Built a CI pipeline using Docker and GitHub Actions, which halved deployment time",
+    "Migrated 2M rows to Postgres by writing batch jobs in Python, which removed nightly downtime",
+]
+
+WEAK_SET = [
+    "Worked on backend services for the team",
+    "Worked on the backend services for our team",
+]
+
+def test_bullet_scoring():
+    print("\nTest 1: Scoring individual checks...")
+    assert xyz_structure_score(GOOD_SET[0]) == 1.0
+    assert xyz_structure_score("Worked on backend services") < 0.5
+    assert length_score("Too short") < 1.0
+    assert length_score(GOOD_SET[0]) == 1.0
+    assert length_score("x" * 600) == 0.0
+    assert count_duplicates(WEAK_SET) == 1
+    assert count_duplicates(GOOD_SET) == 0
+    assert keyword_coverage(GOOD_SET, ["Go", "Redis", "Kubernetes"]) == 2 / 3
+    assert keyword_coverage(GOOD_SET, []) == 1.0
+    # "Go" must not match inside other words
+    assert keyword_coverage(["Managed Google Cloud deployments"], ["Go"]) == 0.0
+
+    print("\nTest 2: Scoring bullet point sets...")
+    good_score, details = score_bullet_set(GOOD_SET, 3, ["Go", "Redis", "Postgres"])
+    weak_score, _ = score_bullet_set(WEAK_SET, 3, ["Go", "Redis", "Postgres"])
+    print(f"Good set: {good_score} {details}")
+    print(f"Weak set: {weak_score}")
+    assert good_score > weak_score
+    assert score_bullet_set([], 3)[0] == 0.0
+
+    print("\nTest 3: Selecting the best candidate...")
+    best, scores = select_best_bullets([WEAK_SET, GOOD_SET], 3, ["Go"])
+    assert best == GOOD_SET
+    assert len(scores) == 2 and scores[1] > scores[0]
+
+    # Duplicates are dropped from the chosen set
+    best, _ = select_best_bullets([WEAK_SET], 3)
+    assert best == WEAK_SET[:1]
+
+    # Ties keep the first candidate
+    best, _ = select_best_bullets([GOOD_SET, list(GOOD_SET)], 3)
+    assert best == GOOD_SET
+    assert select_best_bullets([], 3) == ([], [])
+
+if __name__ == "__main__":
+    print("Starting bullet scoring tests...")
+    test_bullet_scoring()
+    print("\nAll tests completed!")
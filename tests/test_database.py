@@ -0,0 +1,113 @@
+# update sys path to include the project root
+import sys
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import text
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.schema import Experience, ExperienceDB
+from services.experience import ExperienceService
+from model.database import Database, Base, engine, create_database_engine
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def make_experience(index: int) -> Experience:
+    return Experience(
+        user_id=1,
+        company_name=f"Tech Corp {index}",
+        role_title="Software Engineer",
+        company_location="San Francisco",
+        start_date="2020-01",
+        end_date="2023-12",
+        long_description="Built cloud infrastructure",
+        short_description="Software Engineer",
+        tech_stack=["Python"]
+    )
+
+def test_database():
+    init_test_db()
+    try:
+        db = Database.get_instance()
+
+        print("\nTest 1: Nested units of work share a session...")
+        with db as outer:
+            with db as inner:
+                assert inner is outer
+            # The inner block must not close the outer session
+            assert outer.query(ExperienceDB).count() == 0
+        with db as next_session:
+            assert next_session is not outer
+
+        print("\nTest 2: Threads get isolated sessions...")
+        def current_session(_):
+            with db as session:
+                return session
+        # Keep the sessions themselves so closed ones cannot be reallocated at the same id
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            main_session = current_session(None)
+            thread_sessions = list(executor.map(current_session, range(4)))
+        assert all(session is not main_session for session in thread_sessions)
+
+        print("\nTest 3: Concurrent writes and reads...")
+        experience_service = ExperienceService()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            created = list(executor.map(lambda i: experience_service.create_experience(make_experience(i)), range(40)))
+        assert len({experience.id for experience in created}) == 40
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            fetched = list(executor.map(lambda experience: experience_service.get_experience(experience.id), created))
+        assert [experience.company_name for experience in fetched] == [f"Tech Corp {i}" for i in range(40)]
+
+        print("\nTest 4: session_scope commits or rolls back...")
+        with db.session_scope() as session:
+            session.add(ExperienceDB(user_id=2, company_name="Committed"))
+        try:
+            with db.session_scope() as session:
+                session.add(ExperienceDB(user_id=2, company_name="Rolled back"))
+                raise ValueError("abort")
+        except ValueError:
+            pass
+        with db as session:
+            names = [row.company_name for row in session.query(ExperienceDB).filter(ExperienceDB.user_id == 2)]
+        assert names == ["Committed"]
+
+        print("\nTest 5: A scope inside a plain unit of work still commits...")
+        with db:
+            ids = experience_service.create_experiences([make_experience(i) for i in range(3)])
+            with db.session_scope():
+                with db.session_scope() as session:
+                    session.add(ExperienceDB(user_id=3, company_name="Nested"))
+        assert len(ids) == 3
+        assert experience_service.count_user_experiences(1) == 43
+        assert experience_service.count_user_experiences(3) == 1
+    finally:
+        cleanup_test_db()
+
+def test_database_engine():
+    print("\nTest 1: SQLite file databases get the tuning pragmas...")
+    with tempfile.TemporaryDirectory() as directory:
+        file_engine = create_database_engine(f"sqlite:///{os.path.join(directory, 'test.db')}")
+        with file_engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert connection.execute(text("PRAGMA mmap_size")).scalar() > 0
+        file_engine.dispose()
+
+    print("\nTest 2: In-memory databases skip WAL...")
+    memory_engine = create_database_engine("sqlite://")
+    with memory_engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+if __name__ == "__main__":
+    print("Starting database session tests...")
+    test_database()
+    test_database_engine()
+    print("\nAll tests completed!")
@@ -97,7 +97,107 @@ def test_experience_service():
         # Clean up the test database
         cleanup_test_db()
 
+def test_create_experiences_bulk():
+    init_test_db()
+    user_service = UserService()
+    experience_service = ExperienceService()
+    
+    try:
+        created_user = user_service.create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle",
+            personality=["curious"],
+            grade="A",
+            grad_year="2024"
+        ))
+        experiences = [
+            Experience(
+                user_id=created_user.id,
+                company_name=f"Company {i}",
+                role_title="Engineer",
+                company_location="Remote",
+                start_date="2020-01",
+                end_date="2021-01",
+                long_description=f"Long description {i}",
+                short_description=f"Short description {i}",
+                tech_stack=["Python"]
+            )
+            for i in range(1000)
+        ]
+        
+        print("\nTest 1: Bulk creating experiences...")
+        ids = experience_service.create_experiences(experiences)
+        assert len(ids) == 1000
+        # Ids come back in input order
+        assert [experience.company_name for experience in sorted(experience_service.get_experiences_by_ids(ids[:3]), key=lambda row: ids.index(row.id))] == [
+            "Company 0", "Company 1", "Company 2"
+        ]
+        assert experience_service.get_experience(ids[-1]).company_name == "Company 999"
+        assert experience_service.create_experiences([]) == []
+        
+        print("\nTest 2: Rolling back a failed bulk transaction...")
+        try:
+            with Database.get_instance().session_scope():
+                experience_service.create_experiences(experiences[:5])
+                raise RuntimeError("import failed")
+        except RuntimeError:
+            pass
+        assert len(experience_service.get_user_experiences(created_user.id)) == 1000
+    finally:
+        cleanup_test_db()
+
+def test_content_hash():
+    init_test_db()
+    user_service = UserService()
+    experience_service = ExperienceService()
+
+    try:
+        created_user = user_service.create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        experience = Experience(
+            user_id=created_user.id,
+            company_name="Tech Corp",
+            role_title="Engineer",
+            company_location="Remote",
+            start_date="2020-01",
+            end_date="2021-01",
+            long_description="Built services",
+            short_description="Backend work",
+            tech_stack=["Python"]
+        )
+
+        print("\nTest 1: Hash and timestamp are set on create...")
+        created = experience_service.create_experience(experience)
+        assert len(created.content_hash) == 64 and created.updated_at is not None
+        assert created_user.content_hash is not None
+        # The same content hashes the same, whichever path created it
+        bulk_id, = experience_service.create_experiences([experience])
+        assert experience_service.get_experience(bulk_id).content_hash == created.content_hash
+
+        print("\nTest 2: Hash follows the content on update...")
+        unchanged = experience_service.update_experience(created.id, experience.model_copy(update={"tech_stack": ["Python"]}))
+        assert unchanged.content_hash == created.content_hash
+        assert unchanged.updated_at >= created.updated_at
+        changed = experience_service.update_experience(created.id, experience.model_copy(update={"tech_stack": ["Go"]}))
+        assert changed.content_hash != created.content_hash
+    finally:
+        cleanup_test_db()
+
 if __name__ == "__main__":
     print("Starting ExperienceService tests...")
     test_experience_service()
+    test_create_experiences_bulk()
+    test_content_hash()
     print("\nAll tests completed!") 
\ No newline at end of file
@@ -0,0 +1,72 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.schema import Experience, Project
+from services.experience import ExperienceService
+from services.project import ProjectService
+from services.item_map import item_key, load_item_map
+from model.database import Base, engine
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def test_item_map():
+    init_test_db()
+    try:
+        experience_service = ExperienceService()
+        project_service = ProjectService()
+
+        experience_ids = [
+            experience_service.create_experience(Experience(
+                user_id=1,
+                company_name=f"Tech Corp {i}",
+                role_title="Software Engineer",
+                company_location="San Francisco",
+                start_date="2020-01",
+                end_date="2023-12",
+                long_description="Built cloud infrastructure",
+                short_description="Software Engineer",
+                tech_stack=["Python", "AWS"]
+            )).id
+            for i in range(3)
+        ]
+        project_ids = [
+            project_service.create_project(Project(
+                user_id=1,
+                project_name=f"Project {i}",
+                long_description="Built a compiler",
+                short_description="Compiler",
+                tech_stack=["C++"]
+            )).id
+            for i in range(2)
+        ]
+
+        print("\nTest 1: Fetching experiences and projects by ids...")
+        experiences = experience_service.get_experiences_by_ids([experience_ids[0], experience_ids[2], 999])
+        assert sorted(experience.id for experience in experiences) == [experience_ids[0], experience_ids[2]]
+        projects = project_service.get_projects_by_ids(project_ids + project_ids)
+        assert sorted(project.id for project in projects) == project_ids
+        assert experience_service.get_experiences_by_ids([]) == []
+        assert project_service.get_projects_by_ids([]) == []
+
+        print("\nTest 2: Loading an item map...")
+        item_map = load_item_map(experience_ids[:2], project_ids[:1])
+        print(f"Loaded items: {sorted(item_map)}")
+        assert len(item_map) == 3
+        assert item_map[item_key("experience", experience_ids[1])].company_name == "Tech Corp 1"
+        assert item_map[item_key("project", project_ids[0])].project_name == "Project 0"
+        assert item_key("project", project_ids[1]) not in item_map
+    finally:
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting item map tests...")
+    test_item_map()
+    print("\nAll tests completed!")
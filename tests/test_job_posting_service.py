@@ -0,0 +1,167 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.schema import JobPosting
+from services.job_posting import (
+    NEAR_DUPLICATE_DISTANCE, JobPostingService, canonicalize_job_url, compute_content_fingerprint,
+    fingerprint_distance
+)
+from model.database import Base, Database, engine
+from model.fingerprints import near_duplicate_candidates_select
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+WORKDAY_URL = "https://nvidia.wd5.myworkdayjobs.com/en-US/NVIDIAExternalCareerSite/job/US-CA-Santa-Clara/Software-Research-Intern_JR1998253?jobFamilyGroup=0c40f6bd1d8f10ae43ffda1e8d447e94&locationHierarchy1=2fcb99c455831013ea52fb338f2932d8"
+
+JOB_TEXT = " ".join([
+    "We are looking for a software engineer to build distributed systems in Python and Go.",
+    "You will design APIs, own services end to end and improve reliability of our platform.",
+    "Requirements: 3+ years of backend experience, PostgreSQL, Kubernetes and AWS.",
+] * 3)
+
+OTHER_JOB_TEXT = " ".join([
+    "We are looking for a data engineer to build batch pipelines in Scala and Spark.",
+    "You will model warehouse tables, own ETL jobs end to end and improve data quality for analysts.",
+    "Requirements: 2+ years of data experience, Snowflake, Airflow and GCP.",
+] * 3)
+
+def make_job_posting(url: str, title: str = "Software Engineer") -> JobPosting:
+    return JobPosting(
+        job_posting_url=url,
+        company_name="Tech Corp",
+        job_title=title,
+        job_location="Seattle, WA",
+        job_type="Full-time",
+        job_description="Build backend services in Python and Go.",
+        job_qualifications=["BS in Computer Science", "3+ years of Python"],
+        job_technical_skills=["Python", "Go", "PostgreSQL"]
+    )
+
+def test_job_posting_service():
+    # Initialize database
+    init_test_db()
+    
+    # Create service instance
+    job_posting_service = JobPostingService()
+    
+    try:
+        # Test 1: Create a job posting
+        print("\nTest 1: Creating a job posting...")
+        created = job_posting_service.create_job_posting(make_job_posting("https://jobs.example.com/1"))
+        print(f"Created job posting with ID: {created.id}")
+        
+        # Test 2: Bulk create job postings
+        print("\nTest 2: Bulk creating job postings...")
+        created_many = job_posting_service.create_job_postings([
+            make_job_posting(f"https://jobs.example.com/{i}", title=f"Engineer {i}") for i in range(2, 6)
+        ])
+        print(f"Created {len(created_many)} job postings")
+        assert [posting.job_title for posting in created_many] == [f"Engineer {i}" for i in range(2, 6)]
+        assert all(posting.id is not None for posting in created_many)
+        
+        # Test 3: Fetch several postings by URL in one query
+        print("\nTest 3: Getting job postings by URLs...")
+        found = job_posting_service.get_job_postings_by_urls([
+            "https://jobs.example.com/1", "https://jobs.example.com/3", "https://jobs.example.com/missing"
+        ])
+        print(f"Found {len(found)} job postings")
+        assert sorted(posting.job_posting_url for posting in found) == ["https://jobs.example.com/1", "https://jobs.example.com/3"]
+        assert job_posting_service.get_job_postings_by_urls([]) == []
+        
+        # Test 4: Get job posting by URL
+        print("\nTest 4: Getting job posting by URL...")
+        by_url = job_posting_service.get_job_posting_by_url("https://jobs.example.com/2")
+        print(f"Retrieved job posting: {by_url.job_title}")
+        assert by_url.job_title == "Engineer 2"
+        
+        # Test 5: Canonical URL normalization
+        print("\nTest 5: Normalizing job posting URLs...")
+        canonical = canonicalize_job_url(WORKDAY_URL)
+        print(f"Canonical URL: {canonical}")
+        assert canonical == "https://nvidia.wd5.myworkdayjobs.com/NVIDIAExternalCareerSite/job/US-CA-Santa-Clara/Software-Research-Intern_JR1998253"
+        assert canonicalize_job_url("https://WWW.Example.com/jobs/42/?utm_source=x&gh_jid=42#apply") == "https://example.com/jobs/42?gh_jid=42"
+        
+        job_posting_service.create_job_posting(make_job_posting(WORKDAY_URL, title="Research Intern"))
+        tracked_url = canonical + "?source=jobboardlinkedin"
+        found = job_posting_service.get_job_posting_by_url(tracked_url)
+        assert found is not None and found.job_title == "Research Intern"
+        assert len(job_posting_service.get_job_postings_by_urls([tracked_url])) == 1
+        
+        # Test 6: Near-duplicate detection with content fingerprints
+        print("\nTest 6: Finding near-duplicate postings...")
+        fingerprint = compute_content_fingerprint(JOB_TEXT)
+        near_fingerprint = compute_content_fingerprint(JOB_TEXT + " Posted 3 days ago.")
+        other_fingerprint = compute_content_fingerprint("Sales manager role focused on enterprise accounts, quotas and CRM pipelines in retail.")
+        print(f"Distances: near={fingerprint_distance(fingerprint, near_fingerprint)}, other={fingerprint_distance(fingerprint, other_fingerprint)}")
+        assert fingerprint_distance(fingerprint, near_fingerprint) <= NEAR_DUPLICATE_DISTANCE
+        assert fingerprint_distance(fingerprint, other_fingerprint) > NEAR_DUPLICATE_DISTANCE
+        
+        posting = make_job_posting("https://jobs.example.com/original", title="Backend Engineer")
+        posting.content_fingerprint = fingerprint
+        stored = job_posting_service.create_job_posting(posting)
+        duplicate = job_posting_service.find_near_duplicate(near_fingerprint)
+        assert duplicate is not None and duplicate.id == stored.id
+        assert job_posting_service.find_near_duplicate(other_fingerprint) is None
+        # A different posting written from the same template is not a duplicate
+        assert job_posting_service.find_near_duplicate(compute_content_fingerprint(OTHER_JOB_TEXT)) is None
+
+        # Candidates are prefiltered in SQL on the fingerprint bands before the exact distance is computed
+        other = make_job_posting("https://jobs.example.com/other", title="Data Engineer")
+        other.content_fingerprint = compute_content_fingerprint(OTHER_JOB_TEXT)
+        job_posting_service.create_job_posting(other)
+        with Database.get_instance() as session:
+            candidate_ids = [row.id for row in session.execute(near_duplicate_candidates_select(near_fingerprint))]
+        assert candidate_ids == [stored.id]
+        # Three flipped bits in three different bands still share the fourth band
+        spread_fingerprint = f"{int(fingerprint, 16) ^ (1 | 1 << 16 | 1 << 32):016x}"
+        assert fingerprint_distance(fingerprint, spread_fingerprint) == NEAR_DUPLICATE_DISTANCE
+        assert job_posting_service.find_near_duplicate(spread_fingerprint).id == stored.id
+        assert job_posting_service.find_near_duplicate(spread_fingerprint, max_distance=2) is None
+        
+    finally:
+        # Clean up the test database
+        cleanup_test_db()
+
+def test_save_node_keeps_fingerprint():
+    from agents.job_analysis_agent import JobAnalysisAgent
+    from experiments.job_scraper import JobInfo
+
+    init_test_db()
+    job_posting_service = JobPostingService()
+    try:
+        print("\nTest 7: Postings saved by the analyze_job graph can be found as near duplicates...")
+        save_job_to_db = JobAnalysisAgent().create_nodes()["save_job_to_db"]
+        fingerprint = compute_content_fingerprint(JOB_TEXT)
+        save_job_to_db({
+            "job_posting_url": "https://jobs.example.com/analyzed",
+            "job_info": JobInfo(
+                company_name="Tech Corp",
+                job_title="Backend Engineer",
+                location="Seattle, WA",
+                job_type="Full-time",
+                description="Build backend services in Python and Go.",
+                qualifications=["BS in Computer Science"]
+            ),
+            "job_technical_skills": ["Python", "Go"],
+            "content_fingerprint": fingerprint,
+        })
+        stored = job_posting_service.get_job_posting_by_url("https://jobs.example.com/analyzed")
+        assert stored is not None and stored.content_fingerprint == fingerprint
+        duplicate = job_posting_service.find_near_duplicate(compute_content_fingerprint(JOB_TEXT + " Posted 3 days ago."))
+        assert duplicate is not None and duplicate.id == stored.id
+    finally:
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting JobPostingService tests...")
+    test_job_posting_service()
+    test_save_node_keeps_fingerprint()
+    print("\nAll tests completed!")
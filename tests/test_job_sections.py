@@ -0,0 +1,98 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from experiments.job_sections import select_job_sections, detect_sections, estimate_tokens, classify_heading
+
+SAMPLE_PAGE = "\n".join([
+    "Skip to main content",
+    "Careers Home",
+    "Search for Jobs",
+    "Software Engineering Intern",
+    "Santa Clara, CA",
+    "Internship",
+    "About the role",
+    "You will build distributed training infrastructure for large models.",
+    "What you'll do:",
+    "Design and implement GPU networking libraries in C++ and CUDA.",
+    "Profile and optimize communication collectives.",
+    "Minimum Qualifications",
+    "Pursuing a BS or MS in Computer Science.",
+    "Experience with Python and C++.",
+    "Similar Jobs",
+] + [f"Unrelated Job Posting {i} - Remote" for i in range(200)] + [
+    "Follow Us",
+    "Privacy Policy",
+])
+
+NAV_PAGE = "\n".join([
+    "Sign In",
+    "Senior Software Engineer",
+    "NVIDIA - Santa Clara, CA",
+    "Full time",
+    "Job Description",
+    "Build the compilers behind our GPU software stack.",
+    "Strong communication skills",
+    "Preferred experience with LLVM is a plus.",
+    "What you need to succeed",
+    "5+ years of C++ experience.",
+    "Share this job",
+    "Privacy Policy",
+])
+
+def test_job_sections():
+    print("\nTest 1: Detecting sections...")
+    labels = [label for label, _ in detect_sections(SAMPLE_PAGE)]
+    print(f"Detected blocks: {labels}")
+    assert labels[:4] == ["header", "description", "responsibilities", "qualifications"]
+    assert all(label == "noise" for label in labels[4:])
+
+    print("\nTest 2: Selecting sections within budget...")
+    selected, metrics = select_job_sections(SAMPLE_PAGE, token_budget=500)
+    print(f"Metrics: {metrics}")
+    assert "Software Engineering Intern" in selected
+    assert "Profile and optimize communication collectives." in selected
+    assert "Experience with Python and C++." in selected
+    assert "Unrelated Job Posting" not in selected
+    assert metrics["tokens_saved"] > 0
+    assert metrics["sections_found"] == ["description", "qualifications", "responsibilities"]
+
+    print("\nTest 3: Trimming to a small budget...")
+    selected, metrics = select_job_sections(SAMPLE_PAGE, token_budget=40)
+    print(f"Selected {metrics['selected_tokens']} tokens")
+    assert metrics["selected_tokens"] <= 40
+    # Qualifications are kept first when the budget is tight
+    assert "Minimum Qualifications" in selected
+
+    print("\nTest 4: Falling back when no headings are found...")
+    plain_text = "\n".join(["Line of text without any known heading"] * 100)
+    selected, metrics = select_job_sections(plain_text, token_budget=50)
+    assert metrics["sections_found"] == []
+    assert estimate_tokens(selected) <= 50
+
+def test_nav_chrome_and_body_lines():
+    print("\nTest 1: Leading navigation does not hide the job header...")
+    blocks = detect_sections(NAV_PAGE)
+    print(f"Detected blocks: {blocks}")
+    assert blocks[0] == ("header", ["Sign In", "Senior Software Engineer", "NVIDIA - Santa Clara, CA", "Full time"])
+    assert [label for label, _ in blocks[1:]] == ["description", "qualifications", "noise", "noise"]
+    selected, _ = select_job_sections(NAV_PAGE)
+    assert "Senior Software Engineer" in selected
+    assert "NVIDIA - Santa Clara, CA" in selected
+    assert "Privacy Policy" not in selected
+
+    print("\nTest 2: Short body lines are not headings...")
+    assert classify_heading("Strong communication skills") is None
+    assert classify_heading("Preferred experience with LLVM") is None
+    assert classify_heading("Overview of our stack") is None
+    assert classify_heading("Technical Skills") == "qualifications"
+    assert classify_heading("Preferred:") == "qualifications"
+    assert classify_heading("Job Overview") == "description"
+    assert classify_heading("What you have") == "qualifications"
+
+if __name__ == "__main__":
+    print("Starting job section selection tests...")
+    test_job_sections()
+    test_nav_chrome_and_body_lines()
+    print("\nAll tests completed!")
@@ -0,0 +1,137 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from sqlalchemy import JSON, Column, Integer, MetaData, String, Table, inspect, text
+import model.schema
+from model.database import create_database_engine
+from model.fingerprints import compute_content_fingerprint, fingerprint_bands
+from model.migrations import plan_migrations, run_migrations
+
+def create_old_database(path):
+    """Create a database with the job_postings table as it was before canonical URLs and fingerprints."""
+    old_metadata = MetaData()
+    Table(
+        "job_postings", old_metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("job_posting_url", String),
+        Column("company_name", String),
+        Column("job_title", String),
+        Column("job_location", String),
+        Column("job_type", String),
+        Column("job_description", String),
+        Column("job_qualifications", JSON),
+        Column("job_technical_skills", JSON),
+    )
+    engine = create_database_engine(f"sqlite:///{path}")
+    old_metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO job_postings (job_posting_url, company_name, job_title, job_technical_skills) "
+            "VALUES ('https://example.com/jobs/1', 'Example', 'Engineer', '[\"Go\", \"SQL\"]')"
+        ))
+        connection.execute(text(
+            "INSERT INTO job_postings (job_posting_url, company_name, job_title) "
+            "VALUES ('https://www.example.com/jobs/2?utm_source=feed&id=7', 'Example', 'Designer'), "
+            "('https://example.com/jobs/1/?utm_source=feed', 'Example', 'Reposted')"
+        ))
+    return engine
+
+def test_migrations():
+    directory = tempfile.TemporaryDirectory()
+    engine = create_old_database(os.path.join(directory.name, "old.db"))
+
+    try:
+        print("\nTest 1: Planning additive changes...")
+        planned = [description for description, _ in plan_migrations(engine)]
+        print(f"Planned: {planned}")
+        assert "add column job_postings.canonical_url" in planned
+        assert "add column job_postings.content_fingerprint" in planned
+        assert "create index ix_job_postings_job_posting_url" in planned
+        assert "create unique index ix_job_postings_canonical_url" in planned
+        assert "create table users" in planned
+        assert "create index ix_companies_name" in planned
+        assert "index existing skills" in planned
+        assert "canonicalize existing job posting URLs" in planned
+        assert "band existing job posting fingerprints" in planned
+        assert planned[-1] == "hash existing job_postings rows"
+        assert run_migrations(engine, dry_run=True) == planned
+        assert "canonical_url" not in {column["name"] for column in inspect(engine).get_columns("job_postings")}
+
+        print("\nTest 2: Applying them in place...")
+        assert run_migrations(engine) == planned
+        inspector = inspect(engine)
+        assert "canonical_url" in {column["name"] for column in inspector.get_columns("job_postings")}
+        assert "ix_job_postings_job_posting_url" in {index["name"] for index in inspector.get_indexes("job_postings")}
+        assert {"users", "experiences", "projects", "companies", "bullet_cache"} <= set(inspector.get_table_names())
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT job_title FROM job_postings")).scalar() == "Engineer"
+            # Rows stored before the migration are added to the full-text index
+            assert connection.execute(text(
+                "SELECT rowid FROM job_postings_fts WHERE job_postings_fts MATCH 'engineer'"
+            )).scalar() == 1
+            # Skill links are derived from the skills stored before the migration
+            assert connection.execute(text(
+                "SELECT COUNT(*) FROM job_skills WHERE job_posting_id = 1"
+            )).scalar() == 2
+            # So are the content hashes
+            assert connection.execute(text("SELECT content_hash FROM job_postings")).scalar() is not None
+            # Canonical URLs are backfilled; a repost of an already stored URL keeps it for the oldest
+            # row only, and fingerprints of old rows stay empty since their page content is unknown
+            assert connection.execute(text("SELECT canonical_url FROM job_postings ORDER BY id")).scalars().all() == [
+                "https://example.com/jobs/1", "https://example.com/jobs/2?id=7", None
+            ]
+            assert connection.execute(text(
+                "SELECT COUNT(*) FROM job_postings WHERE content_fingerprint IS NOT NULL"
+            )).scalar() == 0
+
+        print("\nTest 3: Running again changes nothing...")
+        assert plan_migrations(engine) == []
+        assert run_migrations(engine) == []
+    finally:
+        engine.dispose()
+        directory.cleanup()
+
+def test_fingerprint_band_backfill():
+    directory = tempfile.TemporaryDirectory()
+    fingerprint = compute_content_fingerprint("Backend engineer building distributed systems in Python and Go.")
+    old_metadata = MetaData()
+    Table(
+        "job_postings", old_metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("job_posting_url", String),
+        Column("canonical_url", String),
+        Column("content_fingerprint", String),
+    )
+    engine = create_database_engine(f"sqlite:///{os.path.join(directory.name, 'fingerprinted.db')}")
+    old_metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO job_postings (job_posting_url, canonical_url, content_fingerprint) "
+            f"VALUES ('https://example.com/jobs/1', 'https://example.com/jobs/1', '{fingerprint}'), "
+            "('https://example.com/jobs/2', 'https://example.com/jobs/2', NULL)"
+        ))
+
+    try:
+        print("\nTest 4: Banding fingerprints stored before the band columns...")
+        planned = run_migrations(engine)
+        assert "band existing job posting fingerprints" in planned
+        assert "create index ix_job_postings_fingerprint_band_0" in planned
+        with engine.connect() as connection:
+            rows = connection.execute(text(
+                "SELECT fingerprint_band_0, fingerprint_band_1, fingerprint_band_2, fingerprint_band_3 "
+                "FROM job_postings ORDER BY id"
+            )).all()
+        assert list(rows[0]) == list(fingerprint_bands(fingerprint).values())
+        assert list(rows[1]) == [None] * 4
+    finally:
+        engine.dispose()
+        directory.cleanup()
+
+if __name__ == "__main__":
+    print("Starting migration tests...")
+    test_migrations()
+    test_fingerprint_band_backfill()
+    print("\nAll tests completed!")
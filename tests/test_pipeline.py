@@ -0,0 +1,133 @@
+# update sys path to include the project root
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.pipeline import generate_ranked_bullets, stream_rankings
+from experiments.job_scraper import JobInfo
+
+JOB_INFO = JobInfo(
+    company_name="Tech Corp",
+    job_title="Software Engineer",
+    location="Seattle, WA",
+    job_type="Full-time",
+    description="Build backend services in Python.",
+    qualifications=["3+ years of Python"]
+)
+
+class SlowRankingAgent:
+    """Ranking stand-in whose project ranking waits until the caller has seen the experiences."""
+
+    def __init__(self):
+        self.experiences_consumed = threading.Event()
+        self.skills_seen = []
+
+    def rank_experiences(self, job_info, user_id, job_technical_skills=None):
+        self.skills_seen.append(job_technical_skills)
+        return {"ranked_experiences": [(1, "Python match")], "job_technical_skills": ["Python"], "error": ""}
+
+    def rank_projects(self, job_info, user_id, job_technical_skills=None):
+        self.skills_seen.append(job_technical_skills)
+        # Only finishes once the experience result has been consumed downstream
+        if not self.experiences_consumed.wait(timeout=5):
+            raise RuntimeError("experience ranking was not streamed before project ranking finished")
+        return {"ranked_projects": [(2, "Backend project")], "error": ""}
+
+class FailingRankingAgent:
+    def rank_experiences(self, job_info, user_id, job_technical_skills=None):
+        raise ValueError("LLM unavailable")
+
+    def rank_projects(self, job_info, user_id, job_technical_skills=None):
+        return {"ranked_projects": [], "error": ""}
+
+class QuickRankingAgent:
+    def rank_experiences(self, job_info, user_id, job_technical_skills=None):
+        return {"ranked_experiences": [(1, "Python match"), (2, "Go match"), (3, "Unused")],
+                "job_technical_skills": ["Python"], "error": ""}
+
+    def rank_projects(self, job_info, user_id, job_technical_skills=None):
+        return {"ranked_projects": [(4, "Backend project")], "error": ""}
+
+class RecordingResumeAgent:
+    """Resume agent stand-in recording each generation request."""
+
+    def __init__(self):
+        self.batch_calls = []
+        self.concurrent_calls = []
+
+    def generate_bullet_points_batch(self, items, job_info=None, fresh_variant=False,
+                                     job_technical_skills=None, item_map=None, on_item_complete=None):
+        self.batch_calls.append(items)
+        results = {f"{item['type']}_{item['id']}": {"item_id": item["id"], "bullet_points": ["Did X"]} for item in items}
+        for index, item in enumerate(items):
+            if on_item_complete:
+                on_item_complete(index, item, results[f"{item['type']}_{item['id']}"])
+        return results
+
+    def generate_bullet_points_concurrently(self, items, job_info=None, max_concurrency=4, fresh_variant=False,
+                                            job_technical_skills=None, item_map=None, on_item_complete=None):
+        self.concurrent_calls.append(items)
+        results = [{"item_id": item["id"], "bullet_points": ["Did X"]} for item in items]
+        for index, (item, result) in enumerate(zip(items, results)):
+            if on_item_complete:
+                on_item_complete(index, item, result)
+        return results
+
+def test_pipeline():
+    print("\nTest 1: Streaming experience ranking before project ranking finishes...")
+    agent = SlowRankingAgent()
+    stages = []
+    for item_type, result in stream_rankings(agent, JOB_INFO, 1):
+        stages.append((item_type, result))
+        if item_type == "experience":
+            agent.experiences_consumed.set()
+    print(f"Stages: {[item_type for item_type, _ in stages]}")
+    assert [item_type for item_type, _ in stages] == ["experience", "project"]
+    assert stages[0][1]["ranked_experiences"] == [(1, "Python match")]
+    assert stages[1][1]["ranked_projects"] == [(2, "Backend project")]
+    # Skills extracted while ranking experiences are reused for projects
+    assert agent.skills_seen == [None, ["Python"]]
+
+    print("\nTest 2: Reporting stage errors without stopping the stream...")
+    stages = list(stream_rankings(FailingRankingAgent(), JOB_INFO, 1))
+    assert [item_type for item_type, _ in stages] == ["experience", "project"]
+    assert "LLM unavailable" in stages[0][1]["error"]
+    assert not stages[1][1]["error"]
+
+def test_generate_ranked_bullets():
+    limits = {"experience": 2, "project": 2}
+
+    print("\nTest 3: Batching every selected item into one request...")
+    resume_agent = RecordingResumeAgent()
+    completed = []
+    ranked, results = generate_ranked_bullets(
+        QuickRankingAgent(), resume_agent, JOB_INFO, 1, limits,
+        on_item_complete=lambda index, item, result: completed.append(item["id"])
+    )
+    assert len(resume_agent.batch_calls) == 1 and resume_agent.concurrent_calls == []
+    # Progress is reported per item in batch mode too
+    assert completed == [1, 2, 4]
+    assert [(item["type"], item["id"]) for item in resume_agent.batch_calls[0]] == [
+        ("experience", 1), ("experience", 2), ("project", 4)
+    ]
+    assert [result["item_id"] for result in results["experience"]] == [1, 2]
+    assert [result["item_id"] for result in results["project"]] == [4]
+    assert len(ranked["experience"]) == 3
+
+    print("\nTest 4: Generating each stage as soon as it is ranked...")
+    resume_agent = RecordingResumeAgent()
+    completed = []
+    ranked, results = generate_ranked_bullets(
+        QuickRankingAgent(), resume_agent, JOB_INFO, 1, limits, batch=False,
+        on_item_complete=lambda index, item, result: completed.append(item["id"])
+    )
+    assert resume_agent.batch_calls == [] and len(resume_agent.concurrent_calls) == 2
+    assert sorted(completed) == [1, 2, 4]
+    assert [result["item_id"] for result in results["experience"]] == [1, 2]
+
+if __name__ == "__main__":
+    print("Starting pipeline tests...")
+    test_pipeline()
+    test_generate_ranked_bullets()
+    print("\nAll tests completed!")
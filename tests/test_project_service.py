@@ -100,7 +100,48 @@ def test_project_service():
         # Clean up the test database
         cleanup_test_db()
 
+def test_create_projects_bulk():
+    init_test_db()
+    user_service = UserService()
+    project_service = ProjectService()
+    
+    try:
+        created_user = user_service.create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle",
+            personality=["curious"],
+            grade="A",
+            grad_year="2024"
+        ))
+        projects = [
+            Project(
+                user_id=created_user.id,
+                project_name=f"Project {i}",
+                long_description=f"Long description {i}",
+                short_description=f"Short description {i}",
+                tech_stack=["Python"],
+                team_size=i % 5 + 1
+            )
+            for i in range(50)
+        ]
+        
+        print("\nTest 1: Bulk creating projects...")
+        ids = project_service.create_projects(projects)
+        assert len(ids) == 50
+        assert [project.project_name for project in sorted(project_service.get_projects_by_ids(ids), key=lambda row: ids.index(row.id))] == [
+            f"Project {i}" for i in range(50)
+        ]
+        assert len(project_service.get_user_projects(created_user.id)) == 50
+    finally:
+        cleanup_test_db()
+
 if __name__ == "__main__":
     print("Starting ProjectService tests...")
     test_project_service()
+    test_create_projects_bulk()
     print("\nAll tests completed!") 
\ No newline at end of file
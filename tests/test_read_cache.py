@@ -0,0 +1,186 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from model.schema import User, Experience
+from concurrent.futures import ThreadPoolExecutor
+from model.database import Base, Database, engine
+from services.read_cache import ReadCache, get_read_cache
+from services.user import UserService
+from services.experience import ExperienceService
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def _experience(user_id, company_name):
+    return Experience(
+        user_id=user_id,
+        company_name=company_name,
+        role_title="Engineer",
+        company_location="Remote",
+        start_date="2020-01",
+        end_date="2021-01",
+        long_description="Long description",
+        short_description="Short description"
+    )
+
+def test_read_cache_lru():
+    cache = ReadCache(max_size=2)
+    loads = []
+
+    def loader(key):
+        return lambda: loads.append(key) or f"value {key}"
+
+    print("\nTest 1: Reading through the cache...")
+    assert cache.get("item", 1, loader(1)) == "value 1"
+    assert cache.get("item", 1, loader(1)) == "value 1"
+    assert loads == [1]
+
+    print("\nTest 2: Evicting the least recently used entry...")
+    cache.get("item", 2, loader(2))
+    cache.get("item", 1, loader(1))
+    cache.get("item", 3, loader(3))
+    cache.get("item", 2, loader(2))
+    assert loads == [1, 2, 3, 2]
+
+    print("\nTest 3: Hit ratio...")
+    stats = cache.stats()
+    print(f"Stats: {stats}")
+    assert stats["hits"] == 2 and stats["misses"] == 4 and stats["size"] == 2
+    assert abs(stats["hit_ratio"] - 2 / 6) < 1e-9
+
+    print("\nTest 4: Disabled cache passes reads through...")
+    disabled = ReadCache(max_size=0)
+    disabled.get("item", 1, loader(1))
+    disabled.get("item", 1, loader(1))
+    assert loads[-2:] == [1, 1]
+
+    print("\nTest 5: Values loaded across an invalidation are not cached...")
+    def stale_loader():
+        # A writer commits and invalidates while this reader is still loading
+        cache.invalidate("item", 4)
+        return "stale 4"
+    assert cache.get("item", 4, stale_loader) == "stale 4"
+    assert cache.get("item", 4, loader(4)) == "value 4"
+    assert cache.get("item", 4, loader(4)) == "value 4"
+    assert loads[-1:] == [4]
+    def stale_many_loader(keys):
+        cache.invalidate_where("item", lambda value: False)
+        return [f"stale {key}" for key in keys]
+    assert cache.get_many("item", [5], stale_many_loader, key_of=lambda value: 5) == ["stale 5"]
+    assert cache.get("item", 5, loader(5)) == "value 5"
+
+    print("\nTest 6: Missing rows are not cached...")
+    misses = []
+    assert cache.get("item", 6, lambda: misses.append(6)) is None
+    assert cache.get("item", 6, lambda: misses.append(6)) is None
+    assert misses == [6, 6]
+
+def test_read_cache_services():
+    init_test_db()
+    cache = get_read_cache()
+    user_service = UserService()
+    experience_service = ExperienceService()
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    try:
+        user = user_service.create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        ids = experience_service.create_experiences([_experience(user.id, f"Company {i}") for i in range(3)])
+        cache.reset_stats()
+
+        print("\nTest 1: Hot reads skip the database...")
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            for _ in range(5):
+                user_service.get_user(user.id)
+                experience_service.get_experience(ids[0])
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        assert len(statements) == 2
+        assert cache.stats()["hits"] == 8
+
+        print("\nTest 2: Bulk reads only load missing rows...")
+        assert {row.id for row in experience_service.get_experiences_by_ids(ids)} == set(ids)
+        assert {row.id for row in experience_service.get_experiences_by_ids(ids)} == set(ids)
+
+        print("\nTest 3: Writes invalidate their entries...")
+        experience_service.update_experience(ids[0], _experience(user.id, "Renamed"))
+        assert experience_service.get_experience(ids[0]).company_name == "Renamed"
+        experience_service.delete_experience(ids[1])
+        assert experience_service.get_experience(ids[1]) is None
+        assert user_service.purge_user(user.id)["experiences"] == 2
+        assert experience_service.get_experience(ids[2]) is None
+        assert user_service.get_user(user.id) is None
+
+        print("\nTest 4: Readers during a purge cannot re-cache deleted rows...")
+        other_user = user_service.create_user(User(
+            name="John Doe",
+            email="john@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        other_id, = experience_service.create_experiences([_experience(other_user.id, "Company")])
+        with Database.get_instance().session_scope():
+            user_service.purge_user(other_user.id)
+            # Another thread still sees the committed rows until this scope commits
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(experience_service.get_experience, other_id).result() is not None
+                assert executor.submit(user_service.get_user, other_user.id).result() is not None
+        assert experience_service.get_experience(other_id) is None
+        assert user_service.get_user(other_user.id) is None
+
+        print("\nTest 5: Single-row writes join the caller's unit of work...")
+        third_user = user_service.create_user(User(
+            name="Ann Doe",
+            email="ann@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        kept_id, = experience_service.create_experiences([_experience(third_user.id, "Kept")])
+        assert experience_service.get_experience(kept_id).company_name == "Kept"
+        try:
+            with Database.get_instance().session_scope():
+                experience_service.update_experience(kept_id, _experience(third_user.id, "Renamed"))
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    assert executor.submit(experience_service.get_experience, kept_id).result().company_name == "Kept"
+                raise RuntimeError("abort the outer unit of work")
+        except RuntimeError:
+            pass
+        # The update rolled back with the outer scope, and the cached row is still current
+        assert experience_service.get_experience(kept_id).company_name == "Kept"
+        with Database.get_instance().session_scope():
+            assert experience_service.delete_experience(kept_id)
+        assert experience_service.get_experience(kept_id) is None
+    finally:
+        cleanup_test_db()
+    assert cache.stats()["size"] == 0
+
+if __name__ == "__main__":
+    print("Starting read cache tests...")
+    test_read_cache_lru()
+    test_read_cache_services()
+    print("\nAll tests completed!")
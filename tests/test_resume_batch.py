@@ -0,0 +1,116 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+from langchain_core.runnables import RunnableLambda
+from model.schema import User, Experience, Project
+from model.database import Base, engine
+from services.user import UserService
+from services.experience import ExperienceService
+from services.project import ProjectService
+from agents.resume_agent import ResumeAgent
+from experiments.job_scraper import JobInfo
+
+JOB_INFO = JobInfo(
+    company_name="Tech Corp",
+    job_title="Software Engineer",
+    location="Seattle, WA",
+    job_type="Full-time",
+    description="Build backend services in Python.",
+    qualifications=["3+ years of Python"]
+)
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def test_batch_progress():
+    init_test_db()
+    requests = []
+
+    def respond(prompt):
+        requests.append(prompt)
+        return json.dumps({
+            f"experience_{experience.id}": [
+                "Built Python services handling 1M requests per day by redesigning the API layer",
+                "Cut deployment time by 40% by automating releases with CI pipelines",
+                "Reduced on-call pages by 30% by adding service health checks",
+            ],
+            f"project_{project.id}": [
+                "Generated tailored resumes in seconds by ranking items with an LLM",
+                "Cut LaTeX build failures by 90% by escaping special characters",
+            ],
+        })
+
+    try:
+        user = UserService().create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="State University",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        experience = ExperienceService().create_experience(Experience(
+            user_id=user.id,
+            company_name="Tech Co",
+            role_title="Software Engineer",
+            company_location="Remote",
+            start_date="2020-01",
+            end_date="2021-02",
+            long_description="Built backend services in Python",
+            short_description="Backend engineer",
+            tech_stack=["Python"]
+        ))
+        project = ProjectService().create_project(Project(
+            user_id=user.id,
+            project_name="Resume AI",
+            long_description="LLM resume generator",
+            short_description="Resume generator",
+            tech_stack=["Python", "LaTeX"]
+        ))
+        items = [
+            {"id": experience.id, "type": "experience", "ranking_reason": "Python backend"},
+            {"id": project.id, "type": "project", "ranking_reason": "Python tooling"},
+        ]
+        agent = ResumeAgent(candidate_count=1)
+        agent._llm = RunnableLambda(respond)
+
+        print("\nTest 1: Reporting each item resolved from the batch response...")
+        completed = []
+        results = agent.generate_bullet_points_batch(
+            items, job_info=JOB_INFO,
+            on_item_complete=lambda index, item, result: completed.append((index, item["type"], result["from_cache"]))
+        )
+        assert len(requests) == 1
+        assert completed == [(0, "experience", False), (1, "project", False)]
+        assert len(results[f"experience_{experience.id}"]["bullet_points"]) == 3
+
+        print("\nTest 2: Reporting cached items without a request...")
+        completed = []
+        agent.generate_bullet_points_batch(
+            items, job_info=JOB_INFO,
+            on_item_complete=lambda index, item, result: completed.append((index, item["type"], result["from_cache"]))
+        )
+        assert len(requests) == 1
+        assert completed == [(0, "experience", True), (1, "project", True)]
+
+        print("\nTest 3: A different bullet count is not served from the cache...")
+        results = agent.generate_bullet_points_batch([{**items[0], "num_bullets": 2}], job_info=JOB_INFO)
+        assert len(requests) == 2
+        assert not results[f"experience_{experience.id}"]["from_cache"]
+        assert len(results[f"experience_{experience.id}"]["bullet_points"]) == 2
+    finally:
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting batch generation tests...")
+    test_batch_progress()
+    print("\nAll tests completed!")
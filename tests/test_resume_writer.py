@@ -0,0 +1,95 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from model.schema import User, Experience, Project
+from model.database import Base, engine
+from services.user import UserService
+from services.experience import ExperienceService
+from services.project import ProjectService
+from services.resume_writer import ResumeWriter
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "template", "jake_resume.tex")
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def test_resume_writer():
+    init_test_db()
+    directory = tempfile.TemporaryDirectory()
+    resume_writer = ResumeWriter(TEMPLATE_PATH)
+
+    try:
+        user = UserService().create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="State University",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle",
+            grad_year="2020"
+        ))
+        experience = ExperienceService().create_experience(Experience(
+            user_id=user.id,
+            company_name="Tech & Co",
+            role_title="Software Engineer",
+            company_location="Remote",
+            start_date="2020-01",
+            end_date="2021-02",
+            long_description="Long description",
+            short_description="Short description",
+            tech_stack=["Python"]
+        ))
+        project = ProjectService().create_project(Project(
+            user_id=user.id,
+            project_name="Resume AI",
+            start_date="2020-01",
+            end_date="2020-05",
+            long_description="Long description",
+            short_description="Short description",
+            tech_stack=["Python", "SQLite"]
+        ))
+        exp = [(experience.id, ["Cut latency by 50%"])]
+        proj = [(project.id, ["Built a LaTeX renderer"])]
+
+        print("\nTest 1: Rendering without touching disk...")
+        content = resume_writer.render_resume(user.id, exp, proj)
+        assert content.endswith("\\end{document}")
+        assert content.count("\\begin{document}") == 1
+        assert "{Tech \\& Co}{Remote}" in content
+        assert "\\resumeItem{Cut latency by 50\\%}" in content
+        assert content.index("\\section{Experience}") < content.index("\\section{Projects}")
+        assert os.listdir(directory.name) == []
+
+        print("\nTest 2: Writing the rendered resume in one go...")
+        file_path = os.path.join(directory.name, "resume.tex")
+        resume_writer.write_resume(user.id, file_path, exp, proj)
+        with open(file_path, "r") as file:
+            assert file.read() == content
+        assert os.listdir(directory.name) == ["resume.tex"]
+
+        print("\nTest 3: A failed render leaves the previous file intact...")
+        try:
+            resume_writer.write_resume(user.id, file_path, exp + [(999, ["Missing"])], proj)
+            assert False, "rendering a missing experience should fail"
+        except AttributeError:
+            pass
+        with open(file_path, "r") as file:
+            assert file.read() == content
+        assert os.listdir(directory.name) == ["resume.tex"]
+    finally:
+        directory.cleanup()
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting resume writer tests...")
+    test_resume_writer()
+    print("\nAll tests completed!")
@@ -0,0 +1,153 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.schema import User, Experience, ExperienceDB, Project, ProjectDB, JobPosting, JobPostingDB
+from model.database import Base, Database, engine
+import warnings
+from sqlalchemy import JSON, select
+from sqlalchemy.dialects import postgresql
+from model.search import FTS_COLUMNS, build_match_query, like_condition
+from services.user import UserService
+from services.experience import ExperienceService
+from services.project import ProjectService
+from services.job_posting import JobPostingService
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def _experience(user_id, company_name, description, tech_stack):
+    return Experience(
+        user_id=user_id,
+        company_name=company_name,
+        role_title="Software Engineer",
+        company_location="Remote",
+        start_date="2020-01",
+        end_date="2021-01",
+        long_description=description,
+        short_description=description[:40],
+        tech_stack=tech_stack
+    )
+
+def _job_posting(number, title, skills):
+    return JobPosting(
+        job_posting_url=f"https://jobs.example.com/{number}",
+        company_name=f"Company {number}",
+        job_title=title,
+        job_location="Remote",
+        job_type="Full-time",
+        job_description=f"{title} working with {', '.join(skills)}.",
+        job_qualifications=["BS in Computer Science"],
+        job_technical_skills=skills
+    )
+
+def test_search():
+    init_test_db()
+    user_service = UserService()
+    experience_service = ExperienceService()
+    project_service = ProjectService()
+    job_posting_service = JobPostingService()
+
+    try:
+        user = user_service.create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        other_user = user_service.create_user(User(
+            name="John Doe",
+            email="john@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        kafka_id, gpu_id = experience_service.create_experiences([
+            _experience(user.id, "Streamly", "Built Kafka pipelines for real-time analytics", ["Java", "Kafka"]),
+            _experience(user.id, "Tensor Labs", "Optimized CUDA kernels for model training", ["C++", "CUDA"]),
+        ])
+        experience_service.create_experience(
+            _experience(other_user.id, "Other Co", "Maintained Kafka clusters", ["Kafka"])
+        )
+
+        print("\nTest 1: Building match queries...")
+        assert build_match_query("Kafka, real-time!") == '"kafka" "real" "time"'
+        assert build_match_query("Go Rust", match_any=True) == '"go" OR "rust"'
+        assert build_match_query("  ") == ""
+
+        print("\nTest 2: Searching experiences...")
+        assert [row.id for row in experience_service.search_experiences("kafka", user_id=user.id)] == [kafka_id]
+        assert len(experience_service.search_experiences("kafka")) == 2
+        assert [row.id for row in experience_service.search_experiences("cuda")] == [gpu_id]
+        assert experience_service.search_experiences("kafka cuda", user_id=user.id) == []
+        assert len(experience_service.search_experiences("kafka cuda", user_id=user.id, match_any=True)) == 2
+
+        print("\nTest 3: Keeping the index in sync with writes...")
+        experience_service.update_experience(
+            gpu_id, _experience(user.id, "Tensor Labs", "Wrote Triton kernels", ["Python", "Triton"])
+        )
+        assert experience_service.search_experiences("cuda") == []
+        assert [row.id for row in experience_service.search_experiences("triton")] == [gpu_id]
+        experience_service.delete_user_experiences(other_user.id)
+        assert [row.id for row in experience_service.search_experiences("kafka")] == [kafka_id]
+
+        print("\nTest 4: Searching projects...")
+        project = project_service.create_project(Project(
+            user_id=user.id,
+            project_name="Resume AI",
+            long_description="LangGraph agents that tailor resumes",
+            short_description="Resume generator",
+            tech_stack=["Python", "SQLite"]
+        ))
+        assert [row.id for row in project_service.search_projects("sqlite resume", user_id=user.id)] == [project.id]
+
+        print("\nTest 5: Searching job postings and finding similar ones...")
+        postings = job_posting_service.create_job_postings([
+            _job_posting(1, "Backend Engineer", ["Python", "PostgreSQL", "Kafka"]),
+            _job_posting(2, "Data Engineer", ["Python", "Kafka", "Spark"]),
+            _job_posting(3, "iOS Engineer", ["Swift"]),
+        ])
+        assert [row.id for row in job_posting_service.search_job_postings("spark")] == [postings[1].id]
+        similar = job_posting_service.find_similar_job_postings(postings[0].id)
+        print(f"Similar postings: {[row.job_title for row in similar]}")
+        assert similar[0].id == postings[1].id
+        assert postings[0].id not in [row.id for row in similar]
+
+        print("\nTest 6: LIKE fallback matches JSON columns too...")
+        with Database.get_instance() as session:
+            ids = session.scalars(select(ExperienceDB.id).where(like_condition(ExperienceDB, "triton python"))).all()
+        assert ids == [gpu_id]
+    finally:
+        cleanup_test_db()
+
+def test_like_fallback_compiles_for_postgresql():
+    print("\nCompiling the LIKE fallback for PostgreSQL...")
+    with warnings.catch_warnings():
+        # SQLAlchemy warns when LIKE is applied to a JSON column
+        warnings.simplefilter("error")
+        for model in (ExperienceDB, ProjectDB, JobPostingDB):
+            sql = str(select(model.id).where(like_condition(model, "kafka go", match_any=True)).compile(
+                dialect=postgresql.dialect()
+            ))
+            for column in FTS_COLUMNS[model.__tablename__]:
+                if isinstance(getattr(model, column).type, JSON):
+                    assert f"CAST({model.__tablename__}.{column} AS VARCHAR) ILIKE" in sql
+                else:
+                    assert f"{model.__tablename__}.{column} ILIKE" in sql
+
+if __name__ == "__main__":
+    print("Starting search tests...")
+    test_search()
+    test_like_fallback_compiles_for_postgresql()
+    print("\nAll tests completed!")
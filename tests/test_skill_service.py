@@ -0,0 +1,150 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, func, select
+from model.schema import User, Experience, Project, JobPosting, ItemSkillDB, JobSkillDB
+from model.database import Base, Database, engine
+from services.user import UserService
+from services.experience import ExperienceService
+from services.project import ProjectService
+from services.job_posting import JobPostingService
+from services.skill import SkillService
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def _experience(user_id, company_name, tech_stack):
+    return Experience(
+        user_id=user_id,
+        company_name=company_name,
+        role_title="Software Engineer",
+        company_location="Remote",
+        start_date="2020-01",
+        end_date="2021-01",
+        long_description="Long description",
+        short_description="Short description",
+        tech_stack=tech_stack
+    )
+
+def _job_posting(number, skills):
+    return JobPosting(
+        job_posting_url=f"https://jobs.example.com/{number}",
+        company_name=f"Company {number}",
+        job_title="Engineer",
+        job_location="Remote",
+        job_type="Full-time",
+        job_description="Description",
+        job_qualifications=["BS in Computer Science"],
+        job_technical_skills=skills
+    )
+
+def _count(model):
+    with Database.get_instance() as session:
+        return session.scalar(select(func.count()).select_from(model))
+
+def test_skill_service():
+    init_test_db()
+    user_service = UserService()
+    experience_service = ExperienceService()
+    project_service = ProjectService()
+    job_posting_service = JobPostingService()
+    skill_service = SkillService()
+
+    try:
+        user = user_service.create_user(User(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        other_user = user_service.create_user(User(
+            name="John Doe",
+            email="john@example.com",
+            phone="1234567890",
+            education="Bachelor's",
+            degree="BS",
+            major="Computer Science",
+            location="Seattle"
+        ))
+        gpu_id, web_id = experience_service.create_experiences([
+            _experience(user.id, "Tensor Labs", ["C++", "CUDA", "Python"]),
+            _experience(user.id, "Webby", ["TypeScript", "React", "python "]),
+        ])
+        other_experience = experience_service.create_experience(_experience(other_user.id, "Other Co", ["cuda"]))
+        project = project_service.create_project(Project(
+            user_id=user.id,
+            project_name="Resume AI",
+            long_description="Long description",
+            short_description="Short description",
+            tech_stack=["Python", "SQLite", "Go"]
+        ))
+        backend, frontend, mobile = job_posting_service.create_job_postings([
+            _job_posting(1, ["Python", "Go", "Kubernetes"]),
+            _job_posting(2, ["React", "TypeScript", "Python"]),
+            _job_posting(3, ["Swift"]),
+        ])
+
+        print("\nTest 1: Skills are normalized and linked on write...")
+        names = {skill.name: skill.display_name for skill in skill_service.get_all_skills()}
+        assert names["python"] == "Python" and names["cuda"] == "CUDA"
+        assert len(names) == 9
+        assert _count(ItemSkillDB) == 10
+        assert _count(JobSkillDB) == 7
+
+        print("\nTest 2: Finding items and postings by skill...")
+        assert [row.id for row in skill_service.find_experiences_with_skill("cuda")] == [gpu_id, other_experience.id]
+        assert [row.id for row in skill_service.find_experiences_with_skill("CUDA", user_id=user.id)] == [gpu_id]
+        assert [row.id for row in skill_service.find_projects_with_skill("go")] == [project.id]
+        assert [row.id for row in skill_service.find_job_postings_with_skill("Python")] == [backend.id, frontend.id]
+        assert skill_service.find_job_postings_with_skill("Rust") == []
+
+        print("\nTest 3: Overlaps between a user and a job in one query...")
+        statements = []
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            overlaps = skill_service.get_item_skill_overlaps(user.id, frontend.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        assert len(statements) == 1
+        assert overlaps == [("experience", web_id, 3), ("experience", gpu_id, 1), ("project", project.id, 1)]
+        assert skill_service.get_matching_skills(user.id, backend.id) == ["Go", "Python"]
+        assert skill_service.get_missing_skills(user.id, backend.id) == ["Kubernetes"]
+        matches = skill_service.find_matching_job_postings(user.id)
+        assert [(posting.id, overlap) for posting, overlap in matches] == [(frontend.id, 3), (backend.id, 2)]
+        assert mobile.id not in [posting.id for posting, _ in matches]
+
+        print("\nTest 4: Keeping links in sync with updates and deletes...")
+        experience_service.update_experience(gpu_id, _experience(user.id, "Tensor Labs", ["Triton"]))
+        assert skill_service.find_experiences_with_skill("cuda", user_id=user.id) == []
+        assert [row.id for row in skill_service.find_experiences_with_skill("triton")] == [gpu_id]
+        experience_service.delete_experience(web_id)
+        assert skill_service.find_experiences_with_skill("react") == []
+        user_service.purge_user(other_user.id)
+        assert skill_service.find_experiences_with_skill("cuda") == []
+
+        print("\nTest 5: Rebuilding the index from stored tech stacks...")
+        with Database.get_instance().session_scope() as session:
+            session.execute(ItemSkillDB.__table__.delete())
+            session.execute(JobSkillDB.__table__.delete())
+        assert skill_service.rebuild_skill_index() == {"experiences": 1, "projects": 1, "job_postings": 3}
+        assert [row.id for row in skill_service.find_projects_with_skill("sqlite")] == [project.id]
+        assert [row.id for row in skill_service.find_job_postings_with_skill("swift")] == [mobile.id]
+    finally:
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting skill service tests...")
+    test_skill_service()
+    print("\nAll tests completed!")
@@ -0,0 +1,73 @@
+# update sys path to include the project root
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert
+from model.schema import CompanyDB, JobPostingDB
+from model.database import Base, engine
+from services.company import CompanyService
+from services.job_posting import JobPostingService
+
+NUM_POSTINGS = 2500
+
+def init_test_db():
+    """Initialize the test database"""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(insert(JobPostingDB), [
+            {
+                "job_posting_url": f"https://jobs.example.com/{i}",
+                "canonical_url": f"https://jobs.example.com/{i}",
+                "company_name": f"Company {i % 10}",
+                "job_title": f"Engineer {i}",
+                "job_description": "A long description. " * 50,
+            }
+            for i in range(NUM_POSTINGS)
+        ])
+        connection.execute(insert(CompanyDB), [{"name": f"Company {i}"} for i in range(10)])
+
+def cleanup_test_db():
+    """Clean up the test database"""
+    Base.metadata.drop_all(bind=engine)
+
+def test_streaming():
+    init_test_db()
+    job_posting_service = JobPostingService()
+    company_service = CompanyService()
+
+    try:
+        print("\nTest 1: Streaming projected columns...")
+        rows = list(job_posting_service.iter_job_postings(columns=["job_title"], batch_size=100))
+        assert len(rows) == NUM_POSTINGS
+        assert [row.id for row in rows] == sorted(row.id for row in rows)
+        assert rows[0].job_title == "Engineer 0"
+        # Only the requested columns (and the id) are read
+        assert rows[0]._fields == ("id", "job_title")
+
+        print("\nTest 2: Streaming whole rows...")
+        count = 0
+        for job_posting in job_posting_service.iter_job_postings(batch_size=500):
+            assert isinstance(job_posting, JobPostingDB)
+            count += 1
+        assert count == NUM_POSTINGS
+
+        print("\nTest 3: Keyset pagination...")
+        first_page = job_posting_service.get_job_postings_page(limit=1000, columns=["company_name"])
+        second_page = job_posting_service.get_job_postings_page(after_id=first_page[-1].id, limit=1000)
+        assert len(first_page) == len(second_page) == 1000
+        assert second_page[0].id == first_page[-1].id + 1
+        pages = list(job_posting_service.iter_job_posting_pages(page_size=1000, columns=["job_title"]))
+        assert [len(page) for page in pages] == [1000, 1000, 500]
+
+        print("\nTest 4: Companies...")
+        assert [row.name for row in company_service.iter_companies(columns=["name"])] == [f"Company {i}" for i in range(10)]
+        page = company_service.get_companies_page(after_id=5, limit=3)
+        assert [company.id for company in page] == [6, 7, 8]
+    finally:
+        cleanup_test_db()
+
+if __name__ == "__main__":
+    print("Starting streaming tests...")
+    test_streaming()
+    print("\nAll tests completed!")
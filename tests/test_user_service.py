@@ -3,9 +3,13 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from model.schema import User
+from model.schema import User, Experience, Project
 from services.user import UserService
+from services.experience import ExperienceService
+from services.project import ProjectService
 from model.database import Database, Base, engine
+from sqlalchemy import event, inspect
+from services.item_map import item_key, profile_item_map
 
 def init_test_db():
     """Initialize the test database"""
@@ -87,7 +91,105 @@ def test_user_service():
         # Clean up the test database
         cleanup_test_db()
 
+def _create_profile(user_service, email):
+    user = user_service.create_user(User(
+        name="Jane Doe",
+        email=email,
+        phone="1234567890",
+        education="Bachelor's",
+        degree="BS",
+        major="Computer Science",
+        location="Seattle"
+    ))
+    ExperienceService().create_experiences([
+        Experience(
+            user_id=user.id,
+            company_name=f"Company {i}",
+            role_title="Engineer",
+            company_location="Remote",
+            start_date="2020-01",
+            end_date="2021-01",
+            long_description="Long description",
+            short_description="Short description"
+        )
+        for i in range(20)
+    ])
+    ProjectService().create_projects([
+        Project(
+            user_id=user.id,
+            project_name=f"Project {i}",
+            long_description="Long description",
+            short_description="Short description"
+        )
+        for i in range(5)
+    ])
+    return user
+
+def test_purge_user():
+    init_test_db()
+    user_service = UserService()
+    experience_service = ExperienceService()
+    project_service = ProjectService()
+    
+    try:
+        user = _create_profile(user_service, "jane@example.com")
+        other_user = _create_profile(user_service, "other@example.com")
+        
+        print("\nTest 1: Deleting a user's experiences and projects...")
+        assert experience_service.count_user_experiences(user.id) == 20
+        assert experience_service.delete_user_experiences(user.id) == 20
+        assert project_service.delete_user_projects(user.id) == 5
+        assert experience_service.count_user_experiences(user.id) == 0
+        assert project_service.count_user_projects(user.id) == 0
+        assert experience_service.delete_user_experiences(user.id) == 0
+        
+        print("\nTest 2: Purging a user...")
+        counts = user_service.purge_user(other_user.id)
+        print(f"Purged: {counts}")
+        assert counts == {"experiences": 20, "projects": 5, "users": 1}
+        assert user_service.get_user(other_user.id) is None
+        assert experience_service.get_user_experiences(other_user.id) == []
+        assert user_service.get_user(user.id) is not None
+    finally:
+        cleanup_test_db()
+
+def test_get_user_profile():
+    init_test_db()
+    user_service = UserService()
+    statements = []
+    
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    try:
+        user = _create_profile(user_service, "jane@example.com")
+        
+        print("\nTest 1: Loading a profile snapshot...")
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            profile = user_service.get_user_profile(user.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        print(f"Profile loaded with {len(statements)} queries")
+        # One query for the user and one per collection, however many items there are
+        assert len(statements) == 3
+        assert inspect(profile).detached
+        
+        print("\nTest 2: Reading the snapshot without a session...")
+        assert profile.name == "Jane Doe"
+        assert len(profile.experiences) == 20
+        assert len(profile.projects) == 5
+        item_map = profile_item_map(profile)
+        assert item_map[item_key("project", profile.projects[0].id)].project_name == profile.projects[0].project_name
+        
+        print("\nTest 3: Missing users...")
+        assert user_service.get_user_profile(user.id + 100) is None
+    finally:
+        cleanup_test_db()
+
 if __name__ == "__main__":
     print("Starting UserService tests...")
     test_user_service()
+    test_purge_user()
+    test_get_user_profile()
     print("\nAll tests completed!") 
\ No newline at end of file